@@ -44,6 +44,34 @@ options:
     ini:
       - key: fact_caching_timeout
         section: defaults
+  _keyset_shards:
+    description:
+      - Number of memcached entries the index of cached keys is split into.
+      - Every change to the index rewrites the entry holding the changed key, so with many cached hosts a higher number
+        keeps the cost of storing a host low.
+      - Hosts cached with a different number of shards are not found anymore after changing this option.
+      - Must be at least V(1).
+    type: integer
+    default: 1
+    env:
+      - name: ANSIBLE_CACHE_MEMCACHED_KEYSET_SHARDS
+    ini:
+      - key: fact_caching_memcached_keyset_shards
+        section: defaults
+    version_added: 13.3.0
+  _prefetch:
+    description:
+      - Load all cached hosts with batched C(get_multi) calls on the first lookup, instead of fetching every host with
+        its own C(get) call.
+      - This is useful when most of the cached hosts are used by a play, and wasteful otherwise.
+    type: bool
+    default: false
+    env:
+      - name: ANSIBLE_CACHE_MEMCACHED_PREFETCH
+    ini:
+      - key: fact_caching_memcached_prefetch
+        section: defaults
+    version_added: 13.3.0
 """
 
 import collections
@@ -52,6 +80,7 @@ import time
 from collections.abc import MutableSet
 from itertools import chain
 from multiprocessing import Lock
+from zlib import crc32
 
 from ansible.errors import AnsibleError
 from ansible.plugins.cache import BaseCacheModule
@@ -140,40 +169,64 @@ class CacheModuleKeys(MutableSet):
     """
     A set subclass that keeps track of insertion time and persists
     the set in memcached.
+
+    The set is split into shards stored under separate memcached keys,
+    so that a change only rewrites the shard of the changed key.
     """
 
     PREFIX = "ansible_cache_keys"
 
-    def __init__(self, cache, *args, **kwargs):
+    def __init__(self, cache, shards=1):
         self._cache = cache
-        self._keyset = dict(*args, **kwargs)
+        self._shards = shards
+        names = [self._shard_name(index) for index in range(shards)]
+        stored = cache.get_multi(names) or {}
+        self._keysets = [dict(stored.get(name) or {}) for name in names]
+
+    def _shard_name(self, index):
+        # a single shard keeps the key name used before sharding was introduced
+        return self.PREFIX if self._shards == 1 else f"{self.PREFIX}_{index}"
+
+    def _shard_index(self, key):
+        return crc32(key.encode("utf-8")) % self._shards
+
+    def _persist(self, indexes):
+        self._cache.set_multi({self._shard_name(index): self._keysets[index] for index in indexes})
 
     def __contains__(self, key):
-        return key in self._keyset
+        return key in self._keysets[self._shard_index(key)]
 
     def __iter__(self):
-        return iter(self._keyset)
+        return chain.from_iterable(self._keysets)
 
     def __len__(self):
-        return len(self._keyset)
+        return sum(len(keyset) for keyset in self._keysets)
 
     def add(self, value):
-        self._keyset[value] = time.time()
-        self._cache.set(self.PREFIX, self._keyset)
+        index = self._shard_index(value)
+        self._keysets[index][value] = time.time()
+        self._persist([index])
 
     def discard(self, value):
-        del self._keyset[value]
-        self._cache.set(self.PREFIX, self._keyset)
+        index = self._shard_index(value)
+        del self._keysets[index][value]
+        self._persist([index])
 
     def remove_by_timerange(self, s_min, s_max):
-        for k in list(self._keyset.keys()):
-            t = self._keyset[k]
-            if s_min < t < s_max:
-                del self._keyset[k]
-        self._cache.set(self.PREFIX, self._keyset)
+        changed = set()
+        for index, keyset in enumerate(self._keysets):
+            for k in list(keyset.keys()):
+                t = keyset[k]
+                if s_min < t < s_max:
+                    del keyset[k]
+                    changed.add(index)
+        if changed:
+            self._persist(sorted(changed))
 
 
 class CacheModule(BaseCacheModule):
+    _prefetch_batch_size = 1000
+
     def __init__(self, *args, **kwargs):
         connection = ["127.0.0.1:11211"]
 
@@ -182,13 +235,18 @@ class CacheModule(BaseCacheModule):
             connection = self.get_option("_uri")
         self._timeout = self.get_option("_timeout")
         self._prefix = self.get_option("_prefix")
+        self._prefetch = self.get_option("_prefetch")
+        self._prefetched = False
+        keyset_shards = self.get_option("_keyset_shards")
+        if keyset_shards < 1:
+            raise AnsibleError(f"The number of keyset shards must be at least 1, not {keyset_shards}")
 
         if not HAS_MEMCACHE:
             raise AnsibleError("python-memcached is required for the memcached fact cache")
 
         self._cache = {}
         self._db = ProxyClientPool(connection, debug=0)
-        self._keys = CacheModuleKeys(self._db, self._db.get(CacheModuleKeys.PREFIX) or [])
+        self._keys = CacheModuleKeys(self._db, keyset_shards)
 
     def _make_key(self, key):
         return f"{self._prefix}{key}"
@@ -198,7 +256,22 @@ class CacheModule(BaseCacheModule):
             expiry_age = time.time() - self._timeout
             self._keys.remove_by_timerange(0, expiry_age)
 
+    def _prefetch_all(self):
+        if self._prefetched:
+            return
+        self._prefetched = True
+
+        keys = self.keys()
+        for start in range(0, len(keys), self._prefetch_batch_size):
+            batch = keys[start : start + self._prefetch_batch_size]
+            values = self._db.get_multi(batch, key_prefix=self._prefix) or {}
+            for key, value in values.items():
+                self._cache.setdefault(key, value)
+
     def get(self, key):
+        if self._prefetch:
+            self._prefetch_all()
+
         if key not in self._cache:
             value = self._db.get(self._make_key(key))
             # guard against the key not being removed from the keyset;
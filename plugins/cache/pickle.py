@@ -40,12 +40,58 @@ options:
       - key: fact_caching_timeout
         section: defaults
     type: float
+  _compression:
+    description:
+      - Compression to apply to the cache files.
+      - Compressed files are smaller and, for hosts with large fact sets, often faster to read from slow or networked
+        filesystems, at the cost of some CPU time on the controller.
+      - Files are always read according to their content, so changing this option does not invalidate existing cache files.
+      - V(zstd) requires Python 3.14 or newer on the controller.
+    type: string
+    choices: [none, gzip, bz2, lzma, zstd]
+    default: none
+    env:
+      - name: ANSIBLE_CACHE_PICKLE_COMPRESSION
+    ini:
+      - key: fact_caching_pickle_compression
+        section: defaults
+    version_added: 13.3.0
 """
 
+import bz2
+import gzip
+import lzma
 import pickle
 
+from ansible.errors import AnsibleError
 from ansible.plugins.cache import BaseFileCacheModule
 
+try:
+    from compression import zstd
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+
+# Magic numbers used to recognize compressed cache files when reading them
+_MAGIC = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+if HAS_ZSTD:
+    _MAGIC += ((b"\x28\xb5\x2f\xfd", zstd.open),)
+
+_OPENERS = {
+    "none": open,
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "lzma": lzma.open,
+}
+if HAS_ZSTD:
+    _OPENERS["zstd"] = zstd.open
+
 
 class CacheModule(BaseFileCacheModule):
     """
@@ -54,12 +100,23 @@ class CacheModule(BaseFileCacheModule):
 
     _persistent = False  # prevent unnecessary JSON serialization and key munging
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        compression = self.get_option("_compression")
+        if compression not in _OPENERS:
+            raise AnsibleError(
+                f"The {compression!r} compression of the pickle cache plugin requires Python 3.14 or newer."
+            )
+        self._opener = _OPENERS[compression]
+
     def _load(self, filepath):
         # Pickle is a binary format
         with open(filepath, "rb") as f:
+            head = f.read(6)
+        opener = next((opener for magic, opener in _MAGIC if head.startswith(magic)), open)
+        with opener(filepath, "rb") as f:
             return pickle.load(f, encoding="bytes")
 
     def _dump(self, value, filepath):
-        with open(filepath, "wb") as f:
-            # Use pickle protocol 2 which is compatible with Python 2.3+.
-            pickle.dump(value, f, protocol=2)
+        with self._opener(filepath, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -64,6 +64,43 @@ options:
     ini:
       - key: fact_caching_timeout
         section: defaults
+  _expire_interval:
+    description:
+      - Minimum number of seconds between two removals of expired keys from the keyset.
+      - By default expired keys are removed before every key listing and lookup, which costs one round trip each time.
+        A higher value trades some precision in expiry for fewer round trips when many hosts are looked up.
+    type: float
+    default: 0
+    env:
+      - name: ANSIBLE_CACHE_REDIS_EXPIRE_INTERVAL
+    ini:
+      - key: fact_caching_redis_expire_interval
+        section: defaults
+    version_added: 13.3.0
+  _prefetch:
+    description:
+      - Load all cached hosts with batched C(MGET) calls on the first lookup, instead of fetching every host with its own
+        C(GET) call.
+      - This is useful when most of the cached hosts are used by a play, and wasteful otherwise.
+    type: bool
+    default: false
+    env:
+      - name: ANSIBLE_CACHE_REDIS_PREFETCH
+    ini:
+      - key: fact_caching_redis_prefetch
+        section: defaults
+    version_added: 13.3.0
+  _max_connections:
+    description:
+      - Maximum number of connections kept in the Redis connection pool.
+      - By default the pool size is not limited.
+    type: integer
+    env:
+      - name: ANSIBLE_CACHE_REDIS_MAX_CONNECTIONS
+    ini:
+      - key: fact_caching_redis_max_connections
+        section: defaults
+    version_added: 13.3.0
 """
 
 import json
@@ -71,6 +108,7 @@ import re
 import time
 
 from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_text
 from ansible.parsing.ajson import AnsibleJSONDecoder, AnsibleJSONEncoder
 from ansible.plugins.cache import BaseCacheModule
 from ansible.utils.display import Display
@@ -96,6 +134,7 @@ class CacheModule(BaseCacheModule):
     """
 
     _sentinel_service_name = None
+    _prefetch_batch_size = 1000
     re_url_conn = re.compile(r"^([^:]+|\[[^]]+\]):(\d+):(\d+)(?::(.*))?$")
     re_sent_conn = re.compile(r"^(.*):(\d+)$")
 
@@ -109,6 +148,10 @@ class CacheModule(BaseCacheModule):
         self._prefix = self.get_option("_prefix")
         self._keys_set = self.get_option("_keyset_name")
         self._sentinel_service_name = self.get_option("_sentinel_service_name")
+        self._expire_interval = float(self.get_option("_expire_interval"))
+        self._prefetch = self.get_option("_prefetch")
+        self._last_expiry = None
+        self._prefetched = False
 
         if not HAS_REDIS:
             raise AnsibleError(
@@ -118,6 +161,9 @@ class CacheModule(BaseCacheModule):
         self._cache = {}
         kw = {}
 
+        if self.get_option("_max_connections"):
+            kw["max_connections"] = self.get_option("_max_connections")
+
         # tls connection
         tlsprefix = "tls://"
         if uri.startswith(tlsprefix):
@@ -177,7 +223,27 @@ class CacheModule(BaseCacheModule):
     def _make_key(self, key):
         return self._prefix + key
 
+    @staticmethod
+    def _decode(value):
+        return json.loads(value, cls=AnsibleJSONDecoder)
+
+    def _prefetch_all(self):
+        if self._prefetched:
+            return
+        self._prefetched = True
+
+        keys = self.keys()
+        for start in range(0, len(keys), self._prefetch_batch_size):
+            batch = keys[start : start + self._prefetch_batch_size]
+            values = self._db.mget([self._make_key(key) for key in batch])
+            for key, value in zip(batch, values):
+                if value is not None:
+                    self._cache.setdefault(key, self._decode(value))
+
     def get(self, key):
+        if self._prefetch:
+            self._prefetch_all()
+
         if key not in self._cache:
             value = self._db.get(self._make_key(key))
             # guard against the key not being removed from the zset;
@@ -186,41 +252,56 @@ class CacheModule(BaseCacheModule):
             if value is None:
                 self.delete(key)
                 raise KeyError
-            self._cache[key] = json.loads(value, cls=AnsibleJSONDecoder)
+            self._cache[key] = self._decode(value)
 
         return self._cache.get(key)
 
     def set(self, key, value):
-        value2 = json.dumps(value, cls=AnsibleJSONEncoder, sort_keys=True, indent=4)
+        value2 = json.dumps(value, cls=AnsibleJSONEncoder, separators=(",", ":"))
+
+        # store the value and register the key in a single round trip
+        pipe = self._db.pipeline(transaction=False)
         if self._timeout > 0:  # a timeout of 0 is handled as meaning 'never expire'
-            self._db.setex(self._make_key(key), int(self._timeout), value2)
+            pipe.setex(self._make_key(key), int(self._timeout), value2)
         else:
-            self._db.set(self._make_key(key), value2)
+            pipe.set(self._make_key(key), value2)
 
         if VERSION[0] == 2:
-            self._db.zadd(self._keys_set, time.time(), key)
+            pipe.zadd(self._keys_set, time.time(), key)
         else:
-            self._db.zadd(self._keys_set, {key: time.time()})
+            pipe.zadd(self._keys_set, {key: time.time()})
+        pipe.execute()
         self._cache[key] = value
 
     def _expire_keys(self):
         if self._timeout > 0:
-            expiry_age = time.time() - self._timeout
+            now = time.time()
+            if self._last_expiry is not None and now - self._last_expiry < self._expire_interval:
+                return
+            self._last_expiry = now
+            expiry_age = now - self._timeout
             self._db.zremrangebyscore(self._keys_set, 0, expiry_age)
 
     def keys(self):
         self._expire_keys()
-        return self._db.zrange(self._keys_set, 0, -1)
+        return [to_text(key) for key in self._db.zrange(self._keys_set, 0, -1)]
 
     def contains(self, key):
+        if self._prefetch:
+            self._prefetch_all()
+            if key in self._cache:
+                return True
+
         self._expire_keys()
         return self._db.zrank(self._keys_set, key) is not None
 
     def delete(self, key):
         if key in self._cache:
             del self._cache[key]
-        self._db.delete(self._make_key(key))
-        self._db.zrem(self._keys_set, key)
+        pipe = self._db.pipeline(transaction=False)
+        pipe.delete(self._make_key(key))
+        pipe.zrem(self._keys_set, key)
+        pipe.execute()
 
     def flush(self):
         for key in list(self.keys()):
@@ -0,0 +1,184 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+DOCUMENTATION = r"""
+author: agent (@agent)
+name: sqlite
+short_description: Use a single SQLite database file for cache
+version_added: 13.3.0
+description:
+  - This cache uses JSON formatted, per host records saved in a single local SQLite database file.
+  - Compared to the per host files of the P(community.general.pickle#cache) and P(community.general.yaml#cache) cache plugins,
+    listing and expiring the cached hosts does not need to list a directory or stat one file per host, which matters
+    with many thousands of hosts.
+  - Expiry is based on an indexed timestamp column, and the database is read through memory-mapped I/O.
+  - The database is used in write-ahead logging mode, so that concurrent readers do not block the writer.
+  - Every change is committed right away. In write-ahead logging mode a commit does not wait for the data to reach the
+    disk, so batching changes saves little, while keeping a write transaction open would block other Ansible processes
+    using the same database.
+options:
+  _uri:
+    description:
+      - Path of the SQLite database file. It is created if it does not exist; its parent directory must exist.
+    type: path
+    required: true
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_CONNECTION
+    ini:
+      - key: fact_caching_connection
+        section: defaults
+  _prefix:
+    description: User defined prefix to use when creating the DB entries.
+    type: string
+    default: ansible_facts
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_PREFIX
+    ini:
+      - key: fact_caching_prefix
+        section: defaults
+  _timeout:
+    default: 86400
+    description: Expiration timeout in seconds for the cache plugin data. Set to 0 to never expire.
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_TIMEOUT
+    ini:
+      - key: fact_caching_timeout
+        section: defaults
+    type: float
+  _mmap_size:
+    description:
+      - Maximum number of bytes of the database file to access through memory-mapped I/O.
+      - Set to V(0) to disable memory-mapped I/O.
+    default: 268435456
+    type: integer
+    env:
+      - name: ANSIBLE_CACHE_SQLITE_MMAP_SIZE
+    ini:
+      - key: fact_caching_sqlite_mmap_size
+        section: defaults
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+from ansible.errors import AnsibleError
+from ansible.parsing.ajson import AnsibleJSONDecoder, AnsibleJSONEncoder
+from ansible.plugins.cache import BaseCacheModule
+from ansible.utils.display import Display
+
+display = Display()
+
+
+class CacheModule(BaseCacheModule):
+    """
+    A caching module backed by a SQLite database.
+
+    All hosts are stored in one table whose rows carry the timestamp
+    of their last update. That column is indexed, so that expired rows
+    are removed with a single range delete.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._path = self.get_option("_uri")
+        self._timeout = float(self.get_option("_timeout"))
+        self._prefix = self.get_option("_prefix")
+        self._mmap_size = self.get_option("_mmap_size")
+
+        self._cache = {}
+        self._conn = None
+        self._pid = None
+
+        display.vv(f"SQLite cache database: {self._path}")
+
+    @property
+    def _db(self):
+        # connections must not be shared with forked processes
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = self._connect()
+            self._pid = os.getpid()
+        return self._conn
+
+    def _connect(self):
+        try:
+            conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_updated ON cache (updated)")
+        except sqlite3.Error as e:
+            raise AnsibleError(f"Unable to open the SQLite cache database {self._path!r}: {e}") from e
+        return conn
+
+    def _make_key(self, key):
+        return self._prefix + key
+
+    def _expiry_age(self):
+        return time.time() - self._timeout if self._timeout > 0 else 0
+
+    def _expire_keys(self):
+        if self._timeout > 0:
+            self._db.execute("DELETE FROM cache WHERE updated < ?", (self._expiry_age(),))
+
+    def get(self, key):
+        if key not in self._cache:
+            row = self._db.execute(
+                "SELECT value FROM cache WHERE key = ? AND updated >= ?", (self._make_key(key), self._expiry_age())
+            ).fetchone()
+            if row is None:
+                raise KeyError
+            self._cache[key] = json.loads(row[0], cls=AnsibleJSONDecoder)
+
+        return self._cache.get(key)
+
+    def set(self, key, value):
+        value2 = json.dumps(value, cls=AnsibleJSONEncoder, separators=(",", ":"))
+        self._db.execute(
+            "INSERT OR REPLACE INTO cache (key, value, updated) VALUES (?, ?, ?)",
+            (self._make_key(key), value2, time.time()),
+        )
+        self._cache[key] = value
+
+    def keys(self):
+        self._expire_keys()
+        rows = self._db.execute(
+            "SELECT substr(key, ?) FROM cache WHERE substr(key, 1, ?) = ?",
+            (len(self._prefix) + 1, len(self._prefix), self._prefix),
+        )
+        return [row[0] for row in rows]
+
+    def contains(self, key):
+        row = self._db.execute(
+            "SELECT 1 FROM cache WHERE key = ? AND updated >= ?", (self._make_key(key), self._expiry_age())
+        ).fetchone()
+        return row is not None
+
+    def delete(self, key):
+        if key in self._cache:
+            del self._cache[key]
+        self._db.execute("DELETE FROM cache WHERE key = ?", (self._make_key(key),))
+
+    def flush(self):
+        self._cache = {}
+        self._db.execute("DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(self._prefix), self._prefix))
+
+    def copy(self):
+        self._expire_keys()
+        rows = self._db.execute(
+            "SELECT substr(key, ?), value FROM cache WHERE substr(key, 1, ?) = ?",
+            (len(self._prefix) + 1, len(self._prefix), self._prefix),
+        )
+        return {key: json.loads(value, cls=AnsibleJSONDecoder) for key, value in rows}
+
+    def __getstate__(self):
+        return dict()
+
+    def __setstate__(self, data):
+        self.__init__()
@@ -35,6 +35,64 @@ options:
     ini:
       - section: callback_loganalytics
         key: shared_key
+  asynchronous:
+    description:
+      - Send events from a background thread, several events per request, instead of sending every event with its own
+        request while the playbook waits for it.
+      - Pending events are sent at the end of every playbook.
+    env:
+      - name: LOGANALYTICS_ASYNCHRONOUS
+    ini:
+      - section: callback_loganalytics
+        key: asynchronous
+    type: bool
+    default: false
+    version_added: 13.3.0
+  events_per_request:
+    description:
+      - Maximum number of events sent to the Azure log analytics workspace with one request when O(asynchronous=true).
+    env:
+      - name: LOGANALYTICS_EVENTS_PER_REQUEST
+    ini:
+      - section: callback_loganalytics
+        key: events_per_request
+    type: int
+    default: 100
+    version_added: 13.3.0
+  flush_interval:
+    description:
+      - Maximum number of seconds an event waits before being sent when O(asynchronous=true).
+    env:
+      - name: LOGANALYTICS_FLUSH_INTERVAL
+    ini:
+      - section: callback_loganalytics
+        key: flush_interval
+    type: float
+    default: 5
+    version_added: 13.3.0
+  max_buffer_size:
+    description:
+      - Maximum number of bytes of events waiting to be sent when O(asynchronous=true).
+      - When this limit is reached, new events are dropped and a warning is shown at the end of the playbook run.
+    env:
+      - name: LOGANALYTICS_MAX_BUFFER_SIZE
+    ini:
+      - section: callback_loganalytics
+        key: max_buffer_size
+    type: int
+    default: 16777216
+    version_added: 13.3.0
+  max_retries:
+    description:
+      - Number of times a failed request is retried, with an exponentially increasing delay, when O(asynchronous=true).
+    env:
+      - name: LOGANALYTICS_MAX_RETRIES
+    ini:
+      - section: callback_loganalytics
+        key: max_retries
+    type: int
+    default: 3
+    version_added: 13.3.0
 deprecated:
   removed_in: 14.0.0
   why: The "HTTP Data Collector API" used by the plugin has been deprecated in Azure Monitor and replaced with the "Logs Ingestion API".
@@ -53,6 +111,10 @@ examples: |-
     [callback_loganalytics]
     workspace_id = 01234567-0123-0123-0123-01234567890a
     shared_key = dZD0kCbKl3ehZG6LHFMuhtE0yHiFCmetzFMc2u+roXIUQuatqU924SsAAAAPemhjbGlAemhjbGktTUJQAQIDBA==
+
+  To send events in batches from a background thread:
+    [callback_loganalytics]
+    asynchronous = true
 """
 
 import base64
@@ -72,6 +134,7 @@ from ansible.plugins.callback import CallbackBase
 from ansible_collections.community.general.plugins.module_utils._datetime import (
     now,
 )
+from ansible_collections.community.general.plugins.plugin_utils._batch_sender import BatchSender
 
 
 class AzureLogAnalyticsSource:
@@ -100,6 +163,10 @@ class AzureLogAnalyticsSource:
         return now().strftime("%a, %d %b %Y %H:%M:%S GMT")
 
     def send_event(self, workspace_id, shared_key, state, result, runtime):
+        jsondata = self.build_event(state, result, runtime)
+        self.send_events(workspace_id, shared_key, [jsondata])
+
+    def build_event(self, state, result, runtime):
         if result._task_fields["args"].get("_ansible_check_mode") is True:
             self.ansible_check_mode = True
 
@@ -132,8 +199,12 @@ class AzureLogAnalyticsSource:
         # Adding extra vars info
         data["extra_vars"] = self.extra_vars
 
-        # Preparing the playbook logs as JSON format and send to Azure log analytics
-        jsondata = json.dumps({"event": data}, cls=AnsibleJSONEncoder, sort_keys=True)
+        # Preparing the playbook logs as JSON format
+        return json.dumps({"event": data}, cls=AnsibleJSONEncoder, sort_keys=True)
+
+    def send_events(self, workspace_id, shared_key, events):
+        # Several events are sent to Azure log analytics in one request as a JSON array
+        jsondata = events[0] if len(events) == 1 else f"[{','.join(events)}]"
         content_length = len(jsondata)
         rfc1123date = self.__rfc1123date()
         signature = self.__build_signature(rfc1123date, workspace_id, shared_key, content_length)
@@ -163,6 +234,7 @@ class CallbackModule(CallbackBase):
         self.start_datetimes = {}  # Collect task start times
         self.workspace_id = None
         self.shared_key = None
+        self.sender = None
         self.loganalytics = AzureLogAnalyticsSource()
 
     def _seconds_since_start(self, result):
@@ -173,6 +245,28 @@ class CallbackModule(CallbackBase):
         self.workspace_id = self.get_option("workspace_id")
         self.shared_key = self.get_option("shared_key")
 
+        if self.get_option("asynchronous") and self.sender is None:
+            self.sender = BatchSender(
+                self._send_events,
+                batch_size=self.get_option("events_per_request"),
+                flush_interval=self.get_option("flush_interval"),
+                max_buffer_size=self.get_option("max_buffer_size"),
+                max_retries=self.get_option("max_retries"),
+                display=self._display,
+                name="Azure log analytics",
+            )
+            self.sender.close_at_exit()
+
+    def _send_events(self, events):
+        self.loganalytics.send_events(self.workspace_id, self.shared_key, events)
+
+    def _send_event(self, state, result):
+        jsondata = self.loganalytics.build_event(state, result, self._seconds_since_start(result))
+        if self.sender is None:
+            self._send_events([jsondata])
+        else:
+            self.sender.put(jsondata)
+
     def v2_playbook_on_play_start(self, play):
         vm = play.get_variable_manager()
         extra_vars = vm.extra_vars
@@ -188,26 +282,20 @@ class CallbackModule(CallbackBase):
         self.start_datetimes[task._uuid] = now()
 
     def v2_runner_on_ok(self, result, **kwargs):
-        self.loganalytics.send_event(
-            self.workspace_id, self.shared_key, "OK", result, self._seconds_since_start(result)
-        )
+        self._send_event("OK", result)
 
     def v2_runner_on_skipped(self, result, **kwargs):
-        self.loganalytics.send_event(
-            self.workspace_id, self.shared_key, "SKIPPED", result, self._seconds_since_start(result)
-        )
+        self._send_event("SKIPPED", result)
 
     def v2_runner_on_failed(self, result, **kwargs):
-        self.loganalytics.send_event(
-            self.workspace_id, self.shared_key, "FAILED", result, self._seconds_since_start(result)
-        )
+        self._send_event("FAILED", result)
 
     def runner_on_async_failed(self, result, **kwargs):
-        self.loganalytics.send_event(
-            self.workspace_id, self.shared_key, "FAILED", result, self._seconds_since_start(result)
-        )
+        self._send_event("FAILED", result)
 
     def v2_runner_on_unreachable(self, result, **kwargs):
-        self.loganalytics.send_event(
-            self.workspace_id, self.shared_key, "UNREACHABLE", result, self._seconds_since_start(result)
-        )
+        self._send_event("UNREACHABLE", result)
+
+    def v2_playbook_on_stats(self, stats):
+        if self.sender is not None:
+            self.sender.flush()
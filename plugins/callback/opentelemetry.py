@@ -109,6 +109,34 @@ options:
       - section: callback_opentelemetry
         key: otel_exporter_otlp_traces_protocol
     version_added: 9.0.0
+  incremental_export:
+    default: false
+    type: bool
+    description:
+      - Export the span of a task for a host as soon as the task finishes on that host, instead of keeping all tasks and
+        their results in memory until the end of the playbook run.
+      - This keeps the memory usage proportional to the number of tasks in progress, which matters for long playbook
+        runs on many hosts.
+      - Unless O(store_spans_in_file) is set, spans are exported in batches by a background thread.
+      - The playbook span starts with the first task and ends with the playbook run.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_INCREMENTAL_EXPORT
+    ini:
+      - section: callback_opentelemetry
+        key: incremental_export
+    version_added: 13.3.0
+  max_log_length:
+    default: 0
+    type: int
+    description:
+      - Maximum number of characters of a task result sent in logs. Longer results are truncated.
+      - Set to V(0) to send the full task results.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_MAX_LOG_LENGTH
+    ini:
+      - section: callback_opentelemetry
+        key: max_log_length
+    version_added: 13.3.0
 requirements:
   - opentelemetry-api (Python library)
   - opentelemetry-exporter-otlp (Python library)
@@ -129,6 +157,11 @@ examples: |-
     export OTEL_EXPORTER_OTLP_HEADERS="authorization=Bearer your_otel_token"
     export OTEL_SERVICE_NAME=your_service_name
     export ANSIBLE_OPENTELEMETRY_ENABLED=true
+
+  Export spans while the playbook runs, with bounded log sizes, in ansible.cfg:
+    [callback_opentelemetry]
+    incremental_export = true
+    max_log_length = 65536
 """
 
 import getpass
@@ -168,6 +201,8 @@ class TaskData:
     Data about an individual task.
     """
 
+    __slots__ = ("uuid", "name", "path", "play", "host_data", "start", "action", "args", "dump")
+
     def __init__(self, uuid, name, path, play, action, args):
         self.uuid = uuid
         self.name = name
@@ -196,6 +231,8 @@ class HostData:
     Data about an individual host.
     """
 
+    __slots__ = ("uuid", "name", "status", "result", "finish", "start")
+
     def __init__(self, uuid, name, status, result=None):
         self.uuid = uuid
         self.name = name
@@ -223,6 +260,11 @@ class OpenTelemetrySource:
 
         self._display = display
 
+        # used when spans are exported incrementally
+        self.tracer = None
+        self.otel_exporter = None
+        self.parent_span = None
+
     def traceparent_context(self, traceparent):
         carrier = dict()
         carrier["traceparent"] = traceparent
@@ -264,6 +306,82 @@ class OpenTelemetrySource:
 
         task.dump = dump
         task.add_host(HostData(host_uuid, host_name, status, result))
+        return host_uuid
+
+    def create_tracer(self, otel_service_name, otel_exporter_otlp_traces_protocol, store_spans_in_file):
+        """set up the tracer provider and return a tracer and the span exporter"""
+
+        trace.set_tracer_provider(TracerProvider(resource=Resource.create({SERVICE_NAME: otel_service_name})))
+
+        otel_exporter = None
+        if store_spans_in_file:
+            otel_exporter = InMemorySpanExporter()
+            processor = SimpleSpanProcessor(otel_exporter)
+        else:
+            if otel_exporter_otlp_traces_protocol == "grpc":
+                otel_exporter = GRPCOTLPSpanExporter()
+            else:
+                otel_exporter = HTTPOTLPSpanExporter()
+            processor = BatchSpanProcessor(otel_exporter)
+
+        trace.get_tracer_provider().add_span_processor(processor)
+
+        return trace.get_tracer(__name__), otel_exporter
+
+    def set_trace_attributes(self, parent):
+        """populate the trace metadata attributes of the playbook span"""
+
+        parent.set_attribute("ansible.version", ansible_version)
+        parent.set_attribute("ansible.session", self.session)
+        parent.set_attribute("ansible.host.name", self.host)
+        if self.ip_address is not None:
+            parent.set_attribute("ansible.host.ip", self.ip_address)
+        parent.set_attribute("ansible.host.user", self.user)
+
+    def start_trace(
+        self, otel_service_name, ansible_playbook, traceparent, otel_exporter_otlp_traces_protocol, store_spans_in_file
+    ):
+        """start the playbook span, when spans are exported incrementally"""
+
+        if self.tracer is None:
+            # the tracer provider can only be set once per process, so it is kept across playbooks
+            self.tracer, self.otel_exporter = self.create_tracer(
+                otel_service_name, otel_exporter_otlp_traces_protocol, store_spans_in_file
+            )
+        self.parent_span = self.tracer.start_span(
+            ansible_playbook,
+            context=self.traceparent_context(traceparent),
+            kind=SpanKind.SERVER,
+        )
+        self.set_trace_attributes(self.parent_span)
+
+    def export_host(self, tasks_data, task_uuid, host_uuid, disable_logs, disable_attributes_in_logs):
+        """export the span of a finished host right away and forget about it"""
+
+        task = tasks_data[task_uuid]
+        host_data = task.host_data.pop(host_uuid)
+        span = self.tracer.start_span(
+            task.name,
+            context=trace.set_span_in_context(self.parent_span),
+            start_time=host_data.start or task.start,
+        )
+        self.update_span_data(task, host_data, span, disable_logs, disable_attributes_in_logs)
+        task.dump = None
+        if not task.host_data:
+            del tasks_data[task_uuid]
+
+    def end_trace(self, tasks_data, status, disable_logs, disable_attributes_in_logs):
+        """export the spans of the hosts that did not finish and end the playbook span"""
+
+        for task_uuid in list(tasks_data):
+            for host_uuid in list(tasks_data[task_uuid].host_data):
+                self.export_host(tasks_data, task_uuid, host_uuid, disable_logs, disable_attributes_in_logs)
+
+        self.parent_span.set_status(status)
+        self.parent_span.end()
+        # the next playbook starts its own trace
+        self.parent_span = None
+        return self.otel_exporter
 
     def generate_distributed_traces(
         self,
@@ -286,22 +404,9 @@ class OpenTelemetrySource:
                 parent_start_time = task.start
             tasks.append(task)
 
-        trace.set_tracer_provider(TracerProvider(resource=Resource.create({SERVICE_NAME: otel_service_name})))
-
-        otel_exporter = None
-        if store_spans_in_file:
-            otel_exporter = InMemorySpanExporter()
-            processor = SimpleSpanProcessor(otel_exporter)
-        else:
-            if otel_exporter_otlp_traces_protocol == "grpc":
-                otel_exporter = GRPCOTLPSpanExporter()
-            else:
-                otel_exporter = HTTPOTLPSpanExporter()
-            processor = BatchSpanProcessor(otel_exporter)
-
-        trace.get_tracer_provider().add_span_processor(processor)
-
-        tracer = trace.get_tracer(__name__)
+        tracer, otel_exporter = self.create_tracer(
+            otel_service_name, otel_exporter_otlp_traces_protocol, store_spans_in_file
+        )
 
         with tracer.start_as_current_span(
             ansible_playbook,
@@ -310,13 +415,7 @@ class OpenTelemetrySource:
             kind=SpanKind.SERVER,
         ) as parent:
             parent.set_status(status)
-            # Populate trace metadata attributes
-            parent.set_attribute("ansible.version", ansible_version)
-            parent.set_attribute("ansible.session", self.session)
-            parent.set_attribute("ansible.host.name", self.host)
-            if self.ip_address is not None:
-                parent.set_attribute("ansible.host.ip", self.ip_address)
-            parent.set_attribute("ansible.host.user", self.user)
+            self.set_trace_attributes(parent)
             for task in tasks:
                 for host_data in task.host_data.values():
                     start = host_data.start or task.start
@@ -511,6 +610,8 @@ class CallbackModule(CallbackBase):
         self.traceparent = False
         self.store_spans_in_file = False
         self.otel_exporter_otlp_traces_protocol = None
+        self.incremental_export = False
+        self.max_log_length = 0
 
         if OTEL_LIBRARY_IMPORT_ERROR:
             raise AnsibleError(
@@ -549,6 +650,10 @@ class CallbackModule(CallbackBase):
 
         self.otel_exporter_otlp_traces_protocol = self.get_option("otel_exporter_otlp_traces_protocol")
 
+        self.incremental_export = self.get_option("incremental_export")
+
+        self.max_log_length = self.get_option("max_log_length")
+
     def dump_results(self, task, result):
         """dump the results if disable_logs is not enabled"""
         if self.disable_logs:
@@ -561,7 +666,17 @@ class CallbackModule(CallbackBase):
         # ansible.builtin.slurp contains the response in the content field
         if "content" in save and task.action in ("ansible.builtin.slurp", "ansible.legacy.slurp", "slurp"):
             save.pop("content")
-        return self._dump_results(save)
+        dump = self._dump_results(save)
+        if self.max_log_length and len(dump) > self.max_log_length:
+            dump = f"{dump[: self.max_log_length]}... (truncated)"
+        return dump
+
+    def _finish_task(self, status, result, dump):
+        host_uuid = self.opentelemetry.finish_task(self.tasks_data, status, result, dump)
+        if self.incremental_export:
+            self.opentelemetry.export_host(
+                self.tasks_data, result._task._uuid, host_uuid, self.disable_logs, self.disable_attributes_in_logs
+            )
 
     def v2_playbook_on_start(self, playbook):
         self.ansible_playbook = basename(playbook._file_name)
@@ -570,6 +685,14 @@ class CallbackModule(CallbackBase):
         self.play_name = play.get_name()
 
     def v2_runner_on_start(self, host, task):
+        if self.incremental_export and self.opentelemetry.parent_span is None:
+            self.opentelemetry.start_trace(
+                self.otel_service_name,
+                self.ansible_playbook,
+                self.traceparent,
+                self.otel_exporter_otlp_traces_protocol,
+                self.store_spans_in_file,
+            )
         self.opentelemetry.start_task(self.tasks_data, self.hide_task_arguments, self.play_name, task, host)
 
     def v2_runner_on_failed(self, result, ignore_errors=False):
@@ -579,45 +702,48 @@ class CallbackModule(CallbackBase):
             status = "failed"
             self.errors += 1
 
-        self.opentelemetry.finish_task(
-            self.tasks_data, status, result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self._finish_task(status, result, self.dump_results(self.tasks_data[result._task._uuid], result))
 
     def v2_runner_on_ok(self, result):
-        self.opentelemetry.finish_task(
-            self.tasks_data, "ok", result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self._finish_task("ok", result, self.dump_results(self.tasks_data[result._task._uuid], result))
 
     def v2_runner_on_skipped(self, result):
-        self.opentelemetry.finish_task(
-            self.tasks_data, "skipped", result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self._finish_task("skipped", result, self.dump_results(self.tasks_data[result._task._uuid], result))
 
     def v2_runner_on_unreachable(self, result):
         self.errors += 1
-        self.opentelemetry.finish_task(
-            self.tasks_data, "failed", result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self._finish_task("failed", result, self.dump_results(self.tasks_data[result._task._uuid], result))
 
     def v2_playbook_on_include(self, included_file):
-        self.opentelemetry.finish_task(self.tasks_data, "included", included_file, "")
+        if self.incremental_export and included_file._task._uuid not in self.tasks_data:
+            # the spans of all hosts of the include task have already been exported
+            return
+        self._finish_task("included", included_file, "")
 
     def v2_playbook_on_stats(self, stats):
         if self.errors == 0:
             status = Status(status_code=StatusCode.OK)
         else:
             status = Status(status_code=StatusCode.ERROR)
-        otel_exporter = self.opentelemetry.generate_distributed_traces(
-            self.otel_service_name,
-            self.ansible_playbook,
-            self.tasks_data,
-            status,
-            self.traceparent,
-            self.disable_logs,
-            self.disable_attributes_in_logs,
-            self.otel_exporter_otlp_traces_protocol,
-            self.store_spans_in_file,
-        )
+        if self.incremental_export:
+            if self.opentelemetry.parent_span is None:
+                # no task has been run
+                return
+            otel_exporter = self.opentelemetry.end_trace(
+                self.tasks_data, status, self.disable_logs, self.disable_attributes_in_logs
+            )
+        else:
+            otel_exporter = self.opentelemetry.generate_distributed_traces(
+                self.otel_service_name,
+                self.ansible_playbook,
+                self.tasks_data,
+                status,
+                self.traceparent,
+                self.disable_logs,
+                self.disable_attributes_in_logs,
+                self.otel_exporter_otlp_traces_protocol,
+                self.store_spans_in_file,
+            )
 
         if self.store_spans_in_file:
             spans = [json.loads(span.to_json()) for span in otel_exporter.get_finished_spans()]
@@ -67,6 +67,75 @@ options:
         key: batch
     type: str
     version_added: 3.3.0
+  asynchronous:
+    description:
+      - Send events from a background thread, several events per request, instead of sending every event with its own
+        request while the playbook waits for it.
+      - Pending events are sent at the end of every playbook.
+    env:
+      - name: SPLUNK_ASYNCHRONOUS
+    ini:
+      - section: callback_splunk
+        key: asynchronous
+    type: bool
+    default: false
+    version_added: 13.3.0
+  events_per_request:
+    description:
+      - Maximum number of events sent to the Splunk HTTP collector with one request when O(asynchronous=true).
+    env:
+      - name: SPLUNK_EVENTS_PER_REQUEST
+    ini:
+      - section: callback_splunk
+        key: events_per_request
+    type: int
+    default: 100
+    version_added: 13.3.0
+  flush_interval:
+    description:
+      - Maximum number of seconds an event waits before being sent when O(asynchronous=true).
+    env:
+      - name: SPLUNK_FLUSH_INTERVAL
+    ini:
+      - section: callback_splunk
+        key: flush_interval
+    type: float
+    default: 5
+    version_added: 13.3.0
+  max_buffer_size:
+    description:
+      - Maximum number of bytes of events waiting to be sent when O(asynchronous=true).
+      - When this limit is reached, new events are dropped and a warning is shown at the end of the playbook run.
+    env:
+      - name: SPLUNK_MAX_BUFFER_SIZE
+    ini:
+      - section: callback_splunk
+        key: max_buffer_size
+    type: int
+    default: 16777216
+    version_added: 13.3.0
+  max_retries:
+    description:
+      - Number of times a failed request is retried, with an exponentially increasing delay, when O(asynchronous=true).
+    env:
+      - name: SPLUNK_MAX_RETRIES
+    ini:
+      - section: callback_splunk
+        key: max_retries
+    type: int
+    default: 3
+    version_added: 13.3.0
+  compress:
+    description:
+      - Compress the requests sent to the Splunk HTTP collector with gzip.
+    env:
+      - name: SPLUNK_COMPRESS
+    ini:
+      - section: callback_splunk
+        key: compress
+    type: bool
+    default: false
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -81,9 +150,14 @@ examples: >-
     [callback_splunk]
     url = http://mysplunkinstance.datapaas.io:8088/services/collector/event
     authtoken = f23blad6-5965-4537-bf69-5b5a545blabla88
+  To send events in batches from a background thread, with compressed requests
+    [callback_splunk]
+    asynchronous = true
+    compress = true
 """
 
 import getpass
+import gzip
 import json
 import socket
 import uuid
@@ -97,6 +171,7 @@ from ansible.plugins.callback import CallbackBase
 from ansible_collections.community.general.plugins.module_utils._datetime import (
     now,
 )
+from ansible_collections.community.general.plugins.plugin_utils._batch_sender import BatchSender
 
 
 class SplunkHTTPCollectorSource:
@@ -109,6 +184,10 @@ class SplunkHTTPCollectorSource:
         self.user = getpass.getuser()
 
     def send_event(self, url, authtoken, validate_certs, include_milliseconds, batch, state, result, runtime):
+        jsondata = self.build_event(include_milliseconds, batch, state, result, runtime)
+        self.send_events(url, authtoken, validate_certs, [jsondata])
+
+    def build_event(self, include_milliseconds, batch, state, result, runtime):
         if result._task_fields["args"].get("_ansible_check_mode") is True:
             self.ansible_check_mode = True
 
@@ -146,12 +225,20 @@ class SplunkHTTPCollectorSource:
         data["ansible_result"] = result._result
 
         # This wraps the json payload in and outer json event needed by Splunk
-        jsondata = json.dumps({"event": data}, cls=AnsibleJSONEncoder, sort_keys=True)
+        return json.dumps({"event": data}, cls=AnsibleJSONEncoder, sort_keys=True)
+
+    def send_events(self, url, authtoken, validate_certs, events, compress=False):
+        # The HTTP collector accepts several events in one request, simply concatenated
+        jsondata = "\n".join(events)
+        headers = {"Content-type": "application/json", "Authorization": f"Splunk {authtoken}"}
+        if compress:
+            jsondata = gzip.compress(jsondata.encode("utf-8"))
+            headers["Content-Encoding"] = "gzip"
 
         open_url(
             url,
             jsondata,
-            headers={"Content-type": "application/json", "Authorization": f"Splunk {authtoken}"},
+            headers=headers,
             method="POST",
             validate_certs=validate_certs,
         )
@@ -171,6 +258,8 @@ class CallbackModule(CallbackBase):
         self.validate_certs = None
         self.include_milliseconds = None
         self.batch = None
+        self.compress = None
+        self.sender = None
         self.splunk = SplunkHTTPCollectorSource()
 
     def _runtime(self, result):
@@ -209,6 +298,36 @@ class CallbackModule(CallbackBase):
 
         self.batch = self.get_option("batch")
 
+        self.compress = self.get_option("compress")
+
+        if self.get_option("asynchronous") and not self.disabled and self.sender is None:
+            self.sender = BatchSender(
+                self._send_events,
+                batch_size=self.get_option("events_per_request"),
+                flush_interval=self.get_option("flush_interval"),
+                max_buffer_size=self.get_option("max_buffer_size"),
+                max_retries=self.get_option("max_retries"),
+                display=self._display,
+                name="Splunk HTTP collector",
+            )
+            self.sender.close_at_exit()
+
+    def _send_events(self, events):
+        self.splunk.send_events(self.url, self.authtoken, self.validate_certs, events, compress=self.compress)
+
+    def _send_event(self, state, result):
+        jsondata = self.splunk.build_event(
+            self.include_milliseconds,
+            self.batch,
+            state,
+            result,
+            self._runtime(result),
+        )
+        if self.sender is None:
+            self._send_events([jsondata])
+        else:
+            self.sender.put(jsondata)
+
     def v2_playbook_on_start(self, playbook):
         self.splunk.ansible_playbook = basename(playbook._file_name)
 
@@ -219,61 +338,20 @@ class CallbackModule(CallbackBase):
         self.start_datetimes[task._uuid] = now()
 
     def v2_runner_on_ok(self, result, **kwargs):
-        self.splunk.send_event(
-            self.url,
-            self.authtoken,
-            self.validate_certs,
-            self.include_milliseconds,
-            self.batch,
-            "OK",
-            result,
-            self._runtime(result),
-        )
+        self._send_event("OK", result)
 
     def v2_runner_on_skipped(self, result, **kwargs):
-        self.splunk.send_event(
-            self.url,
-            self.authtoken,
-            self.validate_certs,
-            self.include_milliseconds,
-            self.batch,
-            "SKIPPED",
-            result,
-            self._runtime(result),
-        )
+        self._send_event("SKIPPED", result)
 
     def v2_runner_on_failed(self, result, **kwargs):
-        self.splunk.send_event(
-            self.url,
-            self.authtoken,
-            self.validate_certs,
-            self.include_milliseconds,
-            self.batch,
-            "FAILED",
-            result,
-            self._runtime(result),
-        )
+        self._send_event("FAILED", result)
 
     def v2_runner_on_async_failed(self, result, **kwargs):
-        self.splunk.send_event(
-            self.url,
-            self.authtoken,
-            self.validate_certs,
-            self.include_milliseconds,
-            self.batch,
-            "FAILED",
-            result,
-            self._runtime(result),
-        )
+        self._send_event("FAILED", result)
 
     def v2_runner_on_unreachable(self, result, **kwargs):
-        self.splunk.send_event(
-            self.url,
-            self.authtoken,
-            self.validate_certs,
-            self.include_milliseconds,
-            self.batch,
-            "UNREACHABLE",
-            result,
-            self._runtime(result),
-        )
+        self._send_event("UNREACHABLE", result)
+
+    def v2_playbook_on_stats(self, stats):
+        if self.sender is not None:
+            self.sender.flush()
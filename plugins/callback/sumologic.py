@@ -24,6 +24,75 @@ options:
     ini:
       - section: callback_sumologic
         key: url
+  asynchronous:
+    description:
+      - Send events from a background thread, several events per request, instead of sending every event with its own
+        request while the playbook waits for it.
+      - Pending events are sent at the end of every playbook.
+    env:
+      - name: SUMOLOGIC_ASYNCHRONOUS
+    ini:
+      - section: callback_sumologic
+        key: asynchronous
+    type: bool
+    default: false
+    version_added: 13.3.0
+  events_per_request:
+    description:
+      - Maximum number of events sent to the Sumologic HTTP collector source with one request when O(asynchronous=true).
+    env:
+      - name: SUMOLOGIC_EVENTS_PER_REQUEST
+    ini:
+      - section: callback_sumologic
+        key: events_per_request
+    type: int
+    default: 100
+    version_added: 13.3.0
+  flush_interval:
+    description:
+      - Maximum number of seconds an event waits before being sent when O(asynchronous=true).
+    env:
+      - name: SUMOLOGIC_FLUSH_INTERVAL
+    ini:
+      - section: callback_sumologic
+        key: flush_interval
+    type: float
+    default: 5
+    version_added: 13.3.0
+  max_buffer_size:
+    description:
+      - Maximum number of bytes of events waiting to be sent when O(asynchronous=true).
+      - When this limit is reached, new events are dropped and a warning is shown at the end of the playbook run.
+    env:
+      - name: SUMOLOGIC_MAX_BUFFER_SIZE
+    ini:
+      - section: callback_sumologic
+        key: max_buffer_size
+    type: int
+    default: 16777216
+    version_added: 13.3.0
+  max_retries:
+    description:
+      - Number of times a failed request is retried, with an exponentially increasing delay, when O(asynchronous=true).
+    env:
+      - name: SUMOLOGIC_MAX_RETRIES
+    ini:
+      - section: callback_sumologic
+        key: max_retries
+    type: int
+    default: 3
+    version_added: 13.3.0
+  compress:
+    description:
+      - Compress the requests sent to the Sumologic HTTP collector source with gzip.
+    env:
+      - name: SUMOLOGIC_COMPRESS
+    ini:
+      - section: callback_sumologic
+        key: compress
+    type: bool
+    default: false
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -38,9 +107,15 @@ examples: |-
   Set the ansible.cfg variable in the callback_sumologic block
     [callback_sumologic]
     url = https://endpoint1.collection.us2.sumologic.com/receiver/v1/http/R8moSv1d8EW9LAUFZJ6dbxCFxwLH6kfCdcBfddlfxCbLuL-BN5twcTpMk__pYy_cDmp==
+
+  To send events in batches from a background thread, with compressed requests
+    [callback_sumologic]
+    asynchronous = true
+    compress = true
 """
 
 import getpass
+import gzip
 import json
 import socket
 import uuid
@@ -54,6 +129,7 @@ from ansible.plugins.callback import CallbackBase
 from ansible_collections.community.general.plugins.module_utils._datetime import (
     now,
 )
+from ansible_collections.community.general.plugins.plugin_utils._batch_sender import BatchSender
 
 
 class SumologicHTTPCollectorSource:
@@ -66,6 +142,10 @@ class SumologicHTTPCollectorSource:
         self.user = getpass.getuser()
 
     def send_event(self, url, state, result, runtime):
+        host, jsondata = self.build_event(state, result, runtime)
+        self.send_events(url, host, [jsondata])
+
+    def build_event(self, state, result, runtime):
         if result._task_fields["args"].get("_ansible_check_mode") is True:
             self.ansible_check_mode = True
 
@@ -94,10 +174,20 @@ class SumologicHTTPCollectorSource:
         data["ansible_task"] = result._task_fields
         data["ansible_result"] = result._result
 
+        return data["ansible_host"], json.dumps(data, cls=AnsibleJSONEncoder, sort_keys=True)
+
+    def send_events(self, url, host, events, compress=False):
+        # The HTTP collector source accepts several events in one request, one per line
+        jsondata = "\n".join(events)
+        headers = {"Content-type": "application/json", "X-Sumo-Host": host}
+        if compress:
+            jsondata = gzip.compress(jsondata.encode("utf-8"))
+            headers["Content-Encoding"] = "gzip"
+
         open_url(
             url,
-            data=json.dumps(data, cls=AnsibleJSONEncoder, sort_keys=True),
-            headers={"Content-type": "application/json", "X-Sumo-Host": data["ansible_host"]},
+            data=jsondata,
+            headers=headers,
             method="POST",
         )
 
@@ -112,6 +202,8 @@ class CallbackModule(CallbackBase):
         super().__init__(display=display)
         self.start_datetimes = {}  # Collect task start times
         self.url = None
+        self.compress = None
+        self.sender = None
         self.sumologic = SumologicHTTPCollectorSource()
 
     def _runtime(self, result):
@@ -132,6 +224,35 @@ class CallbackModule(CallbackBase):
                 "in the ansible.cfg file."
             )
 
+        self.compress = self.get_option("compress")
+
+        if self.get_option("asynchronous") and not self.disabled and self.sender is None:
+            self.sender = BatchSender(
+                self._send_events,
+                batch_size=self.get_option("events_per_request"),
+                flush_interval=self.get_option("flush_interval"),
+                max_buffer_size=self.get_option("max_buffer_size"),
+                max_retries=self.get_option("max_retries"),
+                display=self._display,
+                name="Sumologic HTTP collector",
+            )
+            self.sender.close_at_exit()
+
+    def _send_events(self, events):
+        # X-Sumo-Host is set per request, so events of different hosts are sent separately
+        by_host = {}
+        for host, jsondata in events:
+            by_host.setdefault(host, []).append(jsondata)
+        for host, host_events in by_host.items():
+            self.sumologic.send_events(self.url, host, host_events, compress=self.compress)
+
+    def _send_event(self, state, result):
+        host, jsondata = self.sumologic.build_event(state, result, self._runtime(result))
+        if self.sender is None:
+            self._send_events([(host, jsondata)])
+        else:
+            self.sender.put((host, jsondata), size=len(jsondata))
+
     def v2_playbook_on_start(self, playbook):
         self.sumologic.ansible_playbook = basename(playbook._file_name)
 
@@ -142,16 +263,20 @@ class CallbackModule(CallbackBase):
         self.start_datetimes[task._uuid] = now()
 
     def v2_runner_on_ok(self, result, **kwargs):
-        self.sumologic.send_event(self.url, "OK", result, self._runtime(result))
+        self._send_event("OK", result)
 
     def v2_runner_on_skipped(self, result, **kwargs):
-        self.sumologic.send_event(self.url, "SKIPPED", result, self._runtime(result))
+        self._send_event("SKIPPED", result)
 
     def v2_runner_on_failed(self, result, **kwargs):
-        self.sumologic.send_event(self.url, "FAILED", result, self._runtime(result))
+        self._send_event("FAILED", result)
 
     def runner_on_async_failed(self, result, **kwargs):
-        self.sumologic.send_event(self.url, "FAILED", result, self._runtime(result))
+        self._send_event("FAILED", result)
 
     def v2_runner_on_unreachable(self, result, **kwargs):
-        self.sumologic.send_event(self.url, "UNREACHABLE", result, self._runtime(result))
+        self._send_event("UNREACHABLE", result)
+
+    def v2_playbook_on_stats(self, stats):
+        if self.sender is not None:
+            self.sender.flush()
@@ -62,6 +62,18 @@ options:
     type: str
     version_added: 10.3.0
 
+  token_cache_path:
+    description:
+      - Path of a file in which the access and refresh tokens obtained with O(auth_username) and O(auth_password), or with
+        O(auth_client_id) and O(auth_client_secret), are kept for the following tasks.
+      - The access token is reused until it expires. It is then renewed with the refresh token, if that is still valid,
+        instead of authenticating again with the credentials. A whole play usually needs a single authentication.
+      - Tokens are cached per Keycloak URL, realm, client and credentials. The file is created with permissions V(0600)
+        on the host that runs the module, together with a V(.lock) file next to it. Its directory must exist.
+      - This option is ignored when O(token) is set.
+    type: path
+    version_added: 13.3.0
+
   validate_certs:
     description:
       - Verify TLS certificates (do not disable this in production).
@@ -64,6 +64,22 @@ options:
     env:
       - name: OP_SERVICE_ACCOUNT_TOKEN
         version_added: 8.2.0
+  cache:
+    description:
+      - Keep the items fetched from 1Password in memory, and use them for the next lookups of the same items.
+      - The items are shared by the 1Password lookups of the same process that use the same account. Lookups run in the worker
+        process of their task, so the items are shared between the iterations of a loop and between the lookups of a task,
+        for example when looking up several fields of the same item.
+    type: bool
+    default: false
+    version_added: 13.3.0
+  max_workers:
+    description:
+      - Maximum number of items to fetch concurrently when multiple items are looked up.
+      - Set to V(1) to fetch the items one after the other.
+    type: int
+    default: 1
+    version_added: 13.3.0
 notes:
   - This lookup uses an existing 1Password session if one exists. If not, and you have already performed an initial sign in
     (meaning C(~/.op/config), C(~/.config/op/config) or C(~/.config/.op/config) exists), then only the O(master_password)
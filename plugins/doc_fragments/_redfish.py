@@ -33,4 +33,13 @@ options:
       - The available ciphers is dependent on the Python and OpenSSL/LibreSSL versions.
     type: list
     elements: str
+  max_concurrent_requests:
+    description:
+      - Maximum number of requests sent to the service at the same time.
+      - Independent resources, such as the members of the systems or the drives of a storage controller, are then retrieved
+        concurrently when gathering information.
+      - Some services handle concurrent requests poorly. Set to V(1) to send the requests one after the other.
+    type: int
+    default: 1
+    version_added: 13.3.0
 """
@@ -14,6 +14,7 @@ requirements:
   - python-gitlab > 1.8.0
 extends_documentation_fragment:
   - ansible.builtin.constructed
+  - ansible.builtin.inventory_cache
 description:
   - Reads inventories from the GitLab API.
   - Uses a YAML configuration file gitlab_runners.[yml|yaml].
@@ -52,6 +53,16 @@ options:
     description: Toggle to (not) include all available nodes metadata.
     type: bool
     default: true
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -80,8 +91,9 @@ keyed_groups:
 """
 
 from ansible.errors import AnsibleError, AnsibleParserError
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 try:
@@ -92,41 +104,58 @@ except ImportError:
     HAS_GITLAB = False
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Host inventory parser for ansible using GitLab API as source."""
 
     NAME = "community.general.gitlab_runners"
 
-    def _populate(self):
+    def _get_runners(self):
+        """Return the id, IP address and attributes of every runner."""
         with gitlab.Gitlab(self.get_option("server_url"), private_token=self.get_option("api_token")) as gl:
             try:
                 if self.get_option("filter"):
                     runners = gl.runners.all(scope=self.get_option("filter"))
                 else:
                     runners = gl.runners.all()
-                self.inventory.add_group("gitlab_runners")
-                for runner in runners:
-                    host = make_unsafe(str(runner["id"]))
-                    ip_address = runner["ip_address"]
-                    host_attrs = make_unsafe(vars(gl.runners.get(runner["id"]))["_attrs"])
-                    self.inventory.add_host(host, group="gitlab_runners")
-                    self.inventory.set_variable(host, "ansible_host", make_unsafe(ip_address))
-                    if self.get_option("verbose_output", True):
-                        self.inventory.set_variable(host, "gitlab_runner_attributes", host_attrs)
-
-                    # Use constructed if applicable
-                    strict = self.get_option("strict")
-                    # Composed variables
-                    self._set_composite_vars(self.get_option("compose"), host_attrs, host, strict=strict)
-                    # Complex groups based on jinja2 conditionals, hosts that meet the conditional are added to group
-                    self._add_host_to_composed_groups(self.get_option("groups"), host_attrs, host, strict=strict)
-                    # Create groups based on variable values and add the corresponding hosts to it
-                    self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_attrs, host, strict=strict)
+                return [
+                    {
+                        "id": runner["id"],
+                        "ip_address": runner["ip_address"],
+                        "attributes": vars(gl.runners.get(runner["id"]))["_attrs"],
+                    }
+                    for runner in runners
+                ]
             except Exception as e:
                 raise AnsibleParserError(
                     f"Unable to fetch hosts from GitLab API, this was the original exception: {e}"
                 ) from e
 
+    def _populate(self, runners=None):
+        if runners is None:
+            runners = self._get_runners()
+        try:
+            self.inventory.add_group("gitlab_runners")
+            for runner in runners:
+                host = make_unsafe(str(runner["id"]))
+                host_attrs = make_unsafe(runner["attributes"])
+                self.inventory.add_host(host, group="gitlab_runners")
+                self.inventory.set_variable(host, "ansible_host", make_unsafe(runner["ip_address"]))
+                if self.get_option("verbose_output", True):
+                    self.inventory.set_variable(host, "gitlab_runner_attributes", host_attrs)
+
+                # Use constructed if applicable
+                strict = self.get_option("strict")
+                # Composed variables
+                self._set_composite_vars(self.get_option("compose"), host_attrs, host, strict=strict)
+                # Complex groups based on jinja2 conditionals, hosts that meet the conditional are added to group
+                self._add_host_to_composed_groups(self.get_option("groups"), host_attrs, host, strict=strict)
+                # Create groups based on variable values and add the corresponding hosts to it
+                self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_attrs, host, strict=strict)
+        except Exception as e:
+            raise AnsibleParserError(
+                f"Unable to populate the inventory from the GitLab runners, this was the original exception: {e}"
+            ) from e
+
     def verify_file(self, path):
         """Return the possibly of a file being consumable by this plugin."""
         return super().verify_file(path) and path.endswith(("gitlab_runners.yaml", "gitlab_runners.yml"))
@@ -138,4 +167,4 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             )
         super().parse(inventory, loader, path, cache)
         self._read_config_data(path)
-        self._populate()
+        self._populate(InventoryCache(self, path, cache).get(self._get_runners))
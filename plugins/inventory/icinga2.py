@@ -15,6 +15,7 @@ description:
   - Uses a configuration file as an inventory source, it must end in C(.icinga2.yml) or C(.icinga2.yaml).
 extends_documentation_fragment:
   - ansible.builtin.constructed
+  - ansible.builtin.inventory_cache
 options:
   strict:
     version_added: 4.4.0
@@ -65,6 +66,16 @@ options:
     type: boolean
     default: true
     version_added: 8.4.0
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -98,12 +109,13 @@ from urllib.error import HTTPError
 
 from ansible.errors import AnsibleParserError
 from ansible.module_utils.urls import open_url
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Host inventory parser for ansible using Icinga2 as source."""
 
     NAME = "community.general.icinga2"
@@ -202,7 +214,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         host_dict = self._post_request(query_hosts_url, data_dict)
         return host_dict["results"]
 
-    def get_inventory_from_icinga(self):
+    def _get_hosts(self):
         """Query for all hosts"""
         self.display.vvv("Querying Icinga2 for inventory")
         query_args = {
@@ -222,7 +234,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         if self.host_filter is not None:
             query_args["host_filter"] = self.host_filter
         # Icinga2 API Call
-        results_json = self._query_hosts(**query_args)
+        return self._query_hosts(**query_args)
+
+    def get_inventory_from_icinga(self, results_json=None):
+        """Convert all hosts to inventory, querying them unless they are given"""
+        if results_json is None:
+            results_json = self._get_hosts()
         # Manipulate returned API data to Ansible inventory spec
         ansible_inv = self._convert_inv(results_json)
         return ansible_inv
@@ -233,8 +250,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         self._add_host_to_keyed_groups(self.get_option("keyed_groups"), variables, name, strict=strict)
         self._set_composite_vars(self.get_option("compose"), variables, name, strict=strict)
 
-    def _populate(self):
-        groups = self._to_json(self.get_inventory_from_icinga())
+    def _populate(self, hosts=None):
+        groups = self._to_json(self.get_inventory_from_icinga(hosts))
         return groups
 
     def _to_json(self, in_dict):
@@ -304,12 +321,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         self.icinga2_url = f"{self.icinga2_url.rstrip('/')}/v1"
 
-        # Not currently enabled
-        # self.cache_key = self.get_cache_key(path)
-        # self.use_cache = cache and self.get_option('cache')
+        def get_hosts():
+            # Test connection to API
+            self._api_connect()
+            return self._get_hosts()
 
-        # Test connection to API
-        self._api_connect()
+        hosts = InventoryCache(self, path, cache).get(get_hosts)
 
         # Call our internal helper to populate the dynamic inventory
-        self._populate()
+        self._populate(hosts)
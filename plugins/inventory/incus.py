@@ -15,6 +15,16 @@ requirements:
 description:
   - Get inventory hosts from the Incus container and virtual-machine manager.
 options:
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
   plugin:
     description:
       - The name of this plugin, it should always be set to community.general.incus for this plugin to work.
@@ -54,6 +64,7 @@ options:
     default: ["local"]
 extends_documentation_fragment:
   - ansible.builtin.constructed
+  - ansible.builtin.inventory_cache
 """
 
 EXAMPLES = r"""
@@ -82,18 +93,27 @@ plugin: community.general.incus
 remotes:
   - remote-1
   - remote-2:default
+---
+# Cache the instances for ten minutes
+plugin: community.general.incus
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/incus_inventory
+cache_timeout: 600
 """
 
 from json import loads
 from subprocess import check_output
 
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible.utils.display import Display
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
+
 display = Display()
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Host inventory parser for Incus."""
 
     NAME = "community.general.incus"
@@ -117,31 +137,21 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         self._read_config_data(path)
 
-        self.populate()
+        self.populate(InventoryCache(self, path, cache).get(self._get_instances))
 
-    def populate(self):
-        # Create top-level "incus" group if missing.
-        default_groups = self.get_option("default_groups")
-        if default_groups:
-            self.inventory.add_group("incus")
+    @staticmethod
+    def _split_remote(remote):
+        # Split the remote name from the project name (if specified).
+        fields = remote.split(":", 1)
+        if len(fields) == 2:
+            return fields[0], fields[1]
+        return fields[0], ""
 
+    def _get_instances(self):
+        """Return the instances of every remote, as {remote: {project: instances}}."""
+        instances = {}
         for remote in self.get_option("remotes"):
-            # Split the remote name from the project name (if specified).
-            remote_name = ""
-            project_name = ""
-
-            fields = remote.split(":", 1)
-            if len(fields) == 2:
-                remote_name = fields[0]
-                project_name = fields[1]
-            else:
-                remote_name = fields[0]
-
-            # Create the remote-specific group if missing.
-            group_remote = f"incus_{remote_name}"
-            if default_groups:
-                self.inventory.add_group(group_remote)
-                self.inventory.add_child("incus", group_remote)
+            remote_name, project_name = self._split_remote(remote)
 
             # Get a list of projects.
             projects = []
@@ -151,21 +161,44 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 projects = [entry["name"] for entry in self._run_incus("project", "list", f"{remote_name}:")]
 
             # Get a list of instances.
+            instances[remote] = {}
             for project in projects:
-                # Create the project-specific group if missing.
-                group_project = f"{group_remote}_{project}"
-                if default_groups:
-                    self.inventory.add_group(group_project)
-                    self.inventory.add_child(group_remote, group_project)
-
-                # List the instances.
                 list_cmd = [
                     "list",
                     f"{remote_name}:",
                     "--project",
                     project,
                 ] + self.get_option("filters")
-                for instance in self._run_incus(*list_cmd):
+                instances[remote][project] = self._run_incus(*list_cmd)
+
+        return instances
+
+    def populate(self, instances=None):
+        if instances is None:
+            instances = self._get_instances()
+
+        # Create top-level "incus" group if missing.
+        default_groups = self.get_option("default_groups")
+        if default_groups:
+            self.inventory.add_group("incus")
+
+        for remote, projects in instances.items():
+            remote_name = self._split_remote(remote)[0]
+
+            # Create the remote-specific group if missing.
+            group_remote = f"incus_{remote_name}"
+            if default_groups:
+                self.inventory.add_group(group_remote)
+                self.inventory.add_child("incus", group_remote)
+
+            for project, project_instances in projects.items():
+                # Create the project-specific group if missing.
+                group_project = f"{group_remote}_{project}"
+                if default_groups:
+                    self.inventory.add_group(group_project)
+                    self.inventory.add_child(group_remote, group_project)
+
+                for instance in project_instances:
                     # Compute the host name.
                     host_name = instance["name"]
                     if self.get_option("host_fqdn"):
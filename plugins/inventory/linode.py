@@ -127,6 +127,7 @@ compose:
 from ansible.errors import AnsibleError
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 try:
@@ -272,25 +273,16 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         self._read_config_data(path)
 
-        cache_key = self.get_cache_key(path)
-
-        if cache:
-            cache = self.get_option("cache")
-
-        update_cache = False
-        if cache:
-            try:
-                self.instances = [Instance(None, i["id"], i) for i in self._cache[cache_key]]
-            except KeyError:
-                update_cache = True
+        inventory_cache = InventoryCache(self, path, cache)
+        cached_instances = inventory_cache.read()
 
         # Check for None rather than False in order to allow
         # for empty sets of cached instances
-        if self.instances is None:
+        if cached_instances is not None:
+            self.instances = [Instance(None, i["id"], i) for i in cached_instances]
+        else:
             self._build_client(loader)
             self._get_instances_inventory()
-
-        if update_cache:
-            self._cache[cache_key] = self._cacheable_inventory()
+            inventory_cache.write(self._cacheable_inventory())
 
         self.populate()
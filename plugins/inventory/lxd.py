@@ -15,7 +15,19 @@ author: "Frank Dornheim (@conloos)"
 requirements:
   - ipaddress
   - lxd >= 4.0
+extends_documentation_fragment:
+  - ansible.builtin.inventory_cache
 options:
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
   plugin:
     description: Token that ensures this is a source file for the 'lxd' plugin.
     type: string
@@ -103,6 +115,15 @@ options:
         C(type), C(vlanid).
       - See example for syntax.
     type: dict
+  max_workers:
+    description:
+      - Maximum number of concurrent requests sent to the lxd server.
+      - The instances and their states are fetched with a single request when the server supports it, otherwise one
+        request per instance is sent. Network states are always fetched with one request per network.
+      - Set to V(1) to send the requests one after the other.
+    type: int
+    default: 8
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -117,6 +138,15 @@ plugin: community.general.lxd
 url: unix:/var/snap/lxd/common/lxd/unix.socket
 state: RUNNING
 
+---
+# lxd.yml caching the inventory for an hour
+plugin: community.general.lxd
+url: unix:/var/snap/lxd/common/lxd/unix.socket
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/lxd_inventory
+cache_timeout: 3600
+
 ---
 # simple lxd.yml including virtual machines and containers
 plugin: community.general.lxd
@@ -166,18 +196,22 @@ groupby:
     attribute: internals
 """
 
+import copy
 import json
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
 
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.module_utils.common.dict_transformations import dict_merge
 from ansible.module_utils.common.text.converters import to_native, to_text
-from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable
 
 from ansible_collections.community.general.plugins.module_utils._lxd import LXDClient, LXDClientException
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 IPADDRESS_IMPORT_ERROR: ImportError | None
@@ -189,12 +223,19 @@ else:
     IPADDRESS_IMPORT_ERROR = None
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Cacheable):
     DEBUG = 4
     NAME = "community.general.lxd"
     SNAP_SOCKET_URL = "unix:/var/snap/lxd/common/lxd/unix.socket"
     SOCKET_URL = "unix:/var/lib/lxd/unix.socket"
 
+    def __init__(self):
+        super().__init__()
+        self.max_workers = 1
+        self._executor = None
+        self._local = threading.local()
+        self._worker_sockets = []
+
     @staticmethod
     def load_json_data(path):
         """Load json data
@@ -313,6 +354,78 @@ class InventoryModule(BaseInventoryPlugin):
                 error_storage[url] = err
         raise AnsibleError(f"No connection to the socket: {error_storage}")
 
+    def _get_socket(self):
+        """get the lxd socket of the current thread
+
+        Connections cannot be shared between threads, so every worker thread
+        opens its own connection on its first request. These connections are
+        closed by _stop_workers().
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            AnsibleError
+        Returns:
+            LXDClient(socket): connection of the current thread"""
+        if threading.current_thread() is threading.main_thread():
+            return self.socket
+        socket_connection = getattr(self._local, "socket", None)
+        if socket_connection is None:
+            socket_connection = self._local.socket = self._connect_to_socket()
+            self._worker_sockets.append(socket_connection)
+        return socket_connection
+
+    def _start_workers(self):
+        """start the thread pool used by _map
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            None
+        Returns:
+            None"""
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _stop_workers(self):
+        """shut the thread pool down and close the connections of its threads
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            None
+        Returns:
+            None"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for socket_connection in self._worker_sockets:
+            socket_connection.connection.close()
+        self._worker_sockets = []
+
+    def _map(self, func, items):
+        """apply func to items, concurrently if the thread pool is started
+
+        Args:
+            callable(func): function to apply
+            list(items): arguments of the calls
+        Kwargs:
+            None
+        Raises:
+            None
+        Returns:
+            list(results): results, in the order of items"""
+        items = list(items)
+        if self._executor is None or len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._executor.map(func, items))
+
     def _get_networks(self):
         """Get Networknames
 
@@ -336,39 +449,6 @@ class InventoryModule(BaseInventoryPlugin):
         network_configs = self.socket.do("GET", "/1.0/networks")
         return [m.split("/")[3] for m in network_configs["metadata"]]
 
-    def _get_instances(self):
-        """Get instancenames
-
-        Returns all instancenames
-
-        Args:
-            None
-        Kwargs:
-            None
-        Raises:
-            None
-        Returns:
-            list(names): names of all instances"""
-        # e.g. {
-        #        "metadata": [
-        #          "/1.0/instances/foo",
-        #          "/1.0/instances/bar"
-        #        ],
-        #        "status": "Success",
-        #        "status_code": 200,
-        #        "type": "sync"
-        #      }
-        url = "/1.0/instances"
-        if self.project:
-            url = f"{url}?{urlencode(dict(project=self.project))}"
-
-        instances = self.socket.do("GET", url)
-
-        if self.project:
-            return [m.split("/")[3].split("?")[0] for m in instances["metadata"]]
-
-        return [m.split("/")[3] for m in instances["metadata"]]
-
     def _get_config(self, branch, name):
         """Get inventory of instance
 
@@ -388,20 +468,58 @@ class InventoryModule(BaseInventoryPlugin):
         config = {}
         if isinstance(branch, (tuple, list)):
             config[name] = {
-                branch[1]: self.socket.do(
+                branch[1]: self._get_socket().do(
                     "GET",
                     f"/1.0/{to_native(branch[0])}/{to_native(name)}/{to_native(branch[1])}?{urlencode(dict(project=self.project))}",
                 )
             }
         else:
             config[name] = {
-                branch: self.socket.do(
+                branch: self._get_socket().do(
                     "GET", f"/1.0/{to_native(branch)}/{to_native(name)}?{urlencode(dict(project=self.project))}"
                 )
             }
         return config
 
-    def get_instance_data(self, names):
+    def _get_instances_recursive(self):
+        """Get instance configs and states in one request
+
+        Uses recursion=2, which returns the full instance objects including their state.
+        Servers without support for it return the instance configs (recursion=1) or only
+        their names, in which case the missing branches are left out.
+
+        Args:
+            None
+        Kwargs:
+            None
+        Source:
+            https://documentation.ubuntu.com/lxd/en/latest/api/#/instances/instances_get
+        Raises:
+            None
+        Returns:
+            dict(instances): {name: {"instances": config, "state": state}}"""
+        params = dict(recursion=2)
+        if self.project:
+            params["project"] = self.project
+        response = self.socket.do("GET", f"/1.0/instances?{urlencode(params)}")
+
+        instances = {}
+        for instance in response["metadata"]:
+            if not isinstance(instance, dict):
+                # e.g. /1.0/instances/foo?project=default
+                instances[instance.split("/")[3].split("?")[0]] = {}
+                continue
+            instance = dict(instance)
+            state = instance.pop("state", None)
+            # only returned with recursion, not part of /1.0/instances/<name>
+            instance.pop("snapshots", None)
+            instance.pop("backups", None)
+            instances[instance["name"]] = {"instances": dict(response, metadata=instance)}
+            if state is not None:
+                instances[instance["name"]]["state"] = dict(response, metadata=state)
+        return instances
+
+    def get_instance_data(self, names, branches=None):
         """Create Inventory of the instance
 
         Iterate through the different branches of the instances and collect Information.
@@ -409,19 +527,41 @@ class InventoryModule(BaseInventoryPlugin):
         Args:
             list(names): List of instance names
         Kwargs:
-            None
+            list(branches): Branches to collect, defaults to the config and the state
         Raises:
             None
         Returns:
             None"""
         # tuple(('instances','metadata/templates')) to get section in branch
         # e.g. /1.0/instances/<name>/metadata/templates
-        branches = ["instances", ("instances", "state")]
-        instance_config = {}
-        for branch in branches:
-            for name in names:
-                instance_config["instances"] = self._get_config(branch, name)
-                self.data = dict_merge(instance_config, self.data)
+        if branches is None:
+            branches = ["instances", ("instances", "state")]
+        instances = self.data.setdefault("instances", {})
+        configs = self._map(lambda request: self._get_config(*request), [(b, n) for b in branches for n in names])
+        for config in configs:
+            for name, instance_config in config.items():
+                instances.setdefault(name, {}).update(instance_config)
+
+    def get_all_instance_data(self):
+        """Create Inventory of all instances
+
+        Fetch all instances with their state in one request when the server supports it,
+        and fall back to one request per instance and missing branch otherwise.
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            None
+        Returns:
+            None"""
+        instances = self._get_instances_recursive()
+        self.data.setdefault("instances", {}).update(instances)
+        for branch, key in (("instances", "instances"), (("instances", "state"), "state")):
+            names = [name for name, instance in instances.items() if key not in instance]
+            if names:
+                self.get_instance_data(names, branches=[branch])
 
     def get_network_data(self, names):
         """Create Inventory of the instance
@@ -439,14 +579,17 @@ class InventoryModule(BaseInventoryPlugin):
         # tuple(('instances','metadata/templates')) to get section in branch
         # e.g. /1.0/instances/<name>/metadata/templates
         branches = [("networks", "state")]
-        network_config = {}
-        for branch in branches:
-            for name in names:
-                try:
-                    network_config["networks"] = self._get_config(branch, name)
-                except LXDClientException:
-                    network_config["networks"] = {name: None}
-                self.data = dict_merge(network_config, self.data)
+
+        def get_config(request):
+            branch, name = request
+            try:
+                return self._get_config(branch, name)
+            except LXDClientException:
+                return {name: None}
+
+        networks = self.data.setdefault("networks", {})
+        for config in self._map(get_config, [(b, n) for b in branches for n in names]):
+            networks.update(config)
 
     def extract_network_information_from_instance_config(self, instance_name):
         """Returns the network interface configuration
@@ -1129,6 +1272,29 @@ class InventoryModule(BaseInventoryPlugin):
             if self._get_data_entry(f"instances/{instance_name}/instances/metadata/type") != self.type_filter:
                 del self.data["instances"][instance_name]
 
+    def _fetch_data(self):
+        """Fetch the instances and networks
+
+        Returns the raw instance and network data from the lxd server
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            AnsibleError
+        Returns:
+            dict(data): instances and networks"""
+        self.data = {}
+        self.socket = self._connect_to_socket()
+        self._start_workers()
+        try:
+            self.get_all_instance_data()
+            self.get_network_data(self._get_networks())
+        finally:
+            self._stop_workers()
+        return self.data
+
     def _populate(self):
         """Return the hosts and groups
 
@@ -1144,9 +1310,7 @@ class InventoryModule(BaseInventoryPlugin):
             None"""
 
         if len(self.data) == 0:  # If no data is injected by unittests open socket
-            self.socket = self._connect_to_socket()
-            self.get_instance_data(self._get_instances())
-            self.get_network_data(self._get_networks())
+            self.data = self._fetch_data()
 
         # The first version of the inventory only supported containers.
         # This will change in the future.
@@ -1203,7 +1367,11 @@ class InventoryModule(BaseInventoryPlugin):
                 self.filter = self.get_option("state").lower()
             self.trust_password = self.get_option("trust_password")
             self.url = self.get_option("url")
+            self.max_workers = self.get_option("max_workers")
         except Exception as err:
             raise AnsibleParserError(f"All correct options required: {err}") from err
+
+        # the data is modified while building the inventory, keep the cached copy intact
+        self.data = copy.deepcopy(InventoryCache(self, path, cache).get(self._fetch_data))
         # Call our internal helper to populate the dynamic inventory
         self._populate()
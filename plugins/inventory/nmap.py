@@ -161,6 +161,7 @@ from ansible.module_utils.common.text.converters import to_native, to_text
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible.utils.display import Display
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 display = Display()
@@ -218,25 +219,10 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         self._read_config_data(path)
 
-        cache_key = self.get_cache_key(path)
+        inventory_cache = InventoryCache(self, path, cache)
+        results = inventory_cache.read()
 
-        # cache may be True or False at this point to indicate if the inventory is being refreshed
-        # get the user's cache option too to see if we should save the cache if it is changing
-        user_cache_setting = self.get_option("cache")
-
-        # read if the user has caching enabled and the cache isn't being refreshed
-        attempt_to_read_cache = user_cache_setting and cache
-        # update if the user has caching enabled and the cache is being refreshed; update this value to True if the cache has expired below
-        cache_needs_update = user_cache_setting and not cache
-
-        if attempt_to_read_cache:
-            try:
-                results = self._cache[cache_key]
-            except KeyError:
-                # This occurs if the cache_key is not in the cache or if the cache_key expired, so the cache needs to be updated
-                cache_needs_update = True
-
-        if not user_cache_setting or cache_needs_update:
+        if results is None:
             # setup command
             cmd = [self._nmap]
 
@@ -349,7 +335,6 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             except Exception as e:
                 raise AnsibleParserError(f"failed to parse {to_native(path)}: {e} ") from e
 
-        if cache_needs_update:
-            self._cache[cache_key] = results
+            inventory_cache.write(results)
 
         self._populate(results)
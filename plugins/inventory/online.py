@@ -11,7 +11,19 @@ author:
 short_description: Scaleway (previously Online SAS or Online.net) inventory source
 description:
   - Get inventory hosts from Scaleway (previously Online SAS or Online.net).
+extends_documentation_fragment:
+  - ansible.builtin.inventory_cache
 options:
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
   plugin:
     description: Token that ensures this is a source file for the P(community.general.online#inventory) plugin.
     type: string
@@ -67,12 +79,13 @@ from ansible.errors import AnsibleError
 from ansible.module_utils.ansible_release import __version__ as ansible_version
 from ansible.module_utils.common.text.converters import to_text
 from ansible.module_utils.urls import open_url
-from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Cacheable):
     NAME = "community.general.online"
     API_ENDPOINT = "https://api.online.net"
 
@@ -224,6 +237,25 @@ class InventoryModule(BaseInventoryPlugin):
             self.inventory.add_group(group=group)
             self.inventory.add_host(group=group, host=hostname)
 
+    def _get_servers(self, with_rpn_groups):
+        servers_url = urljoin(InventoryModule.API_ENDPOINT, "api/v1/server")
+        servers_api_path = self._fetch_information(url=servers_url)
+
+        rpn_list = None
+        if with_rpn_groups:
+            rpn_groups_url = urljoin(InventoryModule.API_ENDPOINT, "api/v1/rpn/group")
+            rpn_list = self._fetch_information(url=rpn_groups_url)
+
+        servers = []
+        for server_api_path in servers_api_path:
+            server_url = urljoin(InventoryModule.API_ENDPOINT, server_api_path)
+            raw_server_info = self._fetch_information(url=server_url)
+
+            if raw_server_info is not None:
+                servers.append(raw_server_info)
+
+        return {"servers": servers, "rpn_groups": rpn_list}
+
     def parse(self, inventory, loader, path, cache=True):
         super().parse(inventory, loader, path)
         self._read_config_data(path=path)
@@ -253,21 +285,15 @@ class InventoryModule(BaseInventoryPlugin):
             "Content-type": "application/json",
         }
 
-        servers_url = urljoin(InventoryModule.API_ENDPOINT, "api/v1/server")
-        servers_api_path = self._fetch_information(url=servers_url)
-
-        if "rpn" in group_preferences:
-            rpn_groups_url = urljoin(InventoryModule.API_ENDPOINT, "api/v1/rpn/group")
-            rpn_list = self._fetch_information(url=rpn_groups_url)
-            self.rpn_lookup_cache = self.extract_rpn_lookup_cache(rpn_list)
-
-        for server_api_path in servers_api_path:
-            server_url = urljoin(InventoryModule.API_ENDPOINT, server_api_path)
-            raw_server_info = self._fetch_information(url=server_url)
+        # the RPN groups are only fetched, and cached, when needed
+        data = InventoryCache(self, path, cache).get(
+            lambda: self._get_servers("rpn" in group_preferences),
+            validate=lambda data: "rpn" not in group_preferences or data["rpn_groups"] is not None,
+        )
 
-            if raw_server_info is None:
-                continue
+        self.rpn_lookup_cache = self.extract_rpn_lookup_cache(data["rpn_groups"] or [])
 
+        for raw_server_info in data["servers"]:
             self.do_server_inventory(
                 host_infos=raw_server_info,
                 hostname_preferences=hostname_preferences,
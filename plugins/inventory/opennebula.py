@@ -13,6 +13,7 @@ short_description: OpenNebula inventory source
 version_added: "3.8.0"
 extends_documentation_fragment:
   - ansible.builtin.constructed
+  - ansible.builtin.inventory_cache
   - community.library_inventory_filtering_v1.inventory_filter
 description:
   - Get inventory hosts from OpenNebula cloud.
@@ -82,6 +83,16 @@ options:
   filters:
     # This option is provided by the community.library_inventory_filtering_v1.inventory_filter doc fragment
     version_added: 13.2.0
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -144,12 +155,13 @@ import os
 from dataclasses import dataclass
 
 from ansible.errors import AnsibleError
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible_collections.community.library_inventory_filtering_v1.plugins.plugin_utils.inventory_filter import (
     filter_host,
     parse_filters,
 )
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 
@@ -160,7 +172,7 @@ class AuthParams:
     password: str
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     NAME = "community.general.opennebula"
 
     def verify_file(self, path):
@@ -301,7 +313,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             return None
         return port
 
-    def _populate(self):
+    def _populate(self, servers=None):
         hostname_preference = self.get_option("hostname")
         prefer_existing_ansible_host = self.get_option("prefer_existing_ansible_host")
         group_by_labels = self.get_option("group_by_labels")
@@ -311,8 +323,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         # Add a top group 'one'
         self.inventory.add_group(group="all")
 
-        filter_by_label = self.get_option("filter_by_label")
-        servers = self._retrieve_servers(filter_by_label)
+        if servers is None:
+            servers = self._retrieve_servers(self.get_option("filter_by_label"))
         for server in servers:
             server = make_unsafe(server)
             hostname = server["name"]
@@ -356,4 +368,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         super().parse(inventory, loader, path)
         self._read_config_data(path=path)
 
-        self._populate()
+        servers = InventoryCache(self, path, cache).get(
+            lambda: self._retrieve_servers(self.get_option("filter_by_label"))
+        )
+        self._populate(servers)
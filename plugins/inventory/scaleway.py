@@ -13,7 +13,19 @@ description:
   - Get inventory hosts from Scaleway.
 requirements:
   - PyYAML
+extends_documentation_fragment:
+  - ansible.builtin.inventory_cache
 options:
+  cache:
+    version_added: 13.3.0
+  cache_plugin:
+    version_added: 13.3.0
+  cache_timeout:
+    version_added: 13.3.0
+  cache_connection:
+    version_added: 13.3.0
+  cache_prefix:
+    version_added: 13.3.0
   plugin:
     description: Token that ensures this is a source file for the 'scaleway' plugin.
     required: true
@@ -75,6 +87,15 @@ options:
     description: 'Set individual variables: keys are variable names and values are templates. Any value returned by the L(Scaleway
       API, https://developer.scaleway.com/#servers-server-get) can be used.'
     type: dict
+  max_workers:
+    description:
+      - Maximum number of concurrent requests sent to the Scaleway API.
+      - The zones are fetched concurrently. When the first response of a zone tells the number of pages, the remaining
+        pages are fetched concurrently as well.
+      - Set to V(1) to send the requests one after the other.
+    type: int
+    default: 8
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -106,6 +127,16 @@ regions:
 variables:
   ansible_host: public_ip.address
 
+---
+# cache the servers of all zones for an hour
+plugin: community.general.scaleway
+hostnames:
+  - hostname
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/scaleway_inventory
+cache_timeout: 3600
+
 ---
 # Using static strings as variables
 plugin: community.general.scaleway
@@ -119,6 +150,7 @@ variables:
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 YAML_IMPORT_ERROR: ImportError | None
 try:
@@ -133,40 +165,68 @@ import urllib.parse as urllib_parse
 from ansible.errors import AnsibleError
 from ansible.module_utils.common.text.converters import to_text
 from ansible.module_utils.urls import open_url
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
 from ansible_collections.community.general.plugins.module_utils._scaleway import (
     SCALEWAY_LOCATION,
     parse_pagination_link,
 )
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
 
-def _fetch_information(token, url):
-    results = []
+def _fetch_page(token, url):
+    """Return the servers of one page and the pagination relations of the response."""
+    try:
+        response = open_url(url, headers={"X-Auth-Token": token, "Content-type": "application/json"})
+    except Exception as e:
+        raise AnsibleError(f"Error while fetching {url}: {e}") from e
+    try:
+        raw_json = json.loads(to_text(response.read()))
+    except ValueError as e:
+        raise AnsibleError("Incorrect JSON payload") from e
+
+    try:
+        servers = raw_json["servers"]
+    except KeyError as e:
+        raise AnsibleError("Incorrect format from the Scaleway API response") from e
+
+    link = response.headers["Link"]
+    return servers, parse_pagination_link(link) if link else {}
+
+
+def _page_urls(url, relations):
+    """Return the URLs of the pages after the first one, if the last page is known."""
+    if "last" not in relations:
+        return None
+    last_url = urllib_parse.urlsplit(urllib_parse.urljoin(url, relations["last"]))
+    query = urllib_parse.parse_qs(last_url.query)
+    try:
+        last_page = int(query["page"][0])
+    except (KeyError, ValueError):
+        return None
+    urls = []
+    for page in range(2, last_page + 1):
+        query["page"] = [str(page)]
+        urls.append(urllib_parse.urlunsplit(last_url._replace(query=urllib_parse.urlencode(query, doseq=True))))
+    return urls
+
+
+def _fetch_information(token, url, map_func=map):
+    results, relations = _fetch_page(token, url)
+
+    page_urls = _page_urls(url, relations)
+    if page_urls is not None:
+        for servers, dummy in map_func(lambda page_url: _fetch_page(token, page_url), page_urls):
+            results.extend(servers)
+        return results
+
     paginated_url = url
-    while True:
-        try:
-            response = open_url(paginated_url, headers={"X-Auth-Token": token, "Content-type": "application/json"})
-        except Exception as e:
-            raise AnsibleError(f"Error while fetching {url}: {e}") from e
-        try:
-            raw_json = json.loads(to_text(response.read()))
-        except ValueError as e:
-            raise AnsibleError("Incorrect JSON payload") from e
-
-        try:
-            results.extend(raw_json["servers"])
-        except KeyError as e:
-            raise AnsibleError("Incorrect format from the Scaleway API response") from e
-
-        link = response.headers["Link"]
-        if not link:
-            return results
-        relations = parse_pagination_link(link)
-        if "next" not in relations:
-            return results
+    while "next" in relations:
         paginated_url = urllib_parse.urljoin(paginated_url, relations["next"])
+        servers, relations = _fetch_page(token, paginated_url)
+        results.extend(servers)
+    return results
 
 
 def _build_server_url(api_endpoint):
@@ -231,7 +291,7 @@ extractors = {
 }
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     NAME = "community.general.scaleway"
 
     def _fill_host_variables(self, host, server_info):
@@ -285,12 +345,25 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         return None
 
-    def do_zone_inventory(self, zone, token, tags, hostname_preferences):
-        self.inventory.add_group(zone)
-        zone_info = SCALEWAY_LOCATION[zone]
+    def _fetch_zones(self, zones, token):
+        """Return the servers of every zone, fetching the zones and their pages concurrently."""
+        max_workers = self.get_option("max_workers")
 
-        url = _build_server_url(zone_info["api_endpoint"])
-        raw_zone_hosts_infos = make_unsafe(_fetch_information(url=url, token=token))
+        def fetch_zone(zone, map_func=map):
+            url = _build_server_url(SCALEWAY_LOCATION[zone]["api_endpoint"])
+            return _fetch_information(url=url, token=token, map_func=map_func)
+
+        if max_workers <= 1:
+            return {zone: fetch_zone(zone) for zone in zones}
+
+        # zones and pages use separate pools, so that zones waiting for their pages cannot starve them
+        with ThreadPoolExecutor(max_workers=max_workers) as page_executor:
+            with ThreadPoolExecutor(max_workers=max_workers) as zone_executor:
+                results = zone_executor.map(lambda zone: fetch_zone(zone, page_executor.map), zones)
+                return dict(zip(zones, results))
+
+    def do_zone_inventory(self, zone, raw_zone_hosts_infos, tags, hostname_preferences):
+        self.inventory.add_group(zone)
 
         for host_infos in raw_zone_hosts_infos:
             hostname = self._filter_host(host_infos=host_infos, hostname_preferences=hostname_preferences)
@@ -344,14 +417,26 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         config_zones = self.get_option("regions")
         tags = self.get_option("tags")
-        token = self.get_oauth_token()
-        if not token:
-            raise AnsibleError(
-                "'oauth_token' value is null, you must configure it either in inventory, envvars or scaleway-cli config."
-            )
         hostname_preference = self.get_option("hostnames")
+        zones = sorted(self._get_zones(config_zones))
+
+        def fetch_zones():
+            token = self.get_oauth_token()
+            if not token:
+                raise AnsibleError(
+                    "'oauth_token' value is null, you must configure it either in inventory, envvars or scaleway-cli config."
+                )
+            return self._fetch_zones(zones, token)
+
+        # the cache is only valid for the zones it was built for
+        zones_hosts_infos = InventoryCache(self, path, cache).get(
+            fetch_zones, validate=lambda cached: sorted(cached) == zones
+        )
 
-        for zone in self._get_zones(config_zones):
+        for zone in zones:
             self.do_zone_inventory(
-                zone=make_unsafe(zone), token=token, tags=tags, hostname_preferences=hostname_preference
+                zone=make_unsafe(zone),
+                raw_zone_hosts_infos=make_unsafe(zones_hosts_infos[zone]),
+                tags=tags,
+                hostname_preferences=hostname_preference,
             )
@@ -72,6 +72,7 @@ groups:
 """
 
 import os
+import re
 from collections.abc import MutableMapping
 from subprocess import PIPE, Popen
 
@@ -80,8 +81,12 @@ from ansible.module_utils.common.process import get_bin_path
 from ansible.module_utils.common.text.converters import to_bytes, to_text
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
 
+GUEST_PROPERTY_RE = re.compile(r"^(?P<name>\S+)\s+= '(?P<value>.*)' @ \S+")
+OLD_GUEST_PROPERTY_RE = re.compile(r"^Name: (?P<name>.+?), value: (?P<value>.*), timestamp: \d+, flags:")
+
 
 class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Host inventory parser for ansible using local virtualbox."""
@@ -91,26 +96,48 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     def __init__(self):
         self._vbox_path = None
+        self._guest_properties = {}
         super().__init__()
 
+    def _get_guest_properties(self, host):
+        # all properties of a VM are read with a single command, instead of
+        # running one command per queried property
+        if host not in self._guest_properties:
+            properties = {}
+            try:
+                cmd = [
+                    self._vbox_path,
+                    b"guestproperty",
+                    b"enumerate",
+                    to_bytes(host, errors="surrogate_or_strict"),
+                ]
+                x = Popen(cmd, stdout=PIPE)
+                output = to_text(x.stdout.read(), errors="surrogate_or_strict")
+                x.wait()
+                properties = self._parse_guest_properties(output)
+            except Exception:
+                pass
+            self._guest_properties[host] = properties
+        return self._guest_properties[host]
+
+    @staticmethod
+    def _parse_guest_properties(output):
+        properties = {}
+        for line in output.splitlines():
+            # VirtualBox 7.0 and later:
+            #   /VirtualBox/GuestInfo/Net/0/V4/IP = '10.0.2.15' @ 2024-01-01T10:00:00.000000000Z
+            # older releases:
+            #   Name: /VirtualBox/GuestInfo/Net/0/V4/IP, value: 10.0.2.15, timestamp: 1704103200000000000, flags:
+            match = GUEST_PROPERTY_RE.match(line) or OLD_GUEST_PROPERTY_RE.match(line)
+            if match:
+                properties[match.group("name")] = match.group("value")
+        return properties
+
     def _query_vbox_data(self, host, property_path):
-        ret = None
-        try:
-            cmd = [
-                self._vbox_path,
-                b"guestproperty",
-                b"get",
-                to_bytes(host, errors="surrogate_or_strict"),
-                to_bytes(property_path, errors="surrogate_or_strict"),
-            ]
-            x = Popen(cmd, stdout=PIPE)
-            ipinfo = to_text(x.stdout.read(), errors="surrogate_or_strict")
-            if "Value" in ipinfo:
-                a, ip = ipinfo.split(":", 1)
-                ret = ip.strip()
-        except Exception:
-            pass
-        return ret
+        value = self._get_guest_properties(host).get(property_path)
+        if value is None:
+            return None
+        return value.strip()
 
     def _set_variables(self, hostvars):
         # set vars in inventory from hostvars
@@ -314,26 +341,18 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             raise AnsibleParserError(e) from e
 
         super().parse(inventory, loader, path)
-
-        cache_key = self.get_cache_key(path)
+        self._guest_properties = {}
 
         config_data = self._read_config_data(path)
 
         # set _options from config data
         self._consume_options(config_data)
 
-        source_data = None
-        if cache:
-            cache = self.get_option("cache")
-
-        update_cache = False
-        if cache:
-            try:
-                source_data = self._cache[cache_key]
-            except KeyError:
-                update_cache = True
+        inventory_cache = InventoryCache(self, path, cache)
+        source_data = inventory_cache.read()
+        using_current_cache = source_data is not None
 
-        if not source_data:
+        if not using_current_cache:
             b_pwfile = to_bytes(
                 self.get_option("settings_password_file"), errors="surrogate_or_strict", nonstring="passthru"
             )
@@ -357,8 +376,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
             source_data = p.stdout.read().splitlines()
 
-        using_current_cache = cache and not update_cache
         cacheable_results = self._populate_from_source(source_data, using_current_cache)
 
-        if update_cache:
-            self._cache[cache_key] = cacheable_results
+        if not using_current_cache:
+            inventory_cache.write(cacheable_results)
@@ -96,6 +96,7 @@ use_host_uuid: true
 
 import json
 import ssl
+from collections import Counter
 from time import sleep
 
 from ansible.errors import AnsibleError
@@ -205,24 +206,25 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         self._add_host_to_keyed_groups(self.get_option("keyed_groups"), variables, name, strict=strict)
         self._set_composite_vars(self.get_option("compose"), variables, name, strict=strict)
 
-    def _add_vms(self, vms, hosts, pools):
-        vm_name_list = []
+    @staticmethod
+    def _entry_name(name_counts, name_label):
+        """Return name_label, suffixed with the number of previous entries with the same name."""
+        count = name_counts[name_label]
+        name_counts[name_label] += 1
+        return f"{name_label}_{count}" if count else name_label
+
+    def _add_vms(self, vms, host_groups, pool_groups):
+        vm_name_counts = Counter()
         for uuid, vm in vms.items():
             if self.vm_entry_name_type == "name_label":
-                if vm["name_label"] not in vm_name_list:
-                    entry_name = vm["name_label"]
-                    vm_name_list.append(vm["name_label"])
-                else:
-                    vm_duplicate_count = vm_name_list.count(vm["name_label"])
-                    entry_name = f"{vm['name_label']}_{vm_duplicate_count}"
-                    vm_name_list.append(vm["name_label"])
+                entry_name = self._entry_name(vm_name_counts, vm["name_label"])
             else:
                 entry_name = uuid
             group = "with_ip"
             ip = vm.get("mainIpAddress")
             power_state = vm["power_state"].lower()
-            pool_name = self._pool_group_name_for_uuid(pools, vm["$poolId"])
-            host_name = self._host_group_name_for_uuid(hosts, vm["$container"])
+            pool_name = pool_groups.get(vm["$poolId"])
+            host_name = host_groups.get(vm["$container"])
 
             self.inventory.add_host(entry_name)
 
@@ -259,22 +261,16 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
             self._apply_constructable(entry_name, self.inventory.get_host(entry_name).get_vars())
 
-    def _add_hosts(self, hosts, pools):
-        host_name_list = []
-        for host in hosts.values():
+    def _add_hosts(self, hosts, host_groups, pool_groups):
+        host_name_counts = Counter()
+        for uuid, host in hosts.items():
             if self.host_entry_name_type == "name_label":
-                if host["name_label"] not in host_name_list:
-                    entry_name = host["name_label"]
-                    host_name_list.append(host["name_label"])
-                else:
-                    host_duplicate_count = host_name_list.count(host["name_label"])
-                    entry_name = f"{host['name_label']}_{host_duplicate_count}"
-                    host_name_list.append(host["name_label"])
+                entry_name = self._entry_name(host_name_counts, host["name_label"])
             else:
                 entry_name = host["uuid"]
 
-            group_name = f"xo_host_{clean_group_name(host['name_label'])}"
-            pool_name = self._pool_group_name_for_uuid(pools, host["$poolId"])
+            group_name = host_groups[uuid]
+            pool_name = pool_groups.get(host["$poolId"])
 
             self.inventory.add_group(group_name)
             self.inventory.add_host(entry_name)
@@ -292,28 +288,14 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             self.inventory.set_variable(entry_name, "power_state", host["power_state"].lower())
             self.inventory.set_variable(entry_name, "product_brand", host["productBrand"])
 
-        for pool in pools.values():
-            group_name = f"xo_pool_{clean_group_name(pool['name_label'])}"
-
+    def _add_pools(self, pool_groups):
+        for group_name in pool_groups.values():
             self.inventory.add_group(group_name)
 
-    def _add_pools(self, pools):
-        for pool in pools.values():
-            group_name = f"xo_pool_{clean_group_name(pool['name_label'])}"
-
-            self.inventory.add_group(group_name)
-
-    # TODO: Refactor
-    def _pool_group_name_for_uuid(self, pools, pool_uuid):
-        for pool in pools:
-            if pool == pool_uuid:
-                return f"xo_pool_{clean_group_name(pools[pool_uuid]['name_label'])}"
-
-    # TODO: Refactor
-    def _host_group_name_for_uuid(self, hosts, host_uuid):
-        for host in hosts:
-            if host == host_uuid:
-                return f"xo_host_{clean_group_name(hosts[host_uuid]['name_label'])}"
+    @staticmethod
+    def _group_names(objects, prefix):
+        """Map the uuids of pools or hosts to their group names."""
+        return {uuid: f"{prefix}{clean_group_name(obj['name_label'])}" for uuid, obj in objects.items()}
 
     def _populate(self, objects):
         # Prepare general groups
@@ -322,9 +304,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         for group in POWER_STATES:
             self.inventory.add_group(group.lower())
 
-        self._add_pools(objects["pools"])
-        self._add_hosts(objects["hosts"], objects["pools"])
-        self._add_vms(objects["vms"], objects["hosts"], objects["pools"])
+        pool_groups = self._group_names(objects["pools"], "xo_pool_")
+        host_groups = self._group_names(objects["hosts"], "xo_host_")
+
+        self._add_pools(pool_groups)
+        self._add_hosts(objects["hosts"], host_groups, pool_groups)
+        self._add_vms(objects["vms"], host_groups, pool_groups)
 
     def verify_file(self, path):
         valid = False
@@ -64,6 +64,18 @@ options:
     type: bool
     default: false
     version_added: 13.2.0
+  cache:
+    description:
+      - List the items once and look up all terms in that list, instead of running the Bitwarden CLI for each term.
+      - The list is filtered by O(collection_id), O(collection_name), and O(organization_id). It is kept in memory and
+        shared by the lookups of the same process that use the same filters and session. Lookups run in the worker process
+        of their task, so the list is shared by the items of a loop and by the lookups of a task.
+      - The list is listed again when O(sync=true).
+      - The items are matched on their O(search) field only. Without this option, the Bitwarden CLI search first selects the
+        items that match the term in one of the fields it searches, such as the name.
+    type: bool
+    default: false
+    version_added: 13.3.0
 """
 
 EXAMPLES = r"""
@@ -123,6 +135,7 @@ _raw:
   elements: list
 """
 
+from copy import deepcopy
 from subprocess import PIPE, Popen
 
 from ansible.errors import AnsibleError, AnsibleOptionsError
@@ -141,6 +154,9 @@ class Bitwarden:
     def __init__(self, path="bw"):
         self._cli_path = path
         self._session = None
+        self._items = {}
+        self._index = {}
+        self._collection_ids = {}
 
     @property
     def cli_path(self):
@@ -162,8 +178,14 @@ class Bitwarden:
 
     def sync(self):
         out, err = self._run(["sync"], stdin="")
+        self.clear_cache()
         return out
 
+    def clear_cache(self):
+        self._items = {}
+        self._index = {}
+        self._collection_ids = {}
+
     def _run(self, args, stdin=None, expected_rc=0):
         if self.session:
             args += ["--session", self.session]
@@ -211,13 +233,49 @@ class Bitwarden:
             if not search_value or not search_field or item.get(search_field) == search_value
         ]
 
-    def get_field(self, field, search_value, search_field="name", collection_id=None, organization_id=None):
+    def _list_items(self, collection_id=None, organization_id=None):
+        """Return all records, filtered by collection and organization, listing them only once."""
+        key = (self.session, collection_id, organization_id)
+        if key not in self._items:
+            params = ["list", "items"]
+            if collection_id:
+                params.extend(["--collectionid", collection_id])
+            if organization_id:
+                params.extend(["--organizationid", organization_id])
+
+            out, err = self._run(params)
+            self._items[key] = AnsibleJSONDecoder().raw_decode(out)[0]
+        return self._items[key]
+
+    def _get_cached_matches(self, search_value, search_field, collection_id=None, organization_id=None):
+        """Return records whose search_field is equal to key, from the list of all records."""
+        items = self._list_items(collection_id, organization_id)
+        if not search_value or not search_field:
+            return deepcopy(items)
+
+        key = (self.session, collection_id, organization_id, search_field)
+        if key not in self._index:
+            index = {}
+            for item in items:
+                value = item.get(search_field)
+                if isinstance(value, str):
+                    index.setdefault(value, []).append(item)
+            self._index[key] = index
+        # the cached records must not be modified by the callers
+        return deepcopy(self._index[key].get(search_value, []))
+
+    def get_field(
+        self, field, search_value, search_field="name", collection_id=None, organization_id=None, cache=False
+    ):
         """Return a list of the specified field for records whose search_field match search_value
         and filtered by collection if collection has been provided.
 
         If field is None, return the whole record for each match.
         """
-        matches = self._get_matches(search_value, search_field, collection_id, organization_id)
+        if cache:
+            matches = self._get_cached_matches(search_value, search_field, collection_id, organization_id)
+        else:
+            matches = self._get_matches(search_value, search_field, collection_id, organization_id)
         if not field:
             return matches
         field_matches = []
@@ -244,8 +302,13 @@ class Bitwarden:
 
         return field_matches
 
-    def get_collection_ids(self, collection_name: str, organization_id=None) -> list[str]:
+    def get_collection_ids(self, collection_name: str, organization_id=None, cache=False) -> list[str]:
         """Return matching IDs of collections whose name is equal to collection_name."""
+        if cache:
+            key = (self.session, collection_name, organization_id)
+            if key not in self._collection_ids:
+                self._collection_ids[key] = self.get_collection_ids(collection_name, organization_id)
+            return self._collection_ids[key]
 
         # Prepare set of params for Bitwarden CLI
         params = ["list", "collections", "--search", collection_name]
@@ -274,6 +337,7 @@ class LookupModule(LookupBase):
         result_count = self.get_option("result_count")
         _bitwarden.session = self.get_option("bw_session")
         sync = self.get_option("sync")
+        cache = self.get_option("cache")
 
         if not _bitwarden.unlocked:
             raise AnsibleError("Bitwarden Vault locked. Run 'bw unlock'.")
@@ -287,14 +351,14 @@ class LookupModule(LookupBase):
         if collection_name and collection_id:
             raise AnsibleOptionsError("'collection_name' and 'collection_id' are mutually exclusive!")
         elif collection_name:
-            collection_ids = _bitwarden.get_collection_ids(collection_name, organization_id)
+            collection_ids = _bitwarden.get_collection_ids(collection_name, organization_id, cache)
             if not collection_ids:
                 raise BitwardenException("No matching collections found!")
         else:
             collection_ids = [collection_id]
 
         results = [
-            _bitwarden.get_field(field, term, search_field, collection_id, organization_id)
+            _bitwarden.get_field(field, term, search_field, collection_id, organization_id, cache)
             for collection_id in collection_ids
             for term in terms
         ]
@@ -101,6 +101,23 @@ options:
     default: 53
     type: int
     version_added: 9.5.0
+  cache:
+    description:
+      - Cache the answers, including negative answers, for as long as their TTL allows.
+      - The cache is shared by all lookups querying the same nameservers in the same process. Lookups run in the worker process
+        of their task, so answers are shared between the items of a loop and between the lookups of a task, but not between
+        tasks or hosts.
+      - Do not enable this when waiting for a record to change, for example in a task with C(until).
+    default: false
+    type: bool
+    version_added: 13.3.0
+  max_workers:
+    description:
+      - Maximum number of domains to query concurrently when multiple domains are specified.
+      - Set to V(1) to send the queries one after the other.
+    default: 8
+    type: int
+    version_added: 13.3.0
 notes:
   - V(ALL) is not a record in itself, merely the listed fields are available for any record results you retrieve in the form
     of a dictionary.
@@ -133,6 +150,14 @@ EXAMPLES = r"""
     msg: "A record found {{ item }}"
   loop: "{{ query('community.general.dig', 'example.org.', 'example.com.', 'gmail.com.') }}"
 
+- name: Lookup multiple names at once, caching the answers for the other items of the loop
+  ansible.builtin.debug:
+    msg: "{{ item }} has address {{ lookup('community.general.dig', item, cache=true) }}"
+  loop:
+    - example.org.
+    - example.com.
+    - example.org.
+
 - name: Lookup multiple names at once (from list variable)
   ansible.builtin.debug:
     msg: "A record found {{ item }}"
@@ -241,6 +266,8 @@ _list:
 """
 
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleError
 from ansible.module_utils.parsing.convert_bool import boolean
@@ -286,6 +313,20 @@ except ImportError:
 
 display = Display()
 
+# The answers cached by dnspython only depend on the query, so answers from
+# different nameservers are kept in different caches.
+_ANSWER_CACHES = {}
+_ANSWER_CACHES_LOCK = threading.Lock()
+
+
+def get_answer_cache(nameservers, port):
+    """Returns the answer cache shared by the lookups using these nameservers and port"""
+    key = (tuple(str(ns) for ns in nameservers), port)
+    with _ANSWER_CACHES_LOCK:
+        if key not in _ANSWER_CACHES:
+            _ANSWER_CACHES[key] = dns.resolver.Cache()
+        return _ANSWER_CACHES[key]
+
 
 def make_rdata_dict(rdata):
     """While the 'dig' lookup plugin supports anything which dnspython supports
@@ -388,6 +429,8 @@ class LookupModule(LookupBase):
         real_empty = self.get_option("real_empty")
         tcp = self.get_option("tcp")
         port = self.get_option("port")
+        cache = self.get_option("cache")
+        max_workers = self.get_option("max_workers")
         try:
             rdclass = dns.rdataclass.from_text(self.get_option("class"))
         except Exception as e:
@@ -434,6 +477,8 @@ class LookupModule(LookupBase):
                     real_empty = boolean(arg)
                 elif opt == "tcp":
                     tcp = boolean(arg)
+                elif opt == "cache":
+                    cache = boolean(arg)
 
                 continue
 
@@ -452,6 +497,8 @@ class LookupModule(LookupBase):
             myres.port = port
         if len(nameservers) > 0:
             myres.nameservers = nameservers
+        if cache:
+            myres.cache = get_answer_cache(myres.nameservers, myres.port)
 
         if qtype.upper() == "PTR":
             reversed_domains = []
@@ -468,11 +515,25 @@ class LookupModule(LookupBase):
         if len(domains) > 1:
             real_empty = True
 
+        def resolve(domain):
+            try:
+                return myres.query(domain, qtype, rdclass=rdclass, tcp=tcp), None
+            except dns.exception.DNSException as err:
+                return None, err
+
+        if len(domains) > 1 and max_workers > 1:
+            # the answers are still handled in the order of the domains
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(domains))) as executor:
+                results = list(executor.map(resolve, domains))
+        else:
+            results = map(resolve, domains)
+
         ret = []
 
-        for domain in domains:
+        for answers, error in results:
             try:
-                answers = myres.query(domain, qtype, rdclass=rdclass, tcp=tcp)
+                if error is not None:
+                    raise error
                 for rdata in answers:
                     s = rdata.to_text()
                     if qtype.upper() == "TXT":
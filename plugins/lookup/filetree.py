@@ -134,6 +134,7 @@ import os
 import pwd
 import re
 import stat
+from concurrent.futures import ThreadPoolExecutor
 
 HAVE_SELINUX = False
 try:
@@ -152,71 +153,134 @@ from ansible_collections.community.general.plugins.plugin_utils._lookup import c
 
 display = Display()
 
+MAX_WALK_WORKERS = 8
+
+
+def selinux_enabled():
+    return HAVE_SELINUX and selinux.is_selinux_enabled() == 1
+
 
 # If selinux fails to find a default, return an array of None
 def selinux_context(path):
     context = [None, None, None, None]
-    if HAVE_SELINUX and selinux.is_selinux_enabled():
-        try:
-            # note: the selinux module uses byte strings on python2 and text
-            # strings on python3
-            ret = selinux.lgetfilecon_raw(to_native(path))
-        except OSError:
-            return context
-        if ret[0] != -1:
-            # Limit split to 4 because the selevel, the last in the list,
-            # may contain ':' characters
-            context = ret[1].split(":", 3)
+    try:
+        # note: the selinux module uses byte strings on python2 and text
+        # strings on python3
+        ret = selinux.lgetfilecon_raw(to_native(path))
+    except OSError:
+        return context
+    if ret[0] != -1:
+        # Limit split to 4 because the selevel, the last in the list,
+        # may contain ':' characters
+        context = ret[1].split(":", 3)
     return context
 
 
-def file_props(root, path):
-    """Returns dictionary with file properties, or return None on failure"""
-    abspath = os.path.join(root, path)
+class FileProps:
+    """Builds the file properties of the entries of a tree, and caches what they have in common"""
 
-    try:
-        st = os.lstat(abspath)
-    except OSError as e:
-        display.warning(f"filetree: Error using stat() on path {abspath} ({e})")
-        return None
-
-    ret = dict(root=root, path=path)
-
-    if stat.S_ISLNK(st.st_mode):
-        ret["state"] = "link"
-        ret["src"] = os.readlink(abspath)
-    elif stat.S_ISDIR(st.st_mode):
-        ret["state"] = "directory"
-    elif stat.S_ISREG(st.st_mode):
-        ret["state"] = "file"
-        ret["src"] = abspath
-    else:
-        display.warning(f"filetree: Error file type of {abspath} is not supported")
-        return None
-
-    ret["uid"] = st.st_uid
-    ret["gid"] = st.st_gid
-    try:
-        ret["owner"] = pwd.getpwuid(st.st_uid).pw_name
-    except KeyError:
-        ret["owner"] = st.st_uid
-    try:
-        ret["group"] = to_text(grp.getgrgid(st.st_gid).gr_name)
-    except KeyError:
-        ret["group"] = st.st_gid
-    ret["mode"] = f"0{stat.S_IMODE(st.st_mode):03o}"
-    ret["size"] = st.st_size
-    ret["mtime"] = st.st_mtime
-    ret["ctime"] = st.st_ctime
+    def __init__(self):
+        self.owners = {}
+        self.groups = {}
+        # this cannot change while walking the tree
+        self.selinux = selinux_enabled()
 
-    if HAVE_SELINUX and selinux.is_selinux_enabled() == 1:
-        context = selinux_context(abspath)
-        ret["seuser"] = context[0]
-        ret["serole"] = context[1]
-        ret["setype"] = context[2]
-        ret["selevel"] = context[3]
+    def owner(self, uid):
+        if uid not in self.owners:
+            try:
+                self.owners[uid] = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                self.owners[uid] = uid
+        return self.owners[uid]
+
+    def group(self, gid):
+        if gid not in self.groups:
+            try:
+                self.groups[gid] = to_text(grp.getgrgid(gid).gr_name)
+            except KeyError:
+                self.groups[gid] = gid
+        return self.groups[gid]
+
+    def get(self, root, path, entry=None):
+        """Returns dictionary with file properties, or return None on failure
+
+        ``entry`` is the ``os.DirEntry`` of the file, whose cached stat result is reused.
+        """
+        abspath = os.path.join(root, path)
 
-    return ret
+        try:
+            st = entry.stat(follow_symlinks=False) if entry is not None else os.lstat(abspath)
+        except OSError as e:
+            display.warning(f"filetree: Error using stat() on path {abspath} ({e})")
+            return None
+
+        ret = dict(root=root, path=path)
+
+        if stat.S_ISLNK(st.st_mode):
+            ret["state"] = "link"
+            ret["src"] = os.readlink(abspath)
+        elif stat.S_ISDIR(st.st_mode):
+            ret["state"] = "directory"
+        elif stat.S_ISREG(st.st_mode):
+            ret["state"] = "file"
+            ret["src"] = abspath
+        else:
+            display.warning(f"filetree: Error file type of {abspath} is not supported")
+            return None
+
+        ret["uid"] = st.st_uid
+        ret["gid"] = st.st_gid
+        ret["owner"] = self.owner(st.st_uid)
+        ret["group"] = self.group(st.st_gid)
+        ret["mode"] = f"0{stat.S_IMODE(st.st_mode):03o}"
+        ret["size"] = st.st_size
+        ret["mtime"] = st.st_mtime
+        ret["ctime"] = st.st_ctime
+
+        if self.selinux:
+            context = selinux_context(abspath)
+            ret["seuser"] = context[0]
+            ret["serole"] = context[1]
+            ret["setype"] = context[2]
+            ret["selevel"] = context[3]
+
+        return ret
+
+
+def walk(top, exclude_pattern=None):
+    """Returns the paths relative to ``top`` and the ``os.DirEntry`` of all entries below ``top``
+
+    Entries are listed in the same order as with ``os.walk(top)``, the directories of each directory before its files.
+    Like ``os.walk()``, symbolic links to directories are listed but not followed, and directories that cannot be
+    listed are skipped.
+    """
+    result = []
+    stack = [""]
+    while stack:
+        reldir = stack.pop()
+        try:
+            with os.scandir(os.path.join(top, reldir)) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        dirs = []
+        files = []
+        for entry in entries:
+            if exclude_pattern is not None and exclude_pattern.match(entry.name):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            (dirs if is_dir else files).append(entry)
+
+        for entry in dirs + files:
+            result.append((os.path.join(reldir, entry.name), entry))
+        for entry in reversed(dirs):
+            if not entry.is_symlink():
+                stack.append(os.path.join(reldir, entry.name))
+    return result
 
 
 class LookupModule(LookupBase):
@@ -236,26 +300,31 @@ class LookupModule(LookupBase):
         else:
             exclude_pattern = None
 
-        ret = []
+        paths = []
         for term in terms:
             term_file = os.path.basename(term)
             dwimmed_path = self._loader.path_dwim_relative(basedir, "files", os.path.dirname(term))
-            path = os.path.join(dwimmed_path, term_file)
+            paths.append(os.path.join(dwimmed_path, term_file))
+
+        # the trees are listed concurrently, and then merged in order
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(paths), MAX_WALK_WORKERS)) as executor:
+                trees = list(executor.map(lambda path: walk(path, exclude_pattern), paths))
+        else:
+            trees = [walk(path, exclude_pattern) for path in paths]
+
+        ret = []
+        seen = set()
+        props = FileProps()
+        for path, tree in zip(paths, trees):
             display.debug(f"Walking '{path}'")
-            for root, dirs, files in os.walk(path, topdown=True):
-                # Filter files and directories using a regular expression
-                if exclude_pattern is not None:
-                    dirs[:] = [d for d in dirs if not exclude_pattern.match(d)]
-                    files[:] = [f for f in files if not exclude_pattern.match(f)]
-
-                for entry in dirs + files:
-                    relpath = os.path.relpath(os.path.join(root, entry), path)
-
-                    # Skip if relpath was already processed (from another root)
-                    if relpath not in [entry["path"] for entry in ret]:
-                        props = file_props(path, relpath)
-                        if props is not None:
-                            display.debug(f"  found '{os.path.join(path, relpath)}'")
-                            ret.append(props)
+            for relpath, entry in tree:
+                # Skip if relpath was already processed (from another root)
+                if relpath not in seen:
+                    file_info = props.get(path, relpath, entry)
+                    if file_info is not None:
+                        display.debug(f"  found '{os.path.join(path, relpath)}'")
+                        seen.add(relpath)
+                        ret.append(file_info)
 
         return ret
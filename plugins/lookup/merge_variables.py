@@ -307,6 +307,10 @@ class LookupModule(LookupBase):
         self._default_merge = self.get_option("default_merge", "replace")
         self._list_transformations = self.get_option("list_transformations", [])
 
+        # the merger and the compiled patterns are shared by all hosts and terms
+        self._merger = self._build_merger()
+        self._var_matchers: dict[str, Callable[[str], bool]] = {}
+
         ret = []
         for term in terms:
             if not isinstance(term, str):
@@ -317,8 +321,10 @@ class LookupModule(LookupBase):
             else:  # consider variables of hosts in given groups
                 cross_host_merge_result = initial_value
                 for host in variables["hostvars"]:
-                    if self._is_host_in_allowed_groups(variables["hostvars"][host]["group_names"]):
-                        host_variables = dict(variables["hostvars"].raw_get(host))
+                    # the variables of a host are only computed once
+                    host_variables = variables["hostvars"].raw_get(host)
+                    if self._is_host_in_allowed_groups(host_variables["group_names"]):
+                        host_variables = dict(host_variables)
                         host_variables["hostvars"] = variables["hostvars"]  # re-add hostvars
                         cross_host_merge_result = self._merge_vars(term, cross_host_merge_result, host_variables)
                 ret.append(cross_host_merge_result)
@@ -332,28 +338,41 @@ class LookupModule(LookupBase):
         group_intersection = [host_group_name for host_group_name in host_groups if host_group_name in self._groups]
         return bool(group_intersection)
 
-    def _var_matches(self, key: str, search_pattern: str) -> bool:
+    def _get_var_matcher(self, search_pattern: str) -> Callable[[str], bool]:
+        matcher = self._var_matchers.get(search_pattern)
+        if matcher is not None:
+            return matcher
+
         if self._pattern_type == "prefix":
-            return key.startswith(search_pattern)
+
+            def matcher(key: str) -> bool:
+                return key.startswith(search_pattern)
+
         elif self._pattern_type == "suffix":
-            return key.endswith(search_pattern)
+
+            def matcher(key: str) -> bool:
+                return key.endswith(search_pattern)
+
         elif self._pattern_type == "regex":
-            matcher = re.compile(search_pattern)
-            return matcher.search(key) is not None
+            pattern = re.compile(search_pattern)
+            # hosts mostly share their variable names, so the result for a
+            # name is only computed once
+            matches: dict[str, bool] = {}
 
-        return False
+            def matcher(key: str) -> bool:
+                if key not in matches:
+                    matches[key] = pattern.search(key) is not None
+                return matches[key]
 
-    def _merge_vars(self, search_pattern: str, initial_value: t.Any, variables: dict[str, t.Any]) -> t.Any:
-        display.vvv(f"Merge variables with {self._pattern_type}: {search_pattern}")
-        var_merge_names = sorted([key for key in variables.keys() if self._var_matches(key, search_pattern)])
-        display.vvv(f"The following variables will be merged: {var_merge_names}")
-        prev_var_type = None
-        result = None
+        else:
 
-        if initial_value is not None:
-            prev_var_type = _verify_and_get_type(initial_value)
-            result = initial_value
+            def matcher(key: str) -> bool:
+                return False
 
+        self._var_matchers[search_pattern] = matcher
+        return matcher
+
+    def _build_merger(self) -> Merger:
         builder = (
             MergerBuilder()
             .with_type_strategy(list, ListMergeStrategies.from_name(self._list_merge))
@@ -381,7 +400,19 @@ class LookupModule(LookupBase):
                     f"Transformations must be specified through values of type 'str' or 'dict', but a value of type '{type(transformation)}' was given"
                 )
 
-        merger = builder.build()
+        return builder.build()
+
+    def _merge_vars(self, search_pattern: str, initial_value: t.Any, variables: dict[str, t.Any]) -> t.Any:
+        display.vvv(f"Merge variables with {self._pattern_type}: {search_pattern}")
+        var_matches = self._get_var_matcher(search_pattern)
+        var_merge_names = sorted([key for key in variables.keys() if var_matches(key)])
+        display.vvv(f"The following variables will be merged: {var_merge_names}")
+        prev_var_type = None
+        result = None
+
+        if initial_value is not None:
+            prev_var_type = _verify_and_get_type(initial_value)
+            result = initial_value
 
         if self._templar is None:
             raise AnsibleError("Templar is not available")
@@ -401,7 +432,7 @@ class LookupModule(LookupBase):
                 result = var_value
                 continue
 
-            result = merger.merge(path=[var_name], left=result, right=var_value)
+            result = self._merger.merge(path=[var_name], left=result, right=var_value)
 
         return result
 
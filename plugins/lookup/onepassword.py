@@ -77,9 +77,11 @@ _raw:
 """
 
 import abc
+import hashlib
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleLookupError, AnsibleOptionsError
 from ansible.module_utils.common.process import get_bin_path
@@ -89,6 +91,9 @@ from ansible.plugins.lookup import LookupBase
 from ansible_collections.community.general.plugins.module_utils._onepassword import OnePasswordConfig
 from ansible_collections.community.general.plugins.plugin_utils._lookup import check_for_wrong_terms
 
+# Output of the op CLI shared by the lookups using the cache option
+_CACHE = {}
+
 
 def _lower_if_possible(value):
     """Return the lower case version value, otherwise return the value"""
@@ -100,6 +105,8 @@ def _lower_if_possible(value):
 
 class OnePassCLIBase(metaclass=abc.ABCMeta):
     bin = "op"
+    # what get_raw() returns, to tell apart cached items and documents
+    raw_kind = "item"
 
     def __init__(
         self,
@@ -470,6 +477,7 @@ class OnePass:
         connect_host=None,
         connect_token=None,
         cli_class=None,
+        cache=False,
     ):
         self.subdomain = subdomain
         self.domain = domain
@@ -483,6 +491,7 @@ class OnePass:
 
         self.logged_in = False
         self.token = None
+        self._cache = _CACHE if cache else {}
 
         self._config = OnePasswordConfig()
         self._cli = self._get_cli_class(cli_class)
@@ -556,9 +565,33 @@ class OnePass:
         else:
             self.set_token()
 
+    def _cache_key(self, kind, *args):
+        # only keep a digest of the credentials
+        credentials = hashlib.sha256(
+            to_bytes(f"{self.service_account_token}\0{self.connect_token}", errors="surrogate_or_strict")
+        ).hexdigest()
+        return (kind, self.subdomain, self.domain, self.account_id, self.connect_host, credentials) + args
+
     def get_raw(self, item_id, vault=None):
-        rc, out, err = self._cli.get_raw(item_id, vault, self.token)
-        return out
+        key = self._cache_key(self._cli.raw_kind, vault, item_id)
+        if key not in self._cache:
+            rc, out, err = self._cli.get_raw(item_id, vault, self.token)
+            self._cache[key] = out
+        return self._cache[key]
+
+    def prefetch(self, item_ids, vault=None, max_workers=1):
+        """Fetch the items that are not cached yet concurrently, so that get_raw() finds them"""
+        keys = {}
+        for item_id in item_ids:
+            key = self._cache_key(self._cli.raw_kind, vault, item_id)
+            if key not in self._cache:
+                keys.setdefault(key, item_id)
+
+        if max_workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+                outputs = executor.map(lambda item_id: self._cli.get_raw(item_id, vault, self.token)[1], keys.values())
+                for key, out in zip(keys, outputs):
+                    self._cache[key] = out
 
     def get_field(self, item_id, field, section=None, vault=None):
         output = self.get_raw(item_id, vault)
@@ -578,8 +611,11 @@ class OnePass:
         if len(path_parts) not in (3, 4):
             raise AnsibleLookupError("Not a valid secret reference")
 
-        rc, out, err = self._cli.get_secret_reference(reference, self.token)
-        return out.strip()
+        key = self._cache_key("reference", reference)
+        if key not in self._cache:
+            rc, out, err = self._cli.get_secret_reference(reference, self.token)
+            self._cache[key] = out
+        return self._cache[key].strip()
 
 
 class LookupModule(LookupBase):
@@ -610,8 +646,10 @@ class LookupModule(LookupBase):
             account_id=account_id,
             connect_host=connect_host,
             connect_token=connect_token,
+            cache=self.get_option("cache"),
         )
         op.assert_logged_in()
+        op.prefetch([term for term in terms if not term.startswith("op://")], vault, self.get_option("max_workers"))
 
         values = []
         for term in terms:
@@ -47,6 +47,8 @@ from ansible_collections.community.general.plugins.plugin_utils._lookup import c
 
 
 class OnePassCLIv2Doc(OnePassCLIv2):
+    raw_kind = "document"
+
     def get_raw(self, item_id, vault=None, token=None):
         args = ["document", "get", item_id]
         return self._add_parameters_and_run(args, vault=vault, token=token)
@@ -79,8 +81,10 @@ class LookupModule(LookupBase):
             connect_host=connect_host,
             connect_token=connect_token,
             cli_class=OnePassCLIv2Doc,
+            cache=self.get_option("cache"),
         )
         op.assert_logged_in()
+        op.prefetch(terms, vault, self.get_option("max_workers"))
 
         values = []
         for term in terms:
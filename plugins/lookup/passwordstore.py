@@ -159,6 +159,33 @@ options:
     ini:
       - section: passwordstore_lookup
         key: missing_subkey
+  max_workers:
+    description:
+      - Maximum number of password files to decrypt concurrently when multiple terms are looked up.
+      - The password files are read before the terms are processed one after the other. Creating and updating passwords
+        is not affected and still happens one term at a time, under the lock selected with O(lock).
+      - Password files are never decrypted concurrently when O(lock=readwrite).
+      - When decrypting concurrently, you may need to add C(auto-expand-secmem) to C(~/.gnupg/gpg-agent.conf).
+    type: int
+    default: 1
+    ini:
+      - section: passwordstore_lookup
+        key: max_workers
+    version_added: 13.3.0
+  cache:
+    description:
+      - Keep the content of the password files in memory, so that every password file is only decrypted once per process.
+      - The cache is shared by all lookups of the same process. Lookups run in the worker process of their task, so the
+        content is shared between the items of a loop and between the lookups of a task, but not between tasks or hosts.
+      - A password file is read again after the lookup created or updated it, but changes made by other means while the
+        task runs are not seen.
+      - Without this option, a password file is only decrypted once per lookup call, even if several terms refer to it.
+    type: bool
+    default: false
+    ini:
+      - section: passwordstore_lookup
+        key: cache
+    version_added: 13.3.0
 notes:
   - The lookup supports passing all options as lookup parameters since community.general 6.0.0.
 """
@@ -230,6 +257,10 @@ tasks.yml: |-
     ansible.builtin.debug:
       msg: "{{ lookup('community.general.passwordstore', 'example/test', subkey='user')}}"
 
+  - name: Decrypt up to 8 password files at once
+    ansible.builtin.debug:
+      msg: "{{ query('community.general.passwordstore', 'example/test', 'example/test2', 'example/test3', max_workers=8) }}"
+
   - name: Return the entire password file content
     ansible.builtin.set_fact:
       passfilecontent: "{{ lookup('community.general.passwordstore', 'example/test', returnall=true)}}"
@@ -247,6 +278,7 @@ import os
 import re
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 import yaml
@@ -263,6 +295,12 @@ from ansible_collections.community.general.plugins.plugin_utils._lookup import c
 
 display = Display()
 
+# Output of the show command by password store directory and passname, or the
+# error it failed with, when the cache option is enabled. It is reset in forked
+# processes, so that changes made by other processes are seen.
+_SHOW_CACHE = {}
+_SHOW_CACHE_PID = None
+
 
 def run_backend_cmd(cmd, *, input=None, env=None):
     result = subprocess.run(
@@ -283,6 +321,14 @@ def run_backend_cmd(cmd, *, input=None, env=None):
     return b_out
 
 
+def get_show_cache():
+    global _SHOW_CACHE_PID
+    if os.getpid() != _SHOW_CACHE_PID:
+        _SHOW_CACHE.clear()
+        _SHOW_CACHE_PID = os.getpid()
+    return _SHOW_CACHE
+
+
 class LookupModule(LookupBase):
     def __init__(self, loader=None, templar=None, **kwargs):
         super().__init__(loader, templar, **kwargs)
@@ -356,11 +402,62 @@ class LookupModule(LookupBase):
                 else:
                     self.env["PASSWORD_STORE_UMASK"] = self.paramvals["umask"]
 
-    def check_pass(self):
+    def show_cache_key(self):
+        return (self.backend, self.paramvals["directory"], self.passname)
+
+    def show_pass(self, cached=True):
+        key = self.show_cache_key()
+        if cached and key in self.show_cache:
+            b_out = self.show_cache[key]
+            if isinstance(b_out, subprocess.CalledProcessError):
+                # errors from prefetch() are not kept
+                del self.show_cache[key]
+                raise b_out
+            return b_out
+        b_out = run_backend_cmd([self.pass_cmd, "show"] + [self.passname], env=self.env)
+        self.show_cache[key] = b_out
+        return b_out
+
+    def insert_pass(self, msg):
+        try:
+            run_backend_cmd([self.pass_cmd, "insert", "-f", "-m", self.passname], input=msg, env=self.env)
+        except subprocess.CalledProcessError as e:
+            raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
+        finally:
+            self.show_cache.pop(self.show_cache_key(), None)
+
+    def prefetch(self, terms):
+        # Decrypt the password files of all terms at once. The terms are
+        # processed one after the other afterwards, using the cached output.
+        paramvals = self.paramvals.copy()
+        commands = {}
+        try:
+            for term in terms:
+                self.parse_params(term)
+                key = self.show_cache_key()
+                if key not in self.show_cache and key not in commands:
+                    commands[key] = (self.passname, self.env)
+        except AnsibleError:
+            # reported when processing the term
+            pass
+        finally:
+            self.paramvals = paramvals
+
+        def show(key):
+            passname, env = commands[key]
+            try:
+                return run_backend_cmd([self.pass_cmd, "show", passname], env=env)
+            except subprocess.CalledProcessError as e:
+                return e
+
+        if len(commands) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(commands))) as executor:
+                for key, b_out in zip(commands, executor.map(show, commands)):
+                    self.show_cache[key] = b_out
+
+    def check_pass(self, cached=True):
         try:
-            self.passoutput = to_text(
-                run_backend_cmd([self.pass_cmd, "show"] + [self.passname], env=self.env), errors="surrogate_or_strict"
-            ).splitlines()
+            self.passoutput = to_text(self.show_pass(cached), errors="surrogate_or_strict").splitlines()
             self.password = self.passoutput[0]
             self.passdict = {}
             try:
@@ -443,10 +540,7 @@ class LookupModule(LookupBase):
                 if self.paramvals["timestamp"] and self.paramvals["backup"]:
                     msg += f"lookup_pass: old password was {self.password} (Updated on {datetime})\n"
 
-        try:
-            run_backend_cmd([self.pass_cmd, "insert", "-f", "-m", self.passname], input=msg, env=self.env)
-        except subprocess.CalledProcessError as e:
-            raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
+        self.insert_pass(msg)
         return newpass
 
     def generate_password(self):
@@ -464,11 +558,7 @@ class LookupModule(LookupBase):
         if self.paramvals["timestamp"]:
             msg += f"\nlookup_pass: First generated by ansible on {datetime}\n"
 
-        try:
-            run_backend_cmd([self.pass_cmd, "insert", "-f", "-m", self.passname], input=msg, env=self.env)
-        except subprocess.CalledProcessError as e:
-            raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
-
+        self.insert_pass(msg)
         return newpass
 
     def get_passresult(self):
@@ -509,6 +599,8 @@ class LookupModule(LookupBase):
         self.backend = self.get_option("backend")
         self.pass_cmd = self.backend  # pass and gopass are commands as well
         self.locked = None
+        self.show_cache = get_show_cache() if self.get_option("cache") else {}
+        self.max_workers = self.get_option("max_workers")
         timeout = self.get_option("locktimeout")
         if not re.match("^[0-9]+[smh]$", timeout):
             raise AnsibleError(f"{timeout} is not a correct value for locktimeout")
@@ -549,6 +641,9 @@ class LookupModule(LookupBase):
         self.setup(variables)
         result = []
 
+        if self.max_workers > 1 and self.get_option("lock") != "readwrite":
+            self.prefetch(terms)
+
         for term in terms:
             self.parse_params(term)  # parse the input into paramvals
             with self.opt_lock("readwrite"):
@@ -568,9 +663,8 @@ class LookupModule(LookupBase):
                 else:  # password does not exist
                     if self.paramvals["missing"] == "create":
                         with self.opt_lock("write"):
-                            if (
-                                self.locked == "write" and self.check_pass()
-                            ):  # lookup password again if under write lock
+                            # lookup password again if under write lock
+                            if self.locked == "write" and self.check_pass(cached=False):
                                 result.append(self.get_passresult())
                             else:
                                 result.append(self.generate_password())
@@ -8,9 +8,16 @@
 from __future__ import annotations
 
 import copy
+import fcntl
+import hashlib
 import json
+import os
+import tempfile
+import time
 import traceback
 import typing as t
+from collections import Counter
+from contextlib import contextmanager
 from http import HTTPStatus
 from urllib.error import HTTPError
 from urllib.parse import quote, urlencode
@@ -19,7 +26,7 @@ from ansible.module_utils.common.text.converters import to_native, to_text
 from ansible.module_utils.urls import open_url
 
 if t.TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterator, Sequence
 
     from ansible.module_utils.basic import AnsibleModule
 
@@ -175,6 +182,7 @@ def keycloak_argument_spec() -> dict[str, t.Any]:
         connection_timeout=dict(type="int", default=10),
         token=dict(type="str", no_log=True),
         refresh_token=dict(type="str", no_log=True),
+        token_cache_path=dict(type="path"),
         http_agent=dict(type="str", default="Ansible"),
     )
 
@@ -193,8 +201,16 @@ class KeycloakError(Exception):
 
 
 def _token_request(module_params: dict[str, t.Any], payload: dict[str, t.Any]) -> str:
-    """Obtains connection header with token for the authentication,
-    using the provided auth_username/auth_password
+    """Obtains access token for the authentication request
+    :param module_params: parameters of the module
+    :param payload: authentication request payload, see _token_response()
+    :return: access token
+    """
+    return _token_response(module_params, payload)["access_token"]
+
+
+def _token_response(module_params: dict[str, t.Any], payload: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Obtains the token endpoint response for the authentication request
     :param module_params: parameters of the module
     :param payload:
        type:
@@ -205,7 +221,7 @@ def _token_request(module_params: dict[str, t.Any], payload: dict[str, t.Any]) -
            along with parameters based on 'grant_type'; e.g.,
            'username'/'password' for type 'password',
            'refresh_token' for type 'refresh_token'.
-    :return: access token
+    :return: token response, including at least 'access_token'
     """
     base_url = module_params["auth_keycloak_url"]
     if not base_url.lower().startswith(("http", "https")):
@@ -227,22 +243,17 @@ def _token_request(module_params: dict[str, t.Any], payload: dict[str, t.Any]) -
                 data=urlencode(payload),
             ).read()
         )
-
-        return r["access_token"]
     except ValueError as e:
         raise KeycloakError(f"API returned invalid JSON when trying to obtain access token from {auth_url}: {e}") from e
-    except KeyError as e:
-        raise KeycloakError(f"API did not include access_token field in response from {auth_url}") from e
     except Exception as e:
         raise KeycloakError(f"Could not obtain access token from {auth_url}: {e}", authError=e) from e
 
+    if "access_token" not in r:
+        raise KeycloakError(f"API did not include access_token field in response from {auth_url}")
+    return r
 
-def _request_token_using_credentials(module_params: dict[str, t.Any]) -> str:
-    """Obtains connection header with token for the authentication,
-    using the provided auth_username/auth_password
-    :param module_params: parameters of the module. Must include 'auth_username' and 'auth_password'.
-    :return: connection header
-    """
+
+def _credentials_payload(module_params: dict[str, t.Any]) -> dict[str, t.Any]:
     client_id = module_params.get("auth_client_id")
     auth_username = module_params.get("auth_username")
     auth_password = module_params.get("auth_password")
@@ -256,9 +267,7 @@ def _request_token_using_credentials(module_params: dict[str, t.Any]) -> str:
         "password": auth_password,
     }
     # Remove empty items, for instance missing client_secret
-    payload = {k: v for k, v in temp_payload.items() if v is not None}
-
-    return _token_request(module_params, payload)
+    return {k: v for k, v in temp_payload.items() if v is not None}
 
 
 def _request_token_using_refresh_token(module_params: dict[str, t.Any]) -> str:
@@ -267,8 +276,11 @@ def _request_token_using_refresh_token(module_params: dict[str, t.Any]) -> str:
     :param module_params: parameters of the module. Must include 'refresh_token'.
     :return: connection header
     """
+    return _token_request(module_params, _refresh_token_payload(module_params, module_params.get("refresh_token")))
+
+
+def _refresh_token_payload(module_params: dict[str, t.Any], refresh_token: str | None) -> dict[str, t.Any]:
     client_id = module_params.get("auth_client_id")
-    refresh_token = module_params.get("refresh_token")
     client_secret = module_params.get("auth_client_secret")
 
     temp_payload = {
@@ -278,19 +290,12 @@ def _request_token_using_refresh_token(module_params: dict[str, t.Any]) -> str:
         "refresh_token": refresh_token,
     }
     # Remove empty items, for instance missing client_secret
-    payload = {k: v for k, v in temp_payload.items() if v is not None}
+    return {k: v for k, v in temp_payload.items() if v is not None}
 
-    return _token_request(module_params, payload)
 
-
-def _request_token_using_client_credentials(module_params: dict[str, t.Any]) -> str:
-    """Obtains connection header with token for the authentication,
-    using the provided auth_client_id and auth_client_secret by grant_type
-    client_credentials. Ensure that the used client uses client authorization
+def _client_credentials_payload(module_params: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Ensure that the used client uses client authorization
     with service account roles enabled and required service roles assigned.
-    :param module_params: parameters of the module. Must include 'auth_client_id'
-    and 'auth_client_secret'..
-    :return: connection header
     """
     client_id = module_params.get("auth_client_id")
     client_secret = module_params.get("auth_client_secret")
@@ -301,9 +306,145 @@ def _request_token_using_client_credentials(module_params: dict[str, t.Any]) ->
         "client_secret": client_secret,
     }
     # Remove empty items, for instance missing client_secret
-    payload = {k: v for k, v in temp_payload.items() if v is not None}
+    return {k: v for k, v in temp_payload.items() if v is not None}
 
-    return _token_request(module_params, payload)
+
+def _grant_payload(module_params: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Returns the payload of the grant used to obtain a new token,
+    client_credentials when a client secret is given without username, password otherwise
+    """
+    auth_client_id = module_params.get("auth_client_id")
+    auth_client_secret = module_params.get("auth_client_secret")
+    auth_username = module_params.get("auth_username")
+    if auth_client_id is not None and auth_client_secret is not None and auth_username is None:
+        return _client_credentials_payload(module_params)
+    return _credentials_payload(module_params)
+
+
+class KeycloakTokenCache:
+    """Stores access and refresh tokens in a file only readable by its owner,
+    so that the following module runs with the same credentials do not need a new grant.
+
+    Tokens are reused until shortly before they expire, and are then refreshed with their
+    refresh token while it is valid. The file is locked while a token is looked up or
+    obtained, so that concurrent module runs share a single grant.
+    """
+
+    # seconds before expiry after which a token is not used anymore
+    expiry_margin = 10
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @staticmethod
+    def cache_key(module_params: dict[str, t.Any]) -> str:
+        """Identifies the server, client and credentials, without storing the secrets themselves"""
+        names = (
+            "auth_keycloak_url",
+            "auth_realm",
+            "auth_client_id",
+            "auth_username",
+            "auth_client_secret",
+            "auth_password",
+        )
+        return hashlib.sha256(json.dumps([module_params.get(name) for name in names]).encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        try:
+            fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            raise KeycloakError(f"Could not lock the token cache {self.path}: {e}") from e
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _load(self) -> dict[str, dict[str, t.Any]]:
+        try:
+            with open(self.path) as f:
+                tokens = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            # unreadable or corrupted, it is overwritten with fresh tokens
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def _save(self, tokens: dict[str, dict[str, t.Any]]) -> None:
+        try:
+            # mkstemp() creates the file with mode 0600
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), prefix=".keycloak-tokens-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(tokens, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            raise KeycloakError(f"Could not write the token cache {self.path}: {e}") from e
+
+    def _is_valid(self, expires_at: float | None, now: float) -> bool:
+        return expires_at is None or expires_at > now + self.expiry_margin
+
+    def get(self, module_params: dict[str, t.Any], grant_payload: dict[str, t.Any] | None = None) -> str:
+        """Returns a cached access token, or a refreshed or new one which is then cached
+
+        :param grant_payload: payload of the grant made when no token can be reused, see _grant_payload()
+        """
+        key = self.cache_key(module_params)
+        with self._locked():
+            tokens = self._load()
+            entry = tokens.get(key)
+            now = time.time()
+            response = None
+            if isinstance(entry, dict):
+                if entry.get("access_token") and self._is_valid(entry.get("expires_at", 0), now):
+                    return entry["access_token"]
+                if entry.get("refresh_token") and self._is_valid(entry.get("refresh_expires_at", 0), now):
+                    try:
+                        response = _token_response(
+                            module_params, _refresh_token_payload(module_params, entry["refresh_token"])
+                        )
+                    except KeycloakError:
+                        # revoked or ended session, fall back to a new grant
+                        pass
+            if response is None:
+                if grant_payload is None:
+                    grant_payload = _grant_payload(module_params)
+                response = _token_response(module_params, grant_payload)
+
+            # entries are only kept for their refresh token when they have one, client_credentials
+            # responses for instance come without refresh token and with a refresh_expires_in of 0
+            tokens = {
+                k: v
+                for k, v in tokens.items()
+                if isinstance(v, dict)
+                and (
+                    self._is_valid(v.get("expires_at", 0), now)
+                    or (v.get("refresh_token") and self._is_valid(v.get("refresh_expires_at", 0), now))
+                )
+            }
+            # a refresh_expires_in of 0 means that the refresh token does not expire, like offline tokens
+            refresh_expires_in = response.get("refresh_expires_in")
+            tokens[key] = {
+                "access_token": response["access_token"],
+                "expires_at": now + response.get("expires_in", 0),
+                "refresh_token": response.get("refresh_token"),
+                "refresh_expires_at": now + refresh_expires_in if refresh_expires_in else None,
+            }
+            self._save(tokens)
+            return response["access_token"]
+
+    def discard(self, module_params: dict[str, t.Any]) -> None:
+        """Forgets the tokens of these credentials, for instance because they were rejected"""
+        key = self.cache_key(module_params)
+        with self._locked():
+            tokens = self._load()
+            if tokens.pop(key, None) is not None:
+                self._save(tokens)
 
 
 def get_token(module_params: dict[str, t.Any]) -> dict[str, str]:
@@ -315,13 +456,11 @@ def get_token(module_params: dict[str, t.Any]) -> dict[str, str]:
     token = module_params.get("token")
 
     if token is None:
-        auth_client_id = module_params.get("auth_client_id")
-        auth_client_secret = module_params.get("auth_client_secret")
-        auth_username = module_params.get("auth_username")
-        if auth_client_id is not None and auth_client_secret is not None and auth_username is None:
-            token = _request_token_using_client_credentials(module_params)
+        token_cache_path = module_params.get("token_cache_path")
+        if token_cache_path is not None:
+            token = KeycloakTokenCache(token_cache_path).get(module_params)
         else:
-            token = _request_token_using_credentials(module_params)
+            token = _token_request(module_params, _grant_payload(module_params))
 
     return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
@@ -400,6 +539,11 @@ class KeycloakAPI:
         self.connection_timeout = self.module.params.get("connection_timeout")
         self.restheaders = connection_header
         self.http_agent = self.module.params.get("http_agent")
+        # name -> ID indexes, keyed by (realm, kind, scope); see _get_name_index()
+        self._name_indexes: dict[tuple[str, str, str | None], dict[str, str]] = {}
+        # number of requests sent per HTTP method, and of name index hits and misses
+        self.request_counts: Counter[str] = Counter()
+        self.name_index_counts: Counter[str] = Counter()
 
     def _request(
         self, url: str, method: str, data: str | bytes | None = None, *, extra_headers: dict[str, str] | None = None
@@ -439,8 +583,23 @@ class KeycloakAPI:
             headers = headers.copy()
             headers.update(extra_headers)
 
+        self.request_counts[method] += 1
         r = make_request_catching_401(headers)
 
+        token_cache = None
+        token_cache_path = self.module.params.get("token_cache_path")
+        if token_cache_path is not None and self.module.params.get("token") is None:
+            token_cache = KeycloakTokenCache(token_cache_path)
+        if isinstance(r, Exception) and token_cache is not None:
+            # The cached token was rejected, do not hand it to the next module runs
+            token_cache.discard(self.module.params)
+
+        def new_token(payload: dict[str, t.Any]) -> str:
+            # the new token is cached for the next module runs, like the one it replaces
+            if token_cache is not None:
+                return token_cache.get(self.module.params, payload)
+            return _token_request(self.module.params, payload)
+
         if isinstance(r, Exception):
             # Try to refresh token and retry, if available
             refresh_token = self.module.params.get("refresh_token")
@@ -460,7 +619,7 @@ class KeycloakAPI:
             auth_username = self.module.params.get("auth_username")
             auth_password = self.module.params.get("auth_password")
             if auth_username is not None and auth_password is not None:
-                token = _request_token_using_credentials(self.module.params)
+                token = new_token(_credentials_payload(self.module.params))
                 self.restheaders["Authorization"] = f"Bearer {token}"
 
                 r = make_request_catching_401(headers)
@@ -471,7 +630,7 @@ class KeycloakAPI:
             auth_client_secret = self.module.params.get("auth_client_secret")
             if auth_client_id is not None and auth_client_secret is not None:
                 try:
-                    token = _request_token_using_client_credentials(self.module.params)
+                    token = new_token(_client_credentials_payload(self.module.params))
                     self.restheaders["Authorization"] = f"Bearer {token}"
 
                     r = make_request_catching_401(headers)
@@ -486,6 +645,36 @@ class KeycloakAPI:
 
         return r
 
+    def _get_name_index(
+        self, kind: str, realm: str, fetch: Callable[[], list[dict[str, t.Any]]], scope: str | None = None
+    ) -> dict[str, str]:
+        """Returns a mapping of the names of the objects of a kind to their IDs.
+
+        The objects are listed with fetch() the first time, and the mapping is then kept
+        until _invalidate_name_index() is called for this kind, once objects were created,
+        renamed or deleted.
+
+        :param kind: kind of the objects, for instance 'clientscope'
+        :param realm: realm of the objects
+        :param fetch: returns the list of representations of all objects, each with a name and an id
+        :param scope: ID of the object the objects belong to, for instance the clientscope of protocol mappers
+        :return: dict of names to IDs
+        """
+        key = (realm, kind, scope)
+        index = self._name_indexes.get(key)
+        if index is None:
+            self.name_index_counts["misses"] += 1
+            index = self._name_indexes[key] = {item["name"]: item["id"] for item in fetch()}
+        else:
+            self.name_index_counts["hits"] += 1
+        return index
+
+    def _invalidate_name_index(self, kind: str, realm: str, scope: str | None = None) -> None:
+        """Forgets the name -> ID index of a kind, for one scope or, if scope is None, for all of them."""
+        for key in list(self._name_indexes):
+            if key[:2] == (realm, kind) and (scope is None or key[2] == scope):
+                del self._name_indexes[key]
+
     def _request_and_deserialize(self, url: str, method: str, data: str | bytes | None = None):
         """Wraps the _request method with JSON deserialization of the response.
 
@@ -748,8 +937,15 @@ class KeycloakAPI:
         :param realm: client template from this realm
         :return: id of client (usually a UUID)
         """
+        # clients can be filtered by clientId, so only the queried ones are indexed
+        index = self._name_indexes.setdefault((realm, "client", None), {})
+        if client_id in index:
+            self.name_index_counts["hits"] += 1
+            return index[client_id]
+        self.name_index_counts["misses"] += 1
         result = self.get_client_by_clientid(client_id, realm)
         if isinstance(result, dict) and "id" in result:
+            index[client_id] = result["id"]
             return result["id"]
         else:
             return None
@@ -762,6 +958,7 @@ class KeycloakAPI:
         :return: HTTPResponse object on success
         """
         client_url = URL_CLIENT.format(url=self.baseurl, realm=realm, id=id)
+        self._invalidate_name_index("client", realm)
 
         try:
             return self._request(client_url, method="PUT", data=json.dumps(clientrep))
@@ -775,6 +972,7 @@ class KeycloakAPI:
         :return: HTTPResponse object on success
         """
         client_url = URL_CLIENTS.format(url=self.baseurl, realm=realm)
+        self._invalidate_name_index("client", realm)
 
         try:
             return self._request(client_url, method="POST", data=json.dumps(clientrep))
@@ -789,6 +987,8 @@ class KeycloakAPI:
         :return: HTTPResponse object on success
         """
         client_url = URL_CLIENT.format(url=self.baseurl, realm=realm, id=id)
+        self._invalidate_name_index("client", realm)
+        self._invalidate_name_index("client_role", realm, id)
 
         try:
             return self._request(client_url, method="DELETE")
@@ -816,11 +1016,10 @@ class KeycloakAPI:
         :param realm: Realm from which to obtain the rolemappings.
         :return: The ID of the role, None if not found.
         """
-        rolemappings = self.get_client_roles_by_id(cid, realm=realm)
-        for role in rolemappings:
-            if name == role["name"]:
-                return role["id"]
-        return None
+        index = self._get_name_index(
+            "client_role", realm, lambda: self.get_client_roles_by_id(cid, realm=realm), scope=cid
+        )
+        return index.get(name)
 
     def get_client_group_rolemapping_by_id(self, gid, cid, rid, realm: str = "master"):
         """Obtain client representation by id
@@ -1107,15 +1306,45 @@ class KeycloakAPI:
         except Exception as e:
             self.fail_request(e, msg=f"Could not obtain the user for realm {realm} and username {username}: {e}")
 
-    def get_realm_users(self, realm: str = "master") -> list[dict[str, t.Any]]:
+    def get_realm_users(
+        self,
+        realm: str = "master",
+        page_size: int | None = None,
+        filters: dict[str, t.Any] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> list[dict[str, t.Any]]:
         """Obtain list of users from the realm
 
         :param realm: realm id
+        :param page_size: number of users to request at once, or None for a single unpaginated request
+        :param filters: query parameters of the users endpoint, for instance search, q or briefRepresentation
+        :param fields: only keep these fields of the user representations
         :return: list of user representations
         """
         users_url = URL_USERS.format(url=self.baseurl, realm=realm)
-        try:
-            return self._request_and_deserialize(users_url, method="GET")
+        params: dict[str, t.Any] = {}
+        for key, value in (filters or {}).items():
+            if isinstance(value, bool):
+                params[key] = str(value).lower()
+            elif value is not None:
+                params[key] = value
+
+        users: list[dict[str, t.Any]] = []
+        first = 0
+        try:
+            while True:
+                if page_size is not None:
+                    params.update(first=first, max=page_size)
+                url = f"{users_url}?{urlencode(params)}" if params else users_url
+                # only one page is deserialized at a time, and only the wanted fields are kept from it
+                page = self._request_and_deserialize(url, method="GET")
+                if fields is None:
+                    users.extend(page)
+                else:
+                    users.extend({field: user[field] for field in fields if field in user} for user in page)
+                if page_size is None or len(page) < page_size:
+                    return users
+                first += len(page)
         except ValueError as e:
             self.module.fail_json(
                 msg=f"API returned incorrect JSON when trying to obtain the users for realm {realm}: {e}"
@@ -1354,11 +1583,9 @@ class KeycloakAPI:
         :param realm: Realm in which the clientscope resides; default 'master'
         """
         try:
-            all_clientscopes = self.get_clientscopes(realm=realm)
-
-            for clientscope in all_clientscopes:
-                if clientscope["name"] == name:
-                    return self.get_clientscope_by_clientscopeid(clientscope["id"], realm=realm)
+            index = self._get_name_index("clientscope", realm, lambda: self.get_clientscopes(realm=realm))
+            if name in index:
+                return self.get_clientscope_by_clientscopeid(index[name], realm=realm)
 
             return None
 
@@ -1372,6 +1599,7 @@ class KeycloakAPI:
         :return: HTTPResponse object on success
         """
         clientscopes_url = URL_CLIENTSCOPES.format(url=self.baseurl, realm=realm)
+        self._invalidate_name_index("clientscope", realm)
         try:
             return self._request(clientscopes_url, method="POST", data=json.dumps(clientscoperep))
         except Exception as e:
@@ -1384,6 +1612,7 @@ class KeycloakAPI:
         :return HTTPResponse object on success
         """
         clientscope_url = URL_CLIENTSCOPE.format(url=self.baseurl, realm=realm, id=clientscoperep["id"])
+        self._invalidate_name_index("clientscope", realm)
 
         try:
             return self._request(clientscope_url, method="PUT", data=json.dumps(clientscoperep))
@@ -1410,10 +1639,7 @@ class KeycloakAPI:
         # in the case that both are provided, prefer the ID, since it is one
         # less lookup.
         if cid is None and name is not None:
-            for clientscope in self.get_clientscopes(realm=realm):
-                if clientscope["name"] == name:
-                    cid = clientscope["id"]
-                    break
+            cid = self._get_name_index("clientscope", realm, lambda: self.get_clientscopes(realm=realm)).get(name)
 
         # if the group doesn't exist - no problem, nothing to delete.
         if cid is None:
@@ -1421,6 +1647,8 @@ class KeycloakAPI:
 
         # should have a good cid by here.
         clientscope_url = URL_CLIENTSCOPE.format(realm=realm, id=cid, url=self.baseurl)
+        self._invalidate_name_index("clientscope", realm)
+        self._invalidate_name_index("clientscope_protocolmapper", realm, cid)
         try:
             return self._request(clientscope_url, method="DELETE")
 
@@ -1476,13 +1704,14 @@ class KeycloakAPI:
         :param realm: Realm in which the clientscope resides; default 'master'
         """
         try:
-            all_protocolmappers = self.get_clientscope_protocolmappers(cid, realm=realm)
-
-            for protocolmapper in all_protocolmappers:
-                if protocolmapper["name"] == name:
-                    return self.get_clientscope_protocolmapper_by_protocolmapperid(
-                        protocolmapper["id"], cid, realm=realm
-                    )
+            index = self._get_name_index(
+                "clientscope_protocolmapper",
+                realm,
+                lambda: self.get_clientscope_protocolmappers(cid, realm=realm),
+                scope=cid,
+            )
+            if name in index:
+                return self.get_clientscope_protocolmapper_by_protocolmapperid(index[name], cid, realm=realm)
 
             return None
 
@@ -1497,6 +1726,7 @@ class KeycloakAPI:
         :return: HTTPResponse object on success
         """
         protocolmappers_url = URL_CLIENTSCOPE_PROTOCOLMAPPERS.format(url=self.baseurl, id=cid, realm=realm)
+        self._invalidate_name_index("clientscope_protocolmapper", realm, cid)
         try:
             return self._request(protocolmappers_url, method="POST", data=json.dumps(mapper_rep))
         except Exception as e:
@@ -1512,6 +1742,7 @@ class KeycloakAPI:
         protocolmapper_url = URL_CLIENTSCOPE_PROTOCOLMAPPER.format(
             url=self.baseurl, realm=realm, id=cid, mapper_id=mapper_rep["id"]
         )
+        self._invalidate_name_index("clientscope_protocolmapper", realm, cid)
 
         try:
             return self._request(protocolmapper_url, method="PUT", data=json.dumps(mapper_rep))
@@ -1529,6 +1760,7 @@ class KeycloakAPI:
         :return HTTPResponse object on success
         """
         protocolmapper_url = URL_CLIENTSCOPE_PROTOCOLMAPPER.format(url=self.baseurl, realm=realm, id=cid, mapper_id=pid)
+        self._invalidate_name_index("clientscope_protocolmapper", realm, cid)
         try:
             return self._request(protocolmapper_url, method="DELETE")
         except Exception as e:
@@ -2224,6 +2456,7 @@ class KeycloakAPI:
         cid = self.get_client_id(clientid, realm=realm)
         if cid is None:
             self.module.fail_json(msg=f"Could not find client {clientid} in realm {realm}")
+        self._invalidate_name_index("client_role", realm, cid)
         roles_url = URL_CLIENT_ROLES.format(url=self.baseurl, realm=realm, id=cid)
         try:
             if "composites" in rolerep:
@@ -2258,6 +2491,7 @@ class KeycloakAPI:
         cid = self.get_client_id(clientid, realm=realm)
         if cid is None:
             self.module.fail_json(msg=f"Could not find client {clientid} in realm {realm}")
+        self._invalidate_name_index("client_role", realm, cid)
         role_url = URL_CLIENT_ROLE.format(url=self.baseurl, realm=realm, id=cid, name=quote(rolerep["name"], safe=""))
         try:
             composites = None
@@ -2283,6 +2517,7 @@ class KeycloakAPI:
         cid = self.get_client_id(clientid, realm=realm)
         if cid is None:
             self.module.fail_json(msg=f"Could not find client {clientid} in realm {realm}")
+        self._invalidate_name_index("client_role", realm, cid)
         role_url = URL_CLIENT_ROLE.format(url=self.baseurl, realm=realm, id=cid, name=quote(name, safe=""))
         try:
             return self._request(role_url, method="DELETE")
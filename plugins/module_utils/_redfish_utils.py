@@ -7,13 +7,16 @@
 
 from __future__ import annotations
 
+import copy
 import http.client as http_client
 import json
 import os
 import random
 import string
+import threading
 import time
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
@@ -22,6 +25,8 @@ from ansible.module_utils.common.text.converters import to_bytes, to_native, to_
 from ansible.module_utils.urls import open_url
 
 if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     from ansible.module_utils.basic import AnsibleModule
 
 
@@ -51,6 +56,10 @@ REDFISH_COMMON_ARGUMENT_SPEC = {
         "type": "list",
         "elements": "str",
     },
+    "max_concurrent_requests": {
+        "type": "int",
+        "default": 1,
+    },
 }
 
 
@@ -80,6 +89,12 @@ class RedfishUtils:
         self._vendor = None
         self.validate_certs = module.params.get("validate_certs", False)
         self.ca_path = module.params.get("ca_path")
+        self.max_concurrent_requests = max(1, module.params.get("max_concurrent_requests") or 1)
+        # Limits the requests in flight to the service, whatever the thread sending them
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrent_requests)
+        # GET responses with an ETag, revalidated with If-None-Match; see get_request()
+        self._get_cache: dict[tuple[str, tuple[tuple[str, str], ...]], dict[str, t.Any]] = {}
+        self._protocol_features: dict[str, t.Any] | None = None
 
     def _auth_params(self, headers: dict[str, str]) -> tuple[str | None, str | None, bool]:
         """
@@ -166,7 +181,11 @@ class RedfishUtils:
         kwargs.setdefault("timeout", self.timeout)
         kwargs.setdefault("ciphers", self.ciphers)
         kwargs.setdefault("ca_path", self.ca_path)
-        resp = open_url(uri, **kwargs)
+        if kwargs.get("method") != "GET":
+            # Any modification can change other resources too
+            self._get_cache.clear()
+        with self._request_slots:
+            resp = open_url(uri, **kwargs)
         headers = {k.lower(): v for (k, v) in resp.info().items()}
         return resp, headers
 
@@ -177,6 +196,11 @@ class RedfishUtils:
         req_headers = dict(GET_HEADERS)
         if override_headers:
             req_headers.update(override_headers)
+        # Resources fetched before are only transferred again if they changed
+        cache_key = (uri, tuple(sorted(req_headers.items())))
+        cached = self._get_cache.get(cache_key)
+        if cached is not None:
+            req_headers["If-None-Match"] = cached["headers"]["etag"]
         username, password, basic_auth = self._auth_params(req_headers)
         if timeout is None:
             timeout = self.timeout
@@ -202,6 +226,13 @@ class RedfishUtils:
                 if not allow_no_resp:
                     raise
         except HTTPError as e:
+            if cached is not None and e.code == HTTPStatus.NOT_MODIFIED:
+                return {
+                    "ret": True,
+                    "data": copy.deepcopy(cached["data"]),
+                    "headers": dict(cached["headers"]),
+                    "resp": cached["resp"],
+                }
             msg, data = self._get_extended_message(e)
             return {
                 "ret": False,
@@ -214,8 +245,88 @@ class RedfishUtils:
         # Almost all errors should be caught above, but just in case
         except Exception as e:
             return {"ret": False, "msg": f"Failed GET request to '{uri}': '{e}'"}
+        if data is not None and headers.get("etag"):
+            self._get_cache[cache_key] = {"data": copy.deepcopy(data), "headers": headers, "resp": resp}
+        else:
+            self._get_cache.pop(cache_key, None)
         return {"ret": True, "data": data, "headers": headers, "resp": resp}
 
+    def _map_concurrently(self, func: Callable[[t.Any], t.Any], items: Iterable[t.Any]) -> list[t.Any]:
+        """
+        Call func for each item, in up to max_concurrent_requests threads,
+        and return the results in the order of the items.
+
+        :param func: function sending requests to the service
+        :param items: arguments of the calls
+        :return: list of the results of func
+        """
+        items = list(items)
+        if self.max_concurrent_requests < 2 or len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def get_requests(self, uris: Iterable[str], **kwargs: t.Any) -> list[dict[str, t.Any]]:
+        """
+        Send GET requests to independent URIs, concurrently if
+        max_concurrent_requests allows it.
+
+        :param uris: URIs to get
+        :param kwargs: additional arguments of get_request
+        :return: list of get_request responses, in the order of the URIs
+        """
+        return self._map_concurrently(lambda uri: self.get_request(uri, **kwargs), uris)
+
+    def _get_protocol_features(self) -> dict[str, t.Any]:
+        """
+        Return the optional protocol features supported by the service,
+        as announced by ProtocolFeaturesSupported in the service root.
+        """
+        if self._protocol_features is None:
+            response = self.get_request(self.root_uri + self.service_root)
+            if response["ret"] and isinstance(response["data"], dict):
+                self._protocol_features = response["data"].get("ProtocolFeaturesSupported") or {}
+            else:
+                self._protocol_features = {}
+        return self._protocol_features
+
+    def get_collection_members(self, collection_uri: str, select: Sequence[str] | None = None) -> dict[str, t.Any]:
+        """
+        Get all members of a resource collection.
+
+        The collection is retrieved with its members expanded when the service
+        supports $expand. Otherwise the members are retrieved one by one, with
+        only the properties in select when the service supports $select.
+
+        :param collection_uri: URI of the collection, relative to root_uri
+        :param select: properties of the members that are needed
+        :return: dict containing the status, and the list of get_request responses of the members as 'members'
+        """
+        features = self._get_protocol_features()
+        expand = features.get("ExpandQuery") or {}
+        if expand.get("NoLinks"):
+            query = "$expand=.($levels=1)" if expand.get("Levels") else "$expand=."
+            response = self.get_request(f"{self.root_uri}{collection_uri}?{query}")
+            if response["ret"]:
+                members = response["data"].get("Members", [])
+                # Members that were not expanded only contain their @odata.id
+                if all(len(member) > 1 for member in members):
+                    return {
+                        "ret": True,
+                        "members": [
+                            {"ret": True, "data": member, "headers": {}, "resp": response["resp"]} for member in members
+                        ],
+                    }
+
+        response = self.get_request(self.root_uri + collection_uri)
+        if response["ret"] is False:
+            return response
+        query = ""
+        if select and features.get("SelectQuery"):
+            query = f"?$select={','.join(select)}"
+        member_uris = [f"{self.root_uri}{member['@odata.id']}{query}" for member in response["data"].get("Members", [])]
+        return {"ret": True, "members": self.get_requests(member_uris)}
+
     def post_request(self, uri: str, pyld, multipart: bool = False):
         req_headers = dict(POST_HEADERS)
         username, password, basic_auth = self._auth_params(req_headers)
@@ -780,8 +891,7 @@ class RedfishUtils:
     def aggregate(self, func, uri_list, uri_name):
         ret = True
         entries = []
-        for uri in uri_list:
-            inventory = func(uri)
+        for uri, inventory in zip(uri_list, self._map_concurrently(func, uri_list)):
             ret = inventory.pop("ret") and ret
             if "entries" in inventory:
                 entries.append(({uri_name: uri}, inventory["entries"]))
@@ -838,9 +948,8 @@ class RedfishUtils:
         # Loop through Members and their StorageControllers
         # and gather properties from each StorageController
         if data["Members"]:
-            for storage_member in data["Members"]:
-                storage_member_uri = storage_member["@odata.id"]
-                response = self.get_request(self.root_uri + storage_member_uri)
+            storage_member_uris = [self.root_uri + storage_member["@odata.id"] for storage_member in data["Members"]]
+            for response in self.get_requests(storage_member_uris):
                 data = response["data"]
 
                 if key in data:
@@ -853,9 +962,8 @@ class RedfishUtils:
                     data = response["data"]
 
                     if data["Members"]:
-                        for controller_member in data["Members"]:
-                            controller_member_uri = controller_member["@odata.id"]
-                            response = self.get_request(self.root_uri + controller_member_uri)
+                        controller_member_uris = [self.root_uri + member["@odata.id"] for member in data["Members"]]
+                        for response in self.get_requests(controller_member_uris):
                             if response["ret"] is False:
                                 return response
                             result["ret"] = True
@@ -935,9 +1043,7 @@ class RedfishUtils:
             if data["Members"]:
                 for controller in data["Members"]:
                     controller_list.append(controller["@odata.id"])
-                for c in controller_list:
-                    uri = self.root_uri + c
-                    response = self.get_request(uri)
+                for response in self.get_requests(self.root_uri + c for c in controller_list):
                     if response["ret"] is False:
                         return response
                     data = response["data"]
@@ -971,9 +1077,8 @@ class RedfishUtils:
                                 controller_name = f"Controller {sc_id}"
                     drive_results = []
                     if "Drives" in data:
-                        for device in data["Drives"]:
-                            disk_uri = self.root_uri + device["@odata.id"]
-                            response = self.get_request(disk_uri)
+                        disk_uris = [self.root_uri + device["@odata.id"] for device in data["Drives"]]
+                        for response in self.get_requests(disk_uris):
                             data = response["data"]
 
                             drive_result = {}
@@ -1003,9 +1108,7 @@ class RedfishUtils:
             for controller in data["Members"]:
                 controller_list.append(controller["@odata.id"])
 
-            for c in controller_list:
-                uri = self.root_uri + c
-                response = self.get_request(uri)
+            for response in self.get_requests(self.root_uri + c for c in controller_list):
                 if response["ret"] is False:
                     return response
                 data = response["data"]
@@ -1032,7 +1135,6 @@ class RedfishUtils:
     def get_volume_inventory(self, systems_uri):
         result = {"entries": []}
         controller_list = []
-        volume_list = []
         # Get these entries, but does not fail if not found
         properties = [
             "Id",
@@ -1078,9 +1180,7 @@ class RedfishUtils:
             if data.get("Members"):
                 for controller in data["Members"]:
                     controller_list.append(controller["@odata.id"])
-                for idx, c in enumerate(controller_list):
-                    uri = self.root_uri + c
-                    response = self.get_request(uri)
+                for idx, response in enumerate(self.get_requests(self.root_uri + c for c in controller_list)):
                     if response["ret"] is False:
                         return response
                     data = response["data"]
@@ -1112,19 +1212,15 @@ class RedfishUtils:
                                 sc_id = sc[0].get("Id", "1")
                                 controller_name = f"Controller {sc_id}"
                     volume_results = []
-                    volume_list = []
                     if "Volumes" in data:
-                        # Get a list of all volumes and build respective URIs
+                        # Get all volumes
                         volumes_uri = data["Volumes"]["@odata.id"]
-                        response = self.get_request(self.root_uri + volumes_uri)
-                        data = response["data"]
-
-                        if data.get("Members"):
-                            for volume in data["Members"]:
-                                volume_list.append(volume["@odata.id"])
-                            for v in volume_list:
-                                uri = self.root_uri + v
-                                response = self.get_request(uri)
+                        collection = self.get_collection_members(volumes_uri)
+                        if collection["ret"] is False:
+                            return collection
+
+                        if collection["members"]:
+                            for response in collection["members"]:
                                 if response["ret"] is False:
                                     return response
                                 data = response["data"]
@@ -2740,7 +2836,6 @@ class RedfishUtils:
 
     def get_cpu_inventory(self, systems_uri):
         result = {}
-        cpu_list = []
         cpu_results = []
         key = "Processors"
         # Get these entries, but does not fail if not found
@@ -2768,20 +2863,14 @@ class RedfishUtils:
 
         processors_uri = data[key]["@odata.id"]
 
-        # Get a list of all CPUs and build respective URIs
-        response = self.get_request(self.root_uri + processors_uri)
-        if response["ret"] is False:
-            return response
+        # Get all CPUs
+        collection = self.get_collection_members(processors_uri, select=properties)
+        if collection["ret"] is False:
+            return collection
         result["ret"] = True
-        data = response["data"]
 
-        for cpu in data["Members"]:
-            cpu_list.append(cpu["@odata.id"])
-
-        for c in cpu_list:
+        for response in collection["members"]:
             cpu = {}
-            uri = self.root_uri + c
-            response = self.get_request(uri)
             if response["ret"] is False:
                 return response
             data = response["data"]
@@ -2799,7 +2888,6 @@ class RedfishUtils:
 
     def get_memory_inventory(self, systems_uri):
         result = {}
-        memory_list = []
         memory_results = []
         key = "Memory"
         # Get these entries, but does not fail if not found
@@ -2829,20 +2917,14 @@ class RedfishUtils:
 
         memory_uri = data[key]["@odata.id"]
 
-        # Get a list of all DIMMs and build respective URIs
-        response = self.get_request(self.root_uri + memory_uri)
-        if response["ret"] is False:
-            return response
+        # Get all DIMMs
+        collection = self.get_collection_members(memory_uri, select=properties)
+        if collection["ret"] is False:
+            return collection
         result["ret"] = True
-        data = response["data"]
 
-        for dimm in data["Members"]:
-            memory_list.append(dimm["@odata.id"])
-
-        for m in memory_list:
+        for response in collection["members"]:
             dimm = {}
-            uri = self.root_uri + m
-            response = self.get_request(uri)
             if response["ret"] is False:
                 return response
             data = response["data"]
@@ -2922,8 +3004,7 @@ class RedfishUtils:
         for nic in data["Members"]:
             nic_list.append(nic["@odata.id"])
 
-        for n in nic_list:
-            nic = self.get_nic(n)
+        for nic in self._map_concurrently(self.get_nic, nic_list):
             if nic["ret"]:
                 nic_results.append(nic["entries"])
         result["entries"] = nic_results
@@ -70,6 +70,19 @@ options:
       - Remove any added source files and trees after adding to archive.
     type: bool
     default: false
+  manifest:
+    description:
+      - Keep a manifest of the archived paths next to the archive, in a file named after O(dest) with a C(.manifest) suffix.
+      - The manifest records the name, size, modification time, inode, mode and ownership of every source path, as well
+        as the size, modification time and inode of the archive itself.
+      - When the manifest matches the current state of the source paths and of the archive, the archive is neither read
+        nor rewritten and the module reports no change. This also lets check mode report accurately whether the archive
+        would change.
+      - Changes that do not alter any of the recorded attributes, for example a file rewritten in place with the same size
+        and modification time, are not detected.
+    type: bool
+    default: false
+    version_added: 13.3.0
 notes:
   - Can produce C(gzip), C(bzip2), C(lzma), and C(zip) compressed files or archives.
   - This module uses C(tarfile), C(zipfile), C(gzip), C(bz2), and C(lzma) packages on the target host to create archives. These are
@@ -135,6 +148,13 @@ EXAMPLES = r"""
     dest: /path/file.tar.gz
     format: gz
     force_archive: true
+
+- name: Archive a large log directory, skipping the rebuild when nothing changed since the last run
+  community.general.archive:
+    path: /var/log/app
+    dest: /backup/app-logs.tar.xz
+    format: xz
+    manifest: true
 """
 
 RETURN = r"""
@@ -178,12 +198,13 @@ import abc
 import bz2
 import glob
 import gzip
-import io
+import json
 import lzma
 import os
 import re
 import shutil
 import tarfile
+import tempfile
 import zipfile
 from fnmatch import fnmatch
 from traceback import format_exc
@@ -198,6 +219,8 @@ STATE_ARCHIVED = "archive"
 STATE_COMPRESSED = "compress"
 STATE_INCOMPLETE = "incomplete"
 
+MANIFEST_VERSION = 1
+
 
 def common_path(paths):
     empty = b"" if paths and isinstance(paths[0], bytes) else ""
@@ -254,6 +277,7 @@ class Archive(metaclass=abc.ABCMeta):
         self.format = module.params["format"]
         self.must_archive = module.params["force_archive"]
         self.remove = module.params["remove"]
+        self.use_manifest = module.params["manifest"]
 
         self.changed = False
         self.destination_state = STATE_ABSENT
@@ -295,8 +319,15 @@ class Archive(metaclass=abc.ABCMeta):
         if self.remove:
             self._check_removal_safety()
 
-        self.original_checksums = self.destination_checksums()
-        self.original_size = self.destination_size()
+        self.manifest_path = self.destination + b".manifest" if self.use_manifest else None
+
+        # With a manifest the (possibly expensive) scan of the existing archive is deferred until it is known
+        # that the archive has to be rebuilt.
+        self.original_checksums = None
+        self.original_size = 0
+        self.original_recorded = False
+        if not self.use_manifest:
+            self.record_original()
 
     def add(self, path, archive_name):
         try:
@@ -359,6 +390,12 @@ class Archive(metaclass=abc.ABCMeta):
                 msg=f"Errors when writing archive at {_to_native(self.destination)}: {'; '.join(self.errors)}"
             )
 
+    def record_original(self):
+        if not self.original_recorded:
+            self.original_checksums = self.destination_checksums()
+            self.original_size = self.destination_size()
+            self.original_recorded = True
+
     def is_different_from_original(self):
         if self.original_checksums is None:
             return self.original_size != self.destination_size()
@@ -392,6 +429,55 @@ class Archive(metaclass=abc.ABCMeta):
     def has_unfound_targets(self):
         return bool(self.not_found)
 
+    def manifest_matches(self):
+        """Return whether the stored manifest describes the current sources and archive.
+
+        On a match the archived paths recorded in the manifest are restored into ``successes``.
+        """
+        if not self.use_manifest or not self.destination_exists():
+            return False
+
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        try:
+            current = self._build_manifest()
+        except OSError:
+            # a source path was removed while it was being examined
+            return False
+
+        if manifest != dict(current, archived=manifest.get("archived")):
+            return False
+
+        self.successes = [_to_bytes(p) for p in manifest["archived"]]
+        return True
+
+    def write_manifest(self):
+        try:
+            manifest = dict(self._build_manifest(), archived=[_to_native(p) for p in self.successes])
+        except OSError:
+            # a source path was removed after it was archived; without a manifest the next run checks the archive itself
+            try:
+                os.remove(self.manifest_path)
+            except OSError:
+                pass
+            return
+        fd, tmp_path = tempfile.mkstemp(prefix=b".", suffix=b".tmp", dir=os.path.dirname(self.manifest_path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            os.remove(tmp_path)
+            self.module.fail_json(
+                path=_to_native(self.manifest_path),
+                msg=f"Unable to write archive manifest: {e}",
+                exception=format_exc(),
+            )
+        self.module.atomic_move(tmp_path, self.manifest_path)
+
     def remove_single_target(self, path):
         try:
             os.remove(path)
@@ -439,6 +525,43 @@ class Archive(metaclass=abc.ABCMeta):
             "expanded_exclude_paths": [_to_native(p) for p in self.expanded_exclude_paths],
         }
 
+    def _build_manifest(self):
+        ignored = (self.destination, self.manifest_path)
+        entries = []
+
+        def add_entry(path):
+            if path in ignored:
+                return
+            st = os.lstat(path)
+            entries.append(
+                [
+                    _to_native(strip_prefix(self.root, path)),
+                    st.st_mode,
+                    st.st_uid,
+                    st.st_gid,
+                    st.st_size,
+                    st.st_mtime_ns,
+                    st.st_ino,
+                ]
+            )
+
+        for target in self.targets:
+            add_entry(target)
+            if self.must_archive and os.path.isdir(target):
+                for directory_path, directory_names, file_names in os.walk(target, topdown=True):
+                    for name in directory_names + file_names:
+                        add_entry(os.path.join(directory_path, name))
+
+        st = os.stat(self.destination)
+        return {
+            "version": MANIFEST_VERSION,
+            "format": self.format,
+            "must_archive": self.must_archive,
+            "exclusion_patterns": self.exclusion_patterns,
+            "destination": [st.st_size, st.st_mtime_ns, st.st_ino],
+            "entries": entries,
+        }
+
     def _check_removal_safety(self):
         for path in self.paths:
             if os.path.isdir(path) and self.destination.startswith(os.path.join(path, b"")):
@@ -515,14 +638,9 @@ class ZipArchive(Archive):
 class TarArchive(Archive):
     def __init__(self, module):
         super().__init__(module)
-        self.fileIO = None
 
     def close(self):
         self.file.close()
-        if self.format == "xz":
-            with lzma.open(_to_native(self.destination), "wb") as f:
-                f.write(self.fileIO.getvalue())
-            self.fileIO.close()
 
     def contains(self, name):
         try:
@@ -532,13 +650,10 @@ class TarArchive(Archive):
         return True
 
     def open(self):
-        if self.format in ("gz", "bz2"):
+        # Compressed archives are written in stream mode so that memory usage stays bounded
+        # regardless of the size of the source tree.
+        if self.format in ("gz", "bz2", "xz"):
             self.file = tarfile.open(_to_native_ascii(self.destination), f"w|{self.format}")
-        # python3 tarfile module allows xz format but for python2 we have to create the tarfile
-        # in memory and then compress it with lzma.
-        elif self.format == "xz":
-            self.fileIO = io.BytesIO()
-            self.file = tarfile.open(fileobj=self.fileIO, mode="w")
         elif self.format == "tar":
             self.file = tarfile.open(_to_native_ascii(self.destination), "w")
         else:
@@ -598,6 +713,7 @@ def create_module() -> AnsibleModule:
             exclusion_patterns=dict(type="list", elements="path"),
             force_archive=dict(type="bool", default=False),
             remove=dict(type="bool", default=False),
+            manifest=dict(type="bool", default=False),
         ),
         add_file_common_args=True,
         supports_check_mode=True,
@@ -617,22 +733,34 @@ def main():
         if archive.destination_exists():
             archive.destination_state = STATE_ARCHIVED if is_archive(archive.destination) else STATE_COMPRESSED
     elif archive.has_targets() and archive.must_archive:
+        unchanged = archive.manifest_matches()
         if check_mode:
-            archive.changed = True
+            archive.changed = not unchanged
         else:
-            archive.add_targets()
+            if not unchanged:
+                archive.record_original()
+                archive.add_targets()
+                archive.changed |= archive.is_different_from_original()
+                if archive.use_manifest:
+                    archive.write_manifest()
             archive.destination_state = STATE_INCOMPLETE if archive.has_unfound_targets() else STATE_ARCHIVED
-            archive.changed |= archive.is_different_from_original()
             if archive.remove:
                 archive.remove_targets()
     else:
+        unchanged = archive.manifest_matches()
         if check_mode:
-            if not archive.destination_exists():
+            if not archive.destination_exists() or (archive.use_manifest and not unchanged):
                 archive.changed = True
         else:
             path = archive.paths[0]
-            archive.add_single_target(path)
-            archive.changed |= archive.is_different_from_original()
+            if unchanged:
+                archive.destination_state = STATE_ARCHIVED if archive.format in ("zip", "tar") else STATE_COMPRESSED
+            else:
+                archive.record_original()
+                archive.add_single_target(path)
+                archive.changed |= archive.is_different_from_original()
+                if archive.use_manifest:
+                    archive.write_manifest()
             if archive.remove:
                 archive.remove_single_target(path)
 
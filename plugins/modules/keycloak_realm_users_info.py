@@ -32,6 +32,37 @@ options:
     description:
       - The Keycloak realm from which users should be retrieved.
     default: 'master'
+  search:
+    type: str
+    description:
+      - Only retrieve the users whose username, first name, last name or email contain this string.
+    version_added: 13.3.0
+  q:
+    type: dict
+    description:
+      - Only retrieve the users whose custom attributes have these values.
+    version_added: 13.3.0
+  brief_representation:
+    type: bool
+    description:
+      - Whether Keycloak should only return the basic fields of the users.
+      - If not set, the default of the Keycloak server is used.
+    version_added: 13.3.0
+  fields:
+    type: list
+    elements: str
+    description:
+      - Only return these fields of the users, for example V(id) and V(username).
+      - This keeps the memory used by the module and the size of the result low on realms with many users.
+      - If not set, all fields returned by Keycloak are returned.
+    version_added: 13.3.0
+  page_size:
+    type: int
+    description:
+      - Number of users requested from Keycloak at once.
+      - The users are requested page by page until all matching users have been retrieved.
+    default: 100
+    version_added: 13.3.0
 
 extends_documentation_fragment:
   - community.general._keycloak
@@ -61,6 +92,21 @@ EXAMPLES = r"""
     auth_keycloak_url: https://auth.example.com/auth
     token: TOKEN
   delegate_to: localhost
+
+- name: List the IDs and usernames of the users of a department
+  community.general.keycloak_realm_users_info:
+    realm: MyCustomRealm
+    auth_client_id: admin-cli
+    auth_keycloak_url: https://auth.example.com/auth
+    token: TOKEN
+    q:
+      department: sales
+    brief_representation: true
+    fields:
+      - id
+      - username
+    page_size: 500
+  delegate_to: localhost
 """
 
 RETURN = r"""
@@ -92,6 +138,11 @@ def main():
     argument_spec = keycloak_argument_spec()
 
     argument_spec["realm"] = dict(default="master")
+    argument_spec["search"] = dict(type="str")
+    argument_spec["q"] = dict(type="dict")
+    argument_spec["brief_representation"] = dict(type="bool")
+    argument_spec["fields"] = dict(type="list", elements="str")
+    argument_spec["page_size"] = dict(type="int", default=100)
 
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -105,6 +156,10 @@ def main():
 
     result = dict(changed=False, msg="", users="")
 
+    page_size = module.params.get("page_size")
+    if page_size < 1:
+        module.fail_json(msg="page_size must be at least 1")
+
     # Obtain access token, initialize API
     try:
         connection_header = get_token(module.params)
@@ -114,8 +169,16 @@ def main():
     kc = KeycloakAPI(module, connection_header)
 
     realm = module.params.get("realm")
-
-    result["users"] = kc.get_realm_users(realm=realm)
+    q = module.params.get("q")
+    filters = {
+        "search": module.params.get("search"),
+        "q": " ".join(f"{key}:{value}" for key, value in q.items()) if q else None,
+        "briefRepresentation": module.params.get("brief_representation"),
+    }
+
+    result["users"] = kc.get_realm_users(
+        realm=realm, page_size=page_size, filters=filters, fields=module.params.get("fields")
+    )
     module.exit_json(**result)
 
 
@@ -0,0 +1,164 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import atexit
+import collections
+import threading
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible.utils.display import Display
+
+
+class BatchSender:
+    """
+    Deliver events from a background thread, in batches.
+
+    Events are buffered in memory until ``batch_size`` events are pending or
+    ``flush_interval`` seconds have passed since the last delivery, and are then
+    handed over to ``send`` as a list. Failed deliveries are retried with an
+    exponential backoff. When the buffer holds more than ``max_buffer_size``
+    bytes, new events are dropped and counted in ``dropped`` instead of
+    blocking the caller.
+
+    Events are usually serialized strings, whose length is their size. Other
+    objects can be queued when their size is passed explicitly to ``put``.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[t.Any]], None],
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_buffer_size: int = 16 * 1024 * 1024,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        display: Display | None = None,
+        name: str = "events",
+    ) -> None:
+        self._send = send
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._display = display
+        self._name = name
+
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: Exception | None = None
+
+        self._buffer: collections.deque[tuple[t.Any, int]] = collections.deque()
+        self._buffer_size = 0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=f"{name}-sender", daemon=True)
+        self._thread.start()
+
+    def put(self, event: t.Any, size: int | None = None) -> bool:
+        """Queue an event for delivery. Return whether it was accepted."""
+        if size is None:
+            size = len(event)
+        with self._condition:
+            if self._closed or self._buffer_size + size > self.max_buffer_size:
+                self.dropped += 1
+                return False
+            self._buffer.append((event, size))
+            self._buffer_size += size
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait until all queued events have been delivered or given up on."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._buffer or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            self._flush_requested = False
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver the pending events and stop the background thread."""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        # warnings are only emitted here, from the main thread
+        if self._display and self.dropped:
+            self._display.warning(f"{self._name}: {self.dropped} event(s) were dropped because the buffer was full.")
+        if self._display and self.failed:
+            self._display.warning(f"{self._name}: {self.failed} event(s) could not be delivered: {self.last_error}")
+
+    def close_at_exit(self, timeout: float | None = None) -> None:
+        """
+        Close the sender when the Python interpreter exits.
+
+        Meant for callback plugins, which outlive a single playbook: the pending events
+        are only delivered, and the warnings about lost events reported, at exit.
+        """
+        atexit.register(self.close, timeout)
+
+    def _next_batch(self) -> list[t.Any] | None:
+        with self._condition:
+            last_delivery = time.monotonic()
+            while not self._closed:
+                if len(self._buffer) >= self.batch_size or (self._buffer and self._flush_requested):
+                    break
+                remaining = last_delivery + self.flush_interval - time.monotonic()
+                if remaining <= 0:
+                    if self._buffer:
+                        break
+                    last_delivery = time.monotonic()
+                    remaining = self.flush_interval
+                self._condition.wait(remaining)
+            if not self._buffer:
+                return None
+            batch = [self._buffer.popleft() for dummy in range(min(self.batch_size, len(self._buffer)))]
+            self._buffer_size -= sum(size for dummy, size in batch)
+            self._in_flight = len(batch)
+            return [event for event, dummy in batch]
+
+    def _deliver(self, batch: list[t.Any]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._send(batch)
+                self.sent += len(batch)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.failed += len(batch)
+                    self.last_error = e
+                    return
+                time.sleep(self.retry_delay * 2**attempt)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._deliver(batch)
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
@@ -0,0 +1,65 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible.plugins.inventory import Cacheable
+
+
+class InventoryCache:
+    """
+    Read and write the data of an inventory source in the inventory cache.
+
+    ``plugin`` is a ``Cacheable`` inventory plugin whose configuration has been
+    read, and whose documentation extends ``ansible.builtin.inventory_cache``.
+    ``cache`` is the argument passed to its ``parse()`` method, which is false
+    when the inventory is being refreshed.
+
+    Cached data is only used when the user enabled the cache. Data is written
+    back when the cache is enabled and was empty, expired, invalid or being
+    refreshed. It must be serializable by the configured cache plugin.
+    """
+
+    def __init__(self, plugin: Cacheable, path: str, cache: bool = True) -> None:
+        self._plugin = plugin
+        self.key = plugin.get_cache_key(path)
+        enabled = plugin.get_option("cache")
+        self._use_cache = enabled and cache
+        self.needs_update = enabled and not cache
+
+    def read(self, validate: Callable[[t.Any], bool] | None = None) -> t.Any:
+        """Return the cached data, or None if there is none that can be used."""
+        if not self._use_cache:
+            return None
+        try:
+            data = self._plugin._cache[self.key]
+        except KeyError:
+            # not cached yet, or expired
+            self.needs_update = True
+            return None
+        if validate is not None and not validate(data):
+            self.needs_update = True
+            return None
+        return data
+
+    def write(self, data: t.Any) -> None:
+        """Store fresh data, if the cache needs to be updated."""
+        if self.needs_update:
+            self._plugin._cache[self.key] = data
+
+    def get(self, fetch: Callable[[], t.Any], validate: Callable[[t.Any], bool] | None = None) -> t.Any:
+        """Return the cached data, or the data returned by ``fetch`` which is then cached."""
+        data = self.read(validate)
+        if data is None:
+            data = fetch()
+            self.write(data)
+        return data
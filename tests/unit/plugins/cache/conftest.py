@@ -0,0 +1,18 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import pytest
+from ansible.plugins.loader import cache_loader
+
+
+@pytest.fixture
+def cache_plugin():
+    def _cache_plugin(name, **options):
+        cache = cache_loader.get(name, **options)
+        # newer ansible-core versions wrap persistent cache plugins in a proxy that alters keys and values
+        return getattr(cache, "__wrapped__", cache)
+
+    return _cache_plugin
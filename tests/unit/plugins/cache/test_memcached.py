@@ -5,10 +5,13 @@
 # Make coding more python3-ish
 from __future__ import annotations
 
+import copy
+
 import pytest
 
-pytest.importorskip("memcache")
+memcache = pytest.importorskip("memcache")
 
+from ansible.errors import AnsibleError
 from ansible.plugins.loader import cache_loader
 
 from ansible_collections.community.general.plugins.cache.memcached import CacheModule as MemcachedCache
@@ -16,3 +19,87 @@ from ansible_collections.community.general.plugins.cache.memcached import CacheM
 
 def test_memcached_cachemodule():
     assert isinstance(cache_loader.get("community.general.memcached"), MemcachedCache)
+
+
+class FakeMemcacheClient:
+    """Minimal in-memory stand-in for memcache.Client that records the written keys."""
+
+    def __init__(self, store):
+        self.store = store
+        self.written = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def get_multi(self, keys, key_prefix=""):
+        return {key: self.store[key_prefix + key] for key in keys if key_prefix + key in self.store}
+
+    def set(self, key, value, time=0, min_compress_len=0):
+        self.written.append(key)
+        self.store[key] = copy.deepcopy(value)
+
+    def set_multi(self, mapping, time=0, key_prefix=""):
+        for key, value in mapping.items():
+            self.set(key_prefix + key, value)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def memcached_client(monkeypatch):
+    client = FakeMemcacheClient({})
+    monkeypatch.setattr(memcache, "Client", lambda *args, **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def memcached_cache(memcached_client, cache_plugin):
+    def _memcached_cache(**options):
+        return cache_plugin("community.general.memcached", **options)
+
+    return _memcached_cache
+
+
+def test_memcached_keyset_single_shard(memcached_client, memcached_cache):
+    cache = memcached_cache()
+    cache.set("host1", {"a": 1})
+
+    assert memcached_client.written == ["ansible_factshost1", "ansible_cache_keys"]
+    assert list(memcached_client.store["ansible_cache_keys"]) == ["host1"]
+    assert memcached_cache().keys() == ["host1"]
+
+
+def test_memcached_keyset_shards(memcached_client, memcached_cache):
+    cache = memcached_cache(_keyset_shards=8)
+    for index in range(32):
+        cache.set(f"host{index}", {"index": index})
+
+    shards = [memcached_client.store.get(f"ansible_cache_keys_{index}", {}) for index in range(8)]
+    assert sum(len(shard) for shard in shards) == 32
+    assert max(len(shard) for shard in shards) < 32
+
+    other = memcached_cache(_keyset_shards=8)
+    assert sorted(other.keys()) == sorted(f"host{index}" for index in range(32))
+    assert other.contains("host3")
+
+    memcached_client.written = []
+    other.keys()
+    assert memcached_client.written == []
+
+
+@pytest.mark.parametrize("shards", [0, -1])
+def test_memcached_keyset_shards_invalid(memcached_cache, shards):
+    with pytest.raises(AnsibleError, match="at least 1"):
+        memcached_cache(_keyset_shards=shards)
+
+
+def test_memcached_prefetch(memcached_client, memcached_cache):
+    cache = memcached_cache()
+    cache.set("host1", {"a": 1})
+    cache.set("host2", {"b": 2})
+
+    cache = memcached_cache(_prefetch=True)
+    memcached_client.get = None
+    assert cache.get("host1") == {"a": 1}
+    assert cache.get("host2") == {"b": 2}
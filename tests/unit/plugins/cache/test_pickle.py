@@ -0,0 +1,32 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import pytest
+from ansible.plugins.loader import cache_loader
+
+from ansible_collections.community.general.plugins.cache.pickle import CacheModule as PickleCache
+
+FACTS = {"ansible_hostname": "host1", "ansible_interfaces": ["lo", "eth0"] * 50}
+
+
+def test_pickle_cachemodule(tmp_path):
+    assert isinstance(cache_loader.get("community.general.pickle", _uri=str(tmp_path)), PickleCache)
+
+
+@pytest.mark.parametrize("compression, magic", [("gzip", b"\x1f\x8b"), ("bz2", b"BZh"), ("lzma", b"\xfd7zXZ\x00")])
+def test_pickle_compression(tmp_path, compression, magic):
+    cache = cache_loader.get("community.general.pickle", _uri=str(tmp_path), _compression=compression)
+    cache.set("host1", FACTS)
+
+    assert (tmp_path / "host1").read_bytes().startswith(magic)
+    assert cache_loader.get("community.general.pickle", _uri=str(tmp_path)).get("host1") == FACTS
+
+
+def test_pickle_reads_uncompressed_files(tmp_path):
+    cache_loader.get("community.general.pickle", _uri=str(tmp_path)).set("host1", FACTS)
+
+    cache = cache_loader.get("community.general.pickle", _uri=str(tmp_path), _compression="gzip")
+    assert cache.get("host1") == FACTS
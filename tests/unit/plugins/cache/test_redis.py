@@ -5,6 +5,8 @@
 # Make coding more python3-ish
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import pytest
 
 pytest.importorskip("redis")
@@ -24,3 +26,57 @@ def test_redis_cachemodule_2():
     # The _uri option is required for the redis plugin
     connection = "[::1]:6379:1"
     assert isinstance(cache_loader.get("community.general.redis", **{"_uri": connection}), RedisCache)
+
+
+@pytest.fixture
+def redis_cache(cache_plugin):
+    def _redis_cache(**options):
+        cache = cache_plugin("community.general.redis", _uri="127.0.0.1:6379:1", **options)
+        cache._db = MagicMock()
+        return cache
+
+    return _redis_cache
+
+
+def test_redis_set_is_pipelined_and_compact(redis_cache):
+    cache = redis_cache()
+    cache.set("host1", {"b": 1, "a": [1, 2]})
+
+    cache._db.setex.assert_not_called()
+    pipe = cache._db.pipeline.return_value
+    pipe.setex.assert_called_once_with("ansible_factshost1", 86400, '{"b":1,"a":[1,2]}')
+    pipe.zadd.assert_called_once()
+    pipe.execute.assert_called_once_with()
+
+
+def test_redis_expire_interval(redis_cache):
+    cache = redis_cache(_expire_interval=3600)
+    cache._db.zrank.return_value = 0
+
+    for dummy in range(3):
+        assert cache.contains("host1")
+        cache.keys()
+    assert cache._db.zremrangebyscore.call_count == 1
+
+
+def test_redis_expire_every_call_by_default(redis_cache):
+    cache = redis_cache()
+    cache._db.zrank.return_value = 0
+
+    for dummy in range(3):
+        cache.contains("host1")
+    assert cache._db.zremrangebyscore.call_count == 3
+
+
+def test_redis_prefetch(redis_cache):
+    cache = redis_cache(_prefetch=True)
+    cache._db.zrange.return_value = [b"host1", b"host2", b"host3"]
+    cache._db.mget.return_value = ['{"a":1}', None, '{"c":3}']
+
+    assert cache.get("host1") == {"a": 1}
+    assert cache.contains("host3")
+    assert cache.get("host3") == {"c": 3}
+
+    cache._db.mget.assert_called_once_with(["ansible_factshost1", "ansible_factshost2", "ansible_factshost3"])
+    cache._db.get.assert_not_called()
+    cache._db.zrank.assert_not_called()
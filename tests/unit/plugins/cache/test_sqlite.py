@@ -0,0 +1,62 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ansible_collections.community.general.plugins.cache.sqlite import CacheModule as SqliteCache
+
+
+@pytest.fixture
+def sqlite_cache(cache_plugin, tmp_path):
+    def _sqlite_cache(**options):
+        return cache_plugin("community.general.sqlite", _uri=str(tmp_path / "cache.db"), **options)
+
+    return _sqlite_cache
+
+
+def test_sqlite_cachemodule(sqlite_cache):
+    assert isinstance(sqlite_cache(), SqliteCache)
+
+
+def test_sqlite_roundtrip(sqlite_cache):
+    cache = sqlite_cache()
+    cache.set("host1", {"a": 1})
+    cache.set("host2", {"b": [1, 2]})
+
+    other = sqlite_cache()
+    assert sorted(other.keys()) == ["host1", "host2"]
+    assert other.contains("host2")
+    assert other.get("host2") == {"b": [1, 2]}
+
+    other.delete("host1")
+    assert other.keys() == ["host2"]
+    assert not other.contains("host1")
+
+    other.flush()
+    assert other.keys() == []
+
+
+def test_sqlite_prefix_isolation(sqlite_cache):
+    sqlite_cache(_prefix="one_").set("host1", {"a": 1})
+    cache = sqlite_cache(_prefix="two_")
+    cache.set("host2", {"a": 2})
+
+    assert cache.keys() == ["host2"]
+    cache.flush()
+    assert sqlite_cache(_prefix="one_").keys() == ["host1"]
+
+
+def test_sqlite_expiry(sqlite_cache, monkeypatch):
+    cache = sqlite_cache(_timeout=60)
+    cache.set("host1", {"a": 1})
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    cache = sqlite_cache(_timeout=60)
+    assert not cache.contains("host1")
+    assert cache.keys() == []
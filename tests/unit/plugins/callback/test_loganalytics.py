@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from ansible.executor.task_result import TaskResult
+from ansible.plugins.loader import callback_loader
 from ansible.release import __version__ as ansible_release
 
 from ansible_collections.community.general.plugins.callback.loganalytics import AzureLogAnalyticsSource
@@ -77,3 +78,49 @@ class TestAzureLogAnalytics(unittest.TestCase):
 
         self.assertRegex(headers["Authorization"], r"^SharedKey 01234567-0123-0123-0123-01234567890a:.*=$")
         self.assertEqual(headers["Log-Type"], "ansible_playbook")
+
+    @patch("ansible_collections.community.general.plugins.callback.loganalytics.now")
+    @patch("ansible_collections.community.general.plugins.callback.loganalytics.open_url")
+    def test_send_events_batch(self, open_url_mock, mock_now):
+        mock_now.return_value = datetime(2020, 12, 1)
+
+        self.loganalytics.send_events(
+            workspace_id="01234567-0123-0123-0123-01234567890a",
+            shared_key="dZD0kCbKl3ehZG6LHFMuhtE0yHiFCmetzFMc2u+roXIUQuatqU924SsAAAAPemhjbGlAemhjbGktTUJQAQIDBA==",
+            events=['{"event": {"uuid": "1"}}', '{"event": {"uuid": "2"}}'],
+        )
+
+        args, kwargs = open_url_mock.call_args
+        sent_data = json.loads(args[1])
+
+        self.assertEqual([item["event"]["uuid"] for item in sent_data], ["1", "2"])
+
+
+class TestAzureLogAnalyticsCallback(unittest.TestCase):
+    @patch("ansible_collections.community.general.plugins.plugin_utils._batch_sender.atexit")
+    def setUp(self, mock_atexit):
+        self.callback = callback_loader.get("community.general.loganalytics")
+        self.callback.set_options(
+            direct={
+                "workspace_id": "01234567-0123-0123-0123-01234567890a",
+                "shared_key": "dZD0kCbKl3ehZG6LHFMuhtE0yHiFCmetzFMc2u+roXIUQuatqU924SsAAAAPemhjbGlAemhjbGktTUJQAQIDBA==",
+                "asynchronous": True,
+            }
+        )
+        self.callback.loganalytics.send_events = Mock()
+        self.callback.loganalytics.build_event = Mock(side_effect=lambda *args: f'{{"state": "{args[0]}"}}')
+        self.callback._seconds_since_start = Mock(return_value=0)
+        mock_atexit.register.assert_called_once_with(self.callback.sender.close, None)
+
+    def tearDown(self):
+        self.callback.sender.close()
+
+    def test_events_are_delivered_after_every_playbook(self):
+        self.callback.v2_runner_on_ok(Mock())
+        self.callback.v2_playbook_on_stats(Mock())
+        self.callback.v2_runner_on_failed(Mock())
+        self.callback.v2_playbook_on_stats(Mock())
+
+        sent = [event for args, kwargs in self.callback.loganalytics.send_events.call_args_list for event in args[2]]
+        self.assertEqual(sent, ['{"state": "OK"}', '{"state": "FAILED"}'])
+        self.assertEqual(self.callback.sender.dropped, 0)
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from ansible.executor.task_result import TaskResult
 from ansible.playbook.task import Task
+from ansible.plugins.loader import callback_loader
 from ansible.release import __version__ as ansible_release
 
 from ansible_collections.community.general.plugins.callback.opentelemetry import HostData, OpenTelemetrySource, TaskData
@@ -93,6 +94,35 @@ class TestOpentelemetry(unittest.TestCase):
         self.assertEqual(host_data.name, "include")
         self.assertEqual(host_data.status, "ok")
 
+    @patch("ansible_collections.community.general.plugins.callback.opentelemetry.trace", create=True)
+    def test_export_host(self, mock_trace):
+        tasks_data = OrderedDict()
+        self.opentelemetry.tracer = MagicMock()
+        self.opentelemetry.parent_span = self.mock_span
+        self.opentelemetry.update_span_data = MagicMock()
+
+        self.opentelemetry.start_task(tasks_data, False, "myplay", self.mock_task, self.mock_host)
+        other_host = Mock("MockHost")
+        other_host.name = "otherhost"
+        other_host._uuid = "otherhost_uuid"
+        self.opentelemetry.start_task(tasks_data, False, "myplay", self.mock_task, other_host)
+        host_uuid = self.opentelemetry.finish_task(tasks_data, "ok", self.my_task_result, "{}")
+        self.assertEqual(host_uuid, "myhost_uuid")
+
+        self.opentelemetry.export_host(tasks_data, "myuuid", host_uuid, False, False)
+
+        self.opentelemetry.update_span_data.assert_called_once()
+        self.assertEqual(self.opentelemetry.update_span_data.call_args[0][1].uuid, "myhost_uuid")
+        self.assertNotIn("myhost_uuid", tasks_data["myuuid"].host_data)
+        self.assertIsNone(tasks_data["myuuid"].dump)
+
+        self.opentelemetry.end_trace(tasks_data, "mystatus", False, False)
+
+        self.assertEqual(self.opentelemetry.update_span_data.call_count, 2)
+        self.assertEqual(tasks_data, {})
+        self.mock_span.set_status.assert_called_once_with("mystatus")
+        self.mock_span.end.assert_called_once()
+
     @patch("ansible_collections.community.general.plugins.callback.opentelemetry.Status", create=True)
     @patch("ansible_collections.community.general.plugins.callback.opentelemetry.StatusCode", create=True)
     def test_update_span_data(self, mock_status_code, mock_status):
@@ -242,3 +272,48 @@ def generate_test_data(exception=None, msg=None, stderr=None, failed=False):
         res_data["stderr"] = stderr
     res_data["failed"] = failed
     return res_data
+
+
+class TestOpentelemetryCallback(unittest.TestCase):
+    def setUp(self):
+        self.callback = callback_loader.get("community.general.opentelemetry")
+        self.callback.set_options(direct={"incremental_export": True})
+        self.tracer = MagicMock()
+        self.callback.opentelemetry.create_tracer = MagicMock(return_value=(self.tracer, None))
+        self.callback.opentelemetry.update_span_data = MagicMock()
+        self.mock_host = Mock("MockHost")
+        self.mock_host.name = "myhost"
+        self.mock_host._uuid = "myhost_uuid"
+        self.mock_task = Task()
+        self.mock_task.action = "include_tasks"
+        self.mock_task.no_log = False
+        self.mock_task._uuid = "myuuid"
+        self.mock_task.args = {}
+        self.mock_task.get_name = MagicMock(return_value="mytask")
+        self.mock_task.get_path = MagicMock(return_value="/mypath")
+
+    def test_include_after_incremental_export(self):
+        result = TaskResult(host=self.mock_host, task=self.mock_task, return_data={}, task_fields={"args": {}})
+        included_file = Mock(spec=["_task"])
+        included_file._task = self.mock_task
+
+        self.callback.v2_runner_on_start(self.mock_host, self.mock_task)
+        self.callback.v2_runner_on_ok(result)
+        self.callback.v2_playbook_on_include(included_file)
+
+        self.callback.opentelemetry.update_span_data.assert_called_once()
+        self.assertEqual(self.callback.tasks_data, {})
+
+    def test_every_playbook_gets_its_own_trace(self):
+        result = TaskResult(host=self.mock_host, task=self.mock_task, return_data={}, task_fields={"args": {}})
+
+        for dummy in range(2):
+            self.callback.v2_runner_on_start(self.mock_host, self.mock_task)
+            self.callback.v2_runner_on_ok(result)
+            self.callback.v2_playbook_on_stats(Mock())
+            self.assertIsNone(self.callback.opentelemetry.parent_span)
+
+        self.callback.opentelemetry.create_tracer.assert_called_once()
+        # one playbook span and one task span per playbook
+        self.assertEqual(self.tracer.start_span.call_count, 4)
+        self.assertEqual(self.tracer.start_span.return_value.end.call_count, 2)
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import unittest
 from datetime import datetime
@@ -11,6 +12,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from ansible.executor.task_result import TaskResult
+from ansible.plugins.loader import callback_loader
 from ansible.release import __version__ as ansible_release
 
 from ansible_collections.community.general.plugins.callback.splunk import SplunkHTTPCollectorSource
@@ -80,3 +82,45 @@ class TestSplunkClient(unittest.TestCase):
         self.assertEqual(sent_data["event"]["timestamp"], "2020-12-01 00:00:00 +0000")
         self.assertEqual(sent_data["event"]["host"], "my-host")
         self.assertEqual(sent_data["event"]["ip_address"], "1.2.3.4")
+
+    @patch("ansible_collections.community.general.plugins.callback.splunk.open_url")
+    def test_send_events_batch(self, open_url_mock):
+        self.splunk.send_events("endpoint", "token", False, ['{"event": 1}', '{"event": 2}'])
+
+        args, kwargs = open_url_mock.call_args
+        self.assertEqual(args[1], '{"event": 1}\n{"event": 2}')
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+
+    @patch("ansible_collections.community.general.plugins.callback.splunk.open_url")
+    def test_send_events_compressed(self, open_url_mock):
+        self.splunk.send_events("endpoint", "token", False, ['{"event": 1}'], compress=True)
+
+        args, kwargs = open_url_mock.call_args
+        self.assertEqual(gzip.decompress(args[1]), b'{"event": 1}')
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+
+
+class TestSplunkCallback(unittest.TestCase):
+    @patch("ansible_collections.community.general.plugins.plugin_utils._batch_sender.atexit")
+    def setUp(self, mock_atexit):
+        self.callback = callback_loader.get("community.general.splunk")
+        self.callback.set_options(
+            direct={"url": "https://splunk.example.com", "authtoken": "token", "asynchronous": True}
+        )
+        self.callback.splunk.send_events = Mock()
+        self.callback.splunk.build_event = Mock(side_effect=lambda *args: f'{{"state": "{args[2]}"}}')
+        self.callback._runtime = Mock(return_value=0)
+        mock_atexit.register.assert_called_once_with(self.callback.sender.close, None)
+
+    def tearDown(self):
+        self.callback.sender.close()
+
+    def test_events_are_delivered_after_every_playbook(self):
+        self.callback.v2_runner_on_ok(Mock())
+        self.callback.v2_playbook_on_stats(Mock())
+        self.callback.v2_runner_on_failed(Mock())
+        self.callback.v2_playbook_on_stats(Mock())
+
+        sent = [event for args, kwargs in self.callback.splunk.send_events.call_args_list for event in args[3]]
+        self.assertEqual(sent, ['{"state": "OK"}', '{"state": "FAILED"}'])
+        self.assertEqual(self.callback.sender.dropped, 0)
@@ -0,0 +1,40 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import Mock, patch
+
+import pytest
+from ansible.plugins.loader import callback_loader
+from ansible.release import __version__ as ansible_release
+
+if tuple(int(x) for x in ansible_release.split(".")[:2]) >= (2, 21):
+    # https://github.com/ansible/ansible/issues/86761
+    pytest.skip("Temporarily skipping callback tests for ansible-core >= 2.21", allow_module_level=True)
+
+
+class TestSumologicCallback(unittest.TestCase):
+    @patch("ansible_collections.community.general.plugins.plugin_utils._batch_sender.atexit")
+    def setUp(self, mock_atexit):
+        self.callback = callback_loader.get("community.general.sumologic")
+        self.callback.set_options(direct={"url": "https://sumologic.example.com", "asynchronous": True})
+        self.callback.sumologic.send_events = Mock()
+        self.callback.sumologic.build_event = Mock(side_effect=lambda *args: ("myhost", f'{{"state": "{args[0]}"}}'))
+        self.callback._runtime = Mock(return_value=0)
+        mock_atexit.register.assert_called_once_with(self.callback.sender.close, None)
+
+    def tearDown(self):
+        self.callback.sender.close()
+
+    def test_events_are_delivered_after_every_playbook(self):
+        self.callback.v2_runner_on_ok(Mock())
+        self.callback.v2_playbook_on_stats(Mock())
+        self.callback.v2_runner_on_failed(Mock())
+        self.callback.v2_playbook_on_stats(Mock())
+
+        sent = [event for args, kwargs in self.callback.sumologic.send_events.call_args_list for event in args[2]]
+        self.assertEqual(sent, ['{"state": "OK"}', '{"state": "FAILED"}'])
+        self.assertEqual(self.callback.sender.dropped, 0)
@@ -0,0 +1,18 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import pytest
+from ansible.plugins.cache import CachePluginAdjudicator
+
+
+@pytest.fixture
+def jsonfile_cache(tmp_path):
+    """Return a factory of inventory caches that persist to the same jsonfile cache directory."""
+
+    def _jsonfile_cache():
+        return CachePluginAdjudicator("ansible.builtin.jsonfile", _uri=str(tmp_path / "inventory_cache"))
+
+    return _jsonfile_cache
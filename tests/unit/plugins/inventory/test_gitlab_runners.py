@@ -0,0 +1,62 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+
+from ansible_collections.community.general.plugins.inventory.gitlab_runners import InventoryModule
+
+RUNNER_ATTRIBUTES = {
+    "id": 6,
+    "description": "test-1-20150125",
+    "ip_address": "198.51.100.6",
+    "active": True,
+    "paused": False,
+    "is_shared": False,
+    "runner_type": "project_type",
+    "tag_list": ["docker", "linux"],
+    "projects": [{"id": 1, "name": "GitLab Community Edition"}],
+}
+
+
+def test_parse_from_cache(mocker, jsonfile_cache):
+    options = {
+        "server_url": "https://gitlab.example.com",
+        "api_token": "token",
+        "verbose_output": True,
+        "compose": {},
+        "groups": {},
+        "keyed_groups": [],
+        "strict": False,
+        "cache": True,
+    }
+    mocker.patch("ansible_collections.community.general.plugins.inventory.gitlab_runners.HAS_GITLAB", True)
+    gitlab = mocker.patch("ansible_collections.community.general.plugins.inventory.gitlab_runners.gitlab", create=True)
+    gl = gitlab.Gitlab.return_value.__enter__.return_value
+    gl.runners.all.return_value = [{"id": 6, "ip_address": "198.51.100.6"}]
+    gl.runners.get.return_value = SimpleNamespace(_attrs=RUNNER_ATTRIBUTES)
+
+    for dummy in range(2):
+        plugin = InventoryModule()
+        mocker.patch.object(plugin, "_read_config_data")
+        mocker.patch.object(plugin, "get_option", side_effect=lambda option, default=None: options.get(option, default))
+        mocker.patch.object(plugin, "get_cache_key", return_value="gitlab_runners_cache")
+        plugin._cache = jsonfile_cache()
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), "gitlab_runners.yml", cache=True)
+        # done by the inventory manager after parsing, writes the cache through the jsonfile plugin
+        plugin.update_cache_if_changed()
+
+        host = inventory.get_host("6")
+        assert inventory.groups["gitlab_runners"].hosts == [host]
+        assert host.vars["ansible_host"] == "198.51.100.6"
+        assert host.vars["gitlab_runner_attributes"] == RUNNER_ATTRIBUTES
+
+    gitlab.Gitlab.assert_called_once()
+    gl.runners.all.assert_called_once_with()
+    gl.runners.get.assert_called_once_with(6)
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import pytest
 from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
 
 from ansible_collections.community.general.plugins.inventory.icinga2 import InventoryModule
 
@@ -148,3 +149,35 @@ def test_populate(inventory, mocker):
     host2_info = inventory.inventory.get_host("Test Host 2")
     assert host2_info is not None
     assert host2_info.get_vars().get("ansible_host") == "test-host2.home.local"
+
+
+def test_parse_from_cache(mocker, jsonfile_cache):
+    options = {
+        "url": "https://localhost:5665",
+        "user": "ansible",
+        "password": "password",
+        "inventory_attr": "address",
+        "group_by_hostgroups": True,
+        "cache": True,
+    }
+    api_connect = mocker.patch.object(InventoryModule, "_api_connect")
+    query = mocker.patch.object(InventoryModule, "_query_hosts", side_effect=query_hosts)
+
+    for dummy in range(2):
+        plugin = InventoryModule()
+        mocker.patch.object(plugin, "_read_config_data")
+        mocker.patch.object(plugin, "get_option", side_effect=lambda option: options.get(option, get_option(option)))
+        mocker.patch.object(plugin, "get_cache_key", return_value="icinga2_cache")
+        plugin._cache = jsonfile_cache()
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), "icinga2.yml", cache=True)
+        # done by the inventory manager after parsing, writes the cache through the jsonfile plugin
+        plugin.update_cache_if_changed()
+
+        assert inventory.groups["home_servers"].hosts == [
+            inventory.get_host("test-host1.home.local"),
+            inventory.get_host("test-host2.home.local"),
+        ]
+
+    api_connect.assert_called_once()
+    query.assert_called_once()
@@ -181,3 +181,28 @@ def test_build_inventory_fqdn_from_host_domain(inventory, mocker):
     assert len(inventory.inventory.groups["incus_r3"].child_groups) == 2
     assert len(inventory.inventory.groups["incus_r3_proj1"].hosts) == 1
     assert len(inventory.inventory.groups["incus_r3_proj2"].hosts) == 2
+
+
+def test_parse_from_cache(mocker):
+    plugin = InventoryModule()
+    options = {"default_groups": True, "remotes": ["r1"], "filters": [], "host_fqdn": True, "cache": True}
+    mocker.patch.object(plugin, "_read_config_data")
+    mocker.patch.object(plugin, "get_option", side_effect=_build_get_option(options))
+    mocker.patch.object(plugin, "get_cache_key", return_value="incus_cache")
+    run_incus = mocker.patch.object(plugin, "_run_incus", side_effect=run_incus_r1)
+    plugin._cache = {}
+
+    for dummy in range(2):
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), "incus.yml", cache=True)
+        assert inventory.get_host("c1.default.r1")
+        assert inventory.groups["incus_r1_default"].hosts == [inventory.get_host("c1.default.r1")]
+
+    assert run_incus.call_count == 2
+    assert plugin._cache["incus_cache"] == {"r1": {"default": [_make_host("c1")]}}
+
+
+def run_incus_r1(*args):
+    if args == ("list", "r1:", "--project", "default"):
+        return [_make_host("c1")]
+    return run_incus(*args)
@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import Mock
+
 import pytest
 from ansible.inventory.data import InventoryData
 
@@ -120,3 +122,81 @@ def test_build_inventory_groups_with_no_groupselection(inventory):
         if generated_data[key] != value:
             eq = False
     assert eq
+
+
+class FakeLXDClient:
+    """Answers requests from the instances of the test data."""
+
+    def __init__(self, data, recursion=2):
+        self.data = data
+        self.recursion = recursion
+        self.requests = []
+        self.connection = Mock()
+
+    def do(self, method, url):
+        self.requests.append(url)
+        path = url.split("?")[0].split("/")[2:]
+        if path == ["instances"]:
+            names = sorted(self.data["instances"])
+            if self.recursion and "recursion=" in url:
+                metadata = []
+                for name in names:
+                    instance = dict(self.data["instances"][name]["instances"]["metadata"])
+                    if self.recursion == 2:
+                        instance["state"] = self.data["instances"][name]["state"]["metadata"]
+                        instance["snapshots"] = None
+                    metadata.append(instance)
+            else:
+                metadata = [f"/1.0/instances/{name}" for name in names]
+            return {"type": "sync", "status": "Success", "metadata": metadata}
+        if path == ["networks"]:
+            return {"metadata": [f"/1.0/networks/{name}" for name in sorted(self.data["networks"])]}
+        if path[0] == "instances":
+            return self.data["instances"][path[1]]["state" if len(path) > 2 else "instances"]
+        return self.data["networks"][path[1]]["state"]
+
+
+@pytest.mark.parametrize("recursion, requests", [(2, 0), (1, 1), (0, 2)])
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_all_instance_data(inventory, recursion, requests, max_workers):
+    expected = inventory.data
+    socket = FakeLXDClient(expected, recursion=recursion)
+    connections = []
+
+    def connect_to_socket():
+        connections.append(socket)
+        return socket
+
+    inventory.project = "default"
+    inventory.max_workers = max_workers
+    inventory._connect_to_socket = connect_to_socket
+
+    inventory._fetch_data()
+
+    for name, instance in expected["instances"].items():
+        assert inventory.data["instances"][name]["instances"]["metadata"] == instance["instances"]["metadata"]
+        assert inventory.data["instances"][name]["state"]["metadata"] == instance["state"]["metadata"]
+    assert inventory.data["networks"] == expected["networks"]
+    instance_requests = [url for url in socket.requests if url.startswith("/1.0/instances")]
+    assert len(instance_requests) == 1 + requests * len(expected["instances"])
+    # one connection for the main thread, at most one per worker thread, all closed once fetched
+    assert 1 <= len(connections) <= 1 + (max_workers if max_workers > 1 else 0)
+    assert socket.connection.close.call_count == len(connections) - 1
+    assert inventory._executor is None
+
+
+def test_parse_from_cache(inventory, mocker):
+    cached = inventory.data
+    inventory._cache = {"lxd_cache": cached}
+    mocker.patch.object(inventory, "_read_config_data")
+    mocker.patch.object(inventory, "get_option", side_effect=lambda option: {"state": "RUNNING"}.get(option, True))
+    mocker.patch.object(inventory, "get_cache_key", return_value="lxd_cache")
+    fetch_data = mocker.patch.object(inventory, "_fetch_data")
+    populate = mocker.patch.object(inventory, "_populate")
+
+    inventory.parse(inventory.inventory, None, "lxd.yml", cache=True)
+
+    fetch_data.assert_not_called()
+    populate.assert_called_once_with()
+    assert inventory.data == cached
+    assert inventory.data is not cached
@@ -0,0 +1,61 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import io
+import json
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+
+from ansible_collections.community.general.plugins.inventory.online import InventoryModule
+
+SERVER = {
+    "id": 1234,
+    "offer": "Start-2-S-SATA",
+    "hostname": "server1",
+    "location": {"datacenter": "DC3"},
+    "boot_mode": "normal",
+    "power": "ON",
+    "last_reboot": "2018-01-01T00:00:00.000Z",
+    "anti_ddos": False,
+    "hardware_watch": True,
+    "support": "Basic service level",
+    "network": {"ip": ["198.51.100.1"], "private": []},
+    "os": {"name": "debian", "version": "12"},
+}
+
+API_RESPONSES = {
+    "https://api.online.net/api/v1/server": ["/api/v1/server/1234"],
+    "https://api.online.net/api/v1/server/1234": SERVER,
+    "https://api.online.net/api/v1/rpn/group": [{"name": "rpn1", "members": [{"id": 1234}]}],
+}
+
+
+def open_url(url, headers=None):
+    return io.BytesIO(json.dumps(API_RESPONSES[url]).encode("utf-8"))
+
+
+def test_parse_from_cache(mocker, jsonfile_cache):
+    options = {"oauth_token": "token", "hostnames": ["public_ipv4"], "groups": ["location", "rpn"], "cache": True}
+    api = mocker.patch("ansible_collections.community.general.plugins.inventory.online.open_url", side_effect=open_url)
+
+    for dummy in range(2):
+        plugin = InventoryModule()
+        mocker.patch.object(plugin, "_read_config_data")
+        mocker.patch.object(plugin, "get_option", side_effect=options.get)
+        mocker.patch.object(plugin, "get_cache_key", return_value="online_cache")
+        plugin._cache = jsonfile_cache()
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), "online.yml", cache=True)
+        # done by the inventory manager after parsing, writes the cache through the jsonfile plugin
+        plugin.update_cache_if_changed()
+
+        host = inventory.get_host("198.51.100.1")
+        assert host.vars["hostname"] == "server1"
+        assert inventory.groups["DC3"].hosts == [host]
+        assert inventory.groups["rpn1"].hosts == [host]
+
+    assert api.call_count == 3
@@ -576,3 +576,32 @@ def test_populate_filters(inventory, mocker):
 
     # check ansible_hosts
     assert host_sam.get_vars()["ansible_host"] == "172.22.4.187"
+
+
+def test_parse_from_cache(mocker, jsonfile_cache):
+    opts = options_base_test.copy()
+    opts["cache"] = True
+    vm_pool = mocker.patch.object(InventoryModule, "_get_vm_pool", side_effect=get_vm_pool)
+    mocker.patch("ansible_collections.community.general.plugins.inventory.opennebula.HAS_PYONE", True)
+
+    for dummy in range(2):
+        plugin = InventoryModule()
+        if not hasattr(plugin, "templar"):
+            # This is necessary for ansible-core 2.18; 2.19+ provide this out-of-the-box
+            plugin.templar = Templar(loader=DataLoader())
+        mocker.patch.object(plugin, "_read_config_data")
+        mocker.patch.object(plugin, "get_option", side_effect=mk_get_options(opts))
+        mocker.patch.object(plugin, "get_cache_key", return_value="opennebula_cache")
+        plugin._cache = jsonfile_cache()
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), "opennebula.yml", cache=True)
+        # done by the inventory manager after parsing, writes the cache through the jsonfile plugin
+        plugin.update_cache_if_changed()
+
+        host_gitlab = inventory.get_host("gitlab-107")
+        assert inventory.groups["Gitlab"].hosts == [host_gitlab]
+        assert host_gitlab.get_vars()["ansible_host"] == "185.165.1.3"
+        assert host_gitlab.get_vars()["ansible_port"] == 8822
+        assert host_gitlab.get_vars()["LABELS"] == ["Gitlab", "Centos"]
+
+    vm_pool.assert_called_once()
@@ -0,0 +1,121 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import io
+import json
+import urllib.parse as urllib_parse
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ansible.inventory.data import InventoryData
+
+from ansible_collections.community.general.plugins.inventory import scaleway
+from ansible_collections.community.general.plugins.inventory.scaleway import InventoryModule
+
+PER_PAGE = 2
+
+
+def make_server(zone, index):
+    return {
+        "id": f"{zone}-{index}",
+        "hostname": f"{zone}-host{index}",
+        "arch": "x86_64",
+        "commercial_type": "DEV1-S",
+        "organization": "org",
+        "state": "running",
+        "tags": ["web"],
+        "public_ip": {"address": f"10.0.0.{index}"},
+        "private_ip": None,
+        "ipv6": None,
+        "location": {"zone_id": zone},
+    }
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, body, link):
+        super().__init__(json.dumps(body).encode())
+        self.headers = {"Link": link}
+
+
+class FakeAPI:
+    """Paginated /servers endpoints, with the last relation if last_link is set."""
+
+    def __init__(self, servers, last_link=True):
+        self.servers = servers
+        self.last_link = last_link
+        self.requests = []
+
+    def open_url(self, url, headers=None):
+        self.requests.append(url)
+        parts = urllib_parse.urlsplit(url)
+        zone = parts.path.split("/")[-2]
+        page = int(urllib_parse.parse_qs(parts.query).get("page", ["1"])[0])
+        servers = self.servers[zone]
+        last_page = max(1, -(-len(servers) // PER_PAGE))
+        relations = []
+        if page < last_page:
+            relations.append(f'</servers?page={page + 1}&per_page={PER_PAGE}>; rel="next"')
+        if self.last_link and last_page > 1:
+            relations.append(f'</servers?page={last_page}&per_page={PER_PAGE}>; rel="last"')
+        page_servers = servers[(page - 1) * PER_PAGE : page * PER_PAGE]
+        return FakeResponse({"servers": page_servers}, ",".join(relations))
+
+
+@pytest.fixture
+def inventory():
+    plugin = InventoryModule()
+    plugin.inventory = InventoryData()
+    return plugin
+
+
+@pytest.mark.parametrize("last_link", [True, False])
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_fetch_information(mocker, last_link, concurrent):
+    servers = {"fr-par-1": [make_server("par1", i) for i in range(7)]}
+    api = FakeAPI(servers, last_link=last_link)
+    mocker.patch.object(scaleway, "open_url", side_effect=api.open_url)
+
+    url = "https://api.scaleway.com/instance/v1/zones/fr-par-1/servers"
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = scaleway._fetch_information("token", url, map_func=executor.map)
+    else:
+        result = scaleway._fetch_information("token", url)
+
+    assert result == servers["fr-par-1"]
+    assert len(api.requests) == 4
+
+
+def test_parse_uses_cache(inventory, mocker):
+    options = {
+        "regions": ["par1", "ams1"],
+        "tags": None,
+        "hostnames": ["hostname"],
+        "variables": {},
+        "cache": True,
+        "max_workers": 4,
+    }
+    mocker.patch.object(inventory, "_read_config_data")
+    mocker.patch.object(inventory, "get_option", side_effect=options.get)
+    mocker.patch.object(inventory, "get_cache_key", return_value="scaleway_cache")
+    mocker.patch.object(inventory, "get_oauth_token", return_value="token")
+    api = FakeAPI({"fr-par-1": [make_server("par1", i) for i in range(3)], "nl-ams-1": [make_server("ams1", 0)]})
+    open_url = mocker.patch.object(scaleway, "open_url", side_effect=api.open_url)
+    inventory._cache = {}
+
+    inventory.parse(inventory.inventory, None, "scaleway.yml", cache=True)
+
+    assert open_url.call_count == 3
+    assert sorted(inventory._cache["scaleway_cache"]) == ["ams1", "par1"]
+    hosts = sorted(inventory.inventory.hosts)
+    assert hosts == ["ams1-host0", "par1-host0", "par1-host1", "par1-host2"]
+
+    inventory.inventory = InventoryData()
+    inventory.parse(inventory.inventory, None, "scaleway.yml", cache=True)
+
+    assert open_url.call_count == 3
+    assert sorted(inventory.inventory.hosts) == hosts
+    assert inventory.inventory.get_host("par1-host1").vars["public_ipv4"] == "10.0.0.1"
@@ -0,0 +1,55 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.community.general.plugins.inventory import virtualbox
+from ansible_collections.community.general.plugins.inventory.virtualbox import InventoryModule
+
+ENUMERATE_OUTPUT = {
+    "7.0": """\
+/VirtualBox/GuestInfo/Net/0/V4/IP = '10.0.2.15' @ 2024-01-01T10:00:00.000000000Z
+/VirtualBox/GuestInfo/OS/LoggedInUsersList = 'alice, bob' @ 2024-01-01T10:00:00.000000000Z
+/VirtualBox/GuestInfo/OS/Product = 'Linux' @ 2024-01-01T10:00:00.000000000Z
+""",
+    "6.1": """\
+Name: /VirtualBox/GuestInfo/Net/0/V4/IP, value: 10.0.2.15, timestamp: 1704103200000000000, flags:
+Name: /VirtualBox/GuestInfo/OS/LoggedInUsersList, value: alice, bob, timestamp: 1704103200000000000, flags:
+Name: /VirtualBox/GuestInfo/OS/Product, value: Linux, timestamp: 1704103200000000000, flags: TRANSIENT
+""",
+}
+
+
+@pytest.fixture
+def inventory():
+    plugin = InventoryModule()
+    plugin._vbox_path = b"/usr/bin/VBoxManage"
+    return plugin
+
+
+@pytest.mark.parametrize("version", sorted(ENUMERATE_OUTPUT))
+def test_parse_guest_properties(version):
+    assert InventoryModule._parse_guest_properties(ENUMERATE_OUTPUT[version]) == {
+        "/VirtualBox/GuestInfo/Net/0/V4/IP": "10.0.2.15",
+        "/VirtualBox/GuestInfo/OS/LoggedInUsersList": "alice, bob",
+        "/VirtualBox/GuestInfo/OS/Product": "Linux",
+    }
+
+
+def test_query_vbox_data(inventory, mocker):
+    process = MagicMock(stdout=BytesIO(ENUMERATE_OUTPUT["7.0"].encode()))
+    popen = mocker.patch.object(virtualbox, "Popen", return_value=process)
+
+    assert inventory._query_vbox_data("vm1", "/VirtualBox/GuestInfo/Net/0/V4/IP") == "10.0.2.15"
+    assert inventory._query_vbox_data("vm1", "/VirtualBox/GuestInfo/OS/Product") == "Linux"
+    assert inventory._query_vbox_data("vm1", "/VirtualBox/GuestInfo/OS/Release") is None
+
+    # all properties of the VM were read with a single command
+    popen.assert_called_once()
+    assert popen.call_args[0][0] == [b"/usr/bin/VBoxManage", b"guestproperty", b"enumerate", b"vm1"]
@@ -205,3 +205,21 @@ def test_populate(inventory, mocker):
     # Check that hosts are in their corresponding pool
     assert host_without_ip in storage_lab.hosts
     assert host_with_ip in storage_lab.hosts
+
+
+def test_populate_duplicate_name_labels(mocker):
+    inventory = InventoryModule()
+    inventory.inventory = InventoryData()
+    inventory.host_entry_name_type = "name_label"
+    inventory.vm_entry_name_type = "name_label"
+    inventory.get_option = mocker.MagicMock(side_effect=get_option)
+    vm = objects["vms"]["0e64588-2bea-2d82-e922-881654b0a48f"]
+    vms = {f"vm-{i}": dict(vm, name_label="web" if i % 2 else "db") for i in range(5)}
+
+    inventory._populate(dict(objects, vms=vms))
+
+    assert sorted(inventory.inventory.hosts) == ["R620-S1", "R620-S2", "db", "db_1", "db_2", "web", "web_1"]
+    assert inventory.inventory.get_host("web_1").vars["uuid"] == "vm-3"
+    storage_lab = inventory.inventory.groups["xo_pool_storage_lab"]
+    assert all(inventory.inventory.get_host(name) in storage_lab.hosts for name in ("db_2", "web_1"))
+    assert inventory.inventory.get_host("db_2") in inventory.inventory.groups["xo_host_r620_s2"].hosts
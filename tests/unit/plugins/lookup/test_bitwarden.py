@@ -189,6 +189,16 @@ class LoggedOutMockBitwarden(MockBitwarden):
     unlocked = False
 
 
+class CountingMockBitwarden(MockBitwarden):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def _run(self, args, stdin=None, expected_rc=0):
+        self.calls.append(args[:2])
+        return super()._run(args, stdin, expected_rc)
+
+
 class TestLookupModule(unittest.TestCase):
     def setUp(self):
         self.lookup = lookup_loader.get("community.general.bitwarden")
@@ -298,3 +308,25 @@ class TestLookupModule(unittest.TestCase):
         with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
             self.lookup.run([], sync=True)
             self.assertTrue(mock_bitwarden.synced)
+
+    def test_bitwarden_plugin_cache(self):
+        mock_bitwarden = CountingMockBitwarden()
+        with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+            terms = ["a_test", "dupe_name", "not_here"]
+            expected = self.lookup.run(terms, field="password")
+            mock_bitwarden.calls = []
+
+            self.assertEqual(expected, self.lookup.run(terms, field="password", cache=True))
+            self.assertEqual([MOCK_RECORDS[0]], self.lookup.run(["a_test"], cache=True)[0])
+            self.assertEqual(
+                [MOCK_RECORDS[1]["login"]["password"]],
+                self.lookup.run([MOCK_RECORDS[1]["id"]], search="id", field="password", cache=True)[0],
+            )
+            self.assertEqual(
+                [MOCK_RECORDS[0], MOCK_RECORDS[2]],
+                self.lookup.run(None, collection_name="MOCK_COLLECTION", cache=True)[0],
+            )
+            self.assertEqual([["list", "items"], ["list", "collections"], ["list", "items"]], mock_bitwarden.calls)
+
+            self.lookup.run(["a_test"], sync=True, cache=True)
+            self.assertEqual(["list", "items"], mock_bitwarden.calls[-1])
@@ -697,3 +697,23 @@ class TestMergeVariablesLookup(unittest.TestCase):
                 }
             ],
         )
+
+    @patch.object(AnsiblePlugin, "set_options")
+    @patch.object(
+        AnsiblePlugin,
+        "get_option",
+        side_effect=[None, "ignore", "regex", ["dummy1"], "deep", "append", "replace", "replace", []],
+    )
+    @patch.object(Templar, "template", side_effect=[["h1x"], ["h2x"], ["h1y"], ["h2y"]])
+    def test_merge_list_group_regex_multiple_terms(self, mock_set_options, mock_get_option, mock_template):
+        hostvars = self.HostVarsMock(
+            {
+                "host1": {"group_names": ["dummy1"], "list__x": ["h1x"], "list__y": ["h1y"], "list__z": ["h1z"]},
+                "host2": {"group_names": ["dummy1"], "list__x": ["h2x"], "list__y": ["h2y"], "list__z": ["h2z"]},
+                "host3": {"group_names": ["dummy2"], "list__x": ["h3x"], "list__y": ["h3y"], "list__z": ["h3z"]},
+            }
+        )
+        variables = {"inventory_hostname": "host1", "hostvars": hostvars}
+        results = self.merge_vars_lookup.run(["__x$", "__y$"], variables)
+
+        self.assertEqual(results, [["h1x", "h2x"], ["h1y", "h2y"]])
@@ -236,6 +236,29 @@ def test_op_lookup(mocker, cli_class, vault, queries, kwargs, output, expected):
     assert result == expected
 
 
+def test_op_lookup_cache(mocker):
+    mocker.patch("ansible_collections.community.general.plugins.lookup.onepassword._CACHE", {})
+    mocker.patch(
+        "ansible_collections.community.general.plugins.lookup.onepassword.OnePass._get_cli_class",
+        lambda self, cli_class: OnePassCLIv2(),
+    )
+    mocker.patch(
+        "ansible_collections.community.general.plugins.lookup.onepassword.OnePass.assert_logged_in", return_value=True
+    )
+    output = MOCK_ENTRIES[OnePassCLIv2][0]["output"]
+    run = mocker.patch(
+        "ansible_collections.community.general.plugins.lookup.onepassword.OnePassCLIBase._run",
+        return_value=(0, json.dumps(output), ""),
+    )
+
+    op_lookup = lookup_loader.get("community.general.onepassword")
+    op_lookup.run(["item1", "item2", "item1"], field="password", cache=True, max_workers=4)
+    op_lookup.run(["item2"], field="username", cache=True)
+
+    # each item was only fetched once
+    assert sorted(call.args[0][2] for call in run.call_args_list) == ["item1", "item2"]
+
+
 @pytest.mark.parametrize("op_fixture", OP_VERSION_FIXTURES)
 def test_signin(op_fixture, request):
     op = request.getfixturevalue(op_fixture)
@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+import json
 import unittest
+from io import StringIO
+from unittest.mock import MagicMock, patch
 
-from ansible_collections.community.general.plugins.module_utils._keycloak import is_struct_included
+from ansible_collections.community.general.plugins.module_utils._keycloak import KeycloakAPI, is_struct_included
 
 
 class KeycloakIsStructIncludedTestCase(unittest.TestCase):
@@ -70,3 +73,48 @@ class KeycloakIsStructIncludedTestCase(unittest.TestCase):
     def test_not_equals_dict7_dict8_compare_dict7_with_list_bigger_than_dict8_but_reverse_equals(self):
         self.assertFalse(is_struct_included(self.dict7, self.dict8))
         self.assertTrue(is_struct_included(self.dict8, self.dict7))
+
+
+class KeycloakNameIndexTestCase(unittest.TestCase):
+    clientscopes_url = "http://keycloak.url/auth/admin/realms/master/client-scopes"
+    mappers_url = f"{clientscopes_url}/scope-1/protocol-mappers/models"
+
+    def setUp(self):
+        module = MagicMock(params={"auth_keycloak_url": "http://keycloak.url/auth"})
+        self.kc = KeycloakAPI(module, {"Authorization": "Bearer token"})
+        self.responses = {
+            ("GET", self.clientscopes_url): [{"id": "scope-1", "name": "profile"}],
+            ("GET", f"{self.clientscopes_url}/scope-1"): {"id": "scope-1", "name": "profile"},
+            ("GET", self.mappers_url): [{"id": "mapper-1", "name": "email"}, {"id": "mapper-2", "name": "family name"}],
+            ("GET", f"{self.mappers_url}/mapper-1"): {"id": "mapper-1", "name": "email"},
+            ("GET", f"{self.mappers_url}/mapper-2"): {"id": "mapper-2", "name": "family name"},
+            ("POST", self.mappers_url): None,
+        }
+        patcher = patch(
+            "ansible_collections.community.general.plugins.module_utils._keycloak.open_url",
+            side_effect=lambda url, method, **kwargs: StringIO(json.dumps(self.responses[method, url])),
+        )
+        self.open_url = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookups_by_name_list_once(self):
+        for dummy in range(3):
+            self.assertEqual(self.kc.get_clientscope_by_name("profile")["id"], "scope-1")
+            self.assertEqual(self.kc.get_clientscope_protocolmapper_by_name("scope-1", "email")["id"], "mapper-1")
+            self.assertEqual(self.kc.get_clientscope_protocolmapper_by_name("scope-1", "family name")["id"], "mapper-2")
+        self.assertIsNone(self.kc.get_clientscope_by_name("missing"))
+
+        listed_urls = [call.args[0] for call in self.open_url.call_args_list]
+        self.assertEqual(listed_urls.count(self.clientscopes_url), 1)
+        self.assertEqual(listed_urls.count(self.mappers_url), 1)
+        self.assertEqual(self.kc.request_counts["GET"], 11)
+        self.assertEqual(self.kc.name_index_counts, {"misses": 2, "hits": 8})
+
+    def test_changes_invalidate_index(self):
+        self.kc.get_clientscope_protocolmapper_by_name("scope-1", "email")
+        self.kc.create_clientscope_protocolmapper("scope-1", {"name": "nickname"})
+        self.responses["GET", self.mappers_url].append({"id": "mapper-3", "name": "nickname"})
+        self.responses["GET", f"{self.mappers_url}/mapper-3"] = {"id": "mapper-3", "name": "nickname"}
+
+        self.assertEqual(self.kc.get_clientscope_protocolmapper_by_name("scope-1", "nickname")["id"], "mapper-3")
+        self.assertEqual(self.kc.request_counts, {"GET": 4, "POST": 1})
@@ -4,13 +4,16 @@
 
 from __future__ import annotations
 
+import json
 from io import StringIO
 from itertools import count
+from unittest.mock import MagicMock
 from urllib.error import HTTPError
 
 import pytest
 
 from ansible_collections.community.general.plugins.module_utils._keycloak import (
+    KeycloakAPI,
     KeycloakError,
     get_token,
 )
@@ -167,3 +170,87 @@ def test_json_without_token_returned(mock_json_without_token_returned):
         "API did not include access_token field in response from "
         "http://keycloak.url/auth/realms/master/protocol/openid-connect/token"
     )
+
+
+@pytest.fixture()
+def mock_token_grants(mocker):
+    responses = iter(
+        [
+            '{"access_token": "token1", "expires_in": 60, "refresh_token": "refresh1", "refresh_expires_in": 1800}',
+            '{"access_token": "token2", "expires_in": 60, "refresh_token": "refresh2", "refresh_expires_in": 1800}',
+            '{"access_token": "token3", "expires_in": 60}',
+        ]
+    )
+    return mocker.patch(
+        "ansible_collections.community.general.plugins.module_utils._keycloak.open_url",
+        side_effect=lambda *args, **kwargs: StringIO(next(responses)),
+        autospec=True,
+    )
+
+
+def test_token_cache(mock_token_grants, mocker, tmp_path):
+    module_params = dict(module_params_creds, token_cache_path=str(tmp_path / "tokens.json"))
+    time = mocker.patch("ansible_collections.community.general.plugins.module_utils._keycloak.time.time")
+
+    time.return_value = 1000
+    assert get_token(module_params)["Authorization"] == "Bearer token1"
+    assert get_token(module_params)["Authorization"] == "Bearer token1"
+    assert (tmp_path / "tokens.json").stat().st_mode & 0o777 == 0o600
+    assert mock_token_grants.call_count == 1
+    assert "grant_type=password" in mock_token_grants.call_args.kwargs["data"]
+
+    # the expired access token is renewed with the refresh token
+    time.return_value = 1100
+    assert get_token(module_params)["Authorization"] == "Bearer token2"
+    assert mock_token_grants.call_count == 2
+    assert mock_token_grants.call_args.kwargs["data"] == "grant_type=refresh_token&refresh_token=refresh1"
+
+    # other credentials are not given the cached token
+    assert get_token(dict(module_params, auth_password="other"))["Authorization"] == "Bearer token3"
+
+
+def test_token_cache_prunes_tokens_without_refresh_token(mocker, tmp_path):
+    module_params = dict(module_params_creds, token_cache_path=str(tmp_path / "tokens.json"))
+    mocker.patch(
+        "ansible_collections.community.general.plugins.module_utils._keycloak.open_url",
+        side_effect=lambda *args, **kwargs: StringIO(
+            '{"access_token": "token", "expires_in": 60, "refresh_expires_in": 0}'
+        ),
+        autospec=True,
+    )
+    time = mocker.patch("ansible_collections.community.general.plugins.module_utils._keycloak.time.time")
+
+    time.return_value = 1000
+    get_token(module_params)
+    # once its access token expired, the entry is dropped when other credentials are cached
+    time.return_value = 2000
+    get_token(dict(module_params, auth_password="other"))
+
+    assert len(json.loads((tmp_path / "tokens.json").read_text())) == 1
+
+
+def test_token_cache_stores_token_obtained_after_401(mocker, tmp_path):
+    module_params = dict(module_params_creds, token_cache_path=str(tmp_path / "tokens.json"))
+    token_url = "http://keycloak.url/auth/realms/master/protocol/openid-connect/token"
+    realm_url = "http://keycloak.url/auth/admin/realms/master"
+    tokens = iter(["token1", "token2"])
+
+    def open_url(url, method=None, data=None, headers=None, **kwargs):
+        if url == token_url:
+            return StringIO(json.dumps({"access_token": next(tokens), "expires_in": 60}))
+        if headers["Authorization"] == "Bearer token1":
+            # the cached token was revoked
+            raise HTTPError(url=url, code=401, msg="Unauthorized", hdrs="", fp=StringIO(""))
+        return StringIO("{}")
+
+    mock_open_url = mocker.patch(
+        "ansible_collections.community.general.plugins.module_utils._keycloak.open_url", side_effect=open_url
+    )
+
+    kc = KeycloakAPI(MagicMock(params=module_params), get_token(module_params))
+    kc._request(realm_url, "GET")
+    assert kc.restheaders["Authorization"] == "Bearer token2"
+
+    # the next module run uses the new token without a grant
+    assert get_token(module_params)["Authorization"] == "Bearer token2"
+    assert [call.args[0] for call in mock_open_url.call_args_list] == [token_url, realm_url, token_url, realm_url]
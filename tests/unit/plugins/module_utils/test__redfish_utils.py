@@ -0,0 +1,153 @@
+# Copyright (c) Ansible project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+from urllib.error import HTTPError
+
+import pytest
+
+from ansible_collections.community.general.plugins.module_utils import _redfish_utils
+from ansible_collections.community.general.plugins.module_utils._redfish_utils import RedfishUtils
+
+ROOT_URI = "https://bmc.example.com"
+
+
+class FakeService:
+    """Answers GET requests with the resources of a dict, and records the requests and their peak concurrency"""
+
+    def __init__(self, resources, etags=None):
+        self.resources = resources
+        self.etags = etags or {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def open_url(self, uri, **kwargs):
+        path = uri[len(ROOT_URI) :]
+        with self.lock:
+            self.requests.append((kwargs["method"], path))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        etag = self.etags.get(path)
+        if etag is not None and kwargs["headers"].get("If-None-Match") == etag:
+            raise HTTPError(uri, 304, "Not Modified", {}, None)
+        resp = MagicMock()
+        resp.read.return_value = json.dumps(self.resources.get(path))
+        resp.info.return_value = {"ETag": etag} if etag else {}
+        return resp
+
+
+def make_utils(max_concurrent_requests):
+    module = MagicMock(params={"max_concurrent_requests": max_concurrent_requests})
+    return RedfishUtils({"user": "root", "pswd": "secret"}, ROOT_URI, 10, module)
+
+
+@pytest.mark.parametrize(("max_concurrent_requests", "expected_peak"), [(1, 1), (3, 3), (None, 1)])
+def test_get_requests(mocker, max_concurrent_requests, expected_peak):
+    service = FakeService({f"/redfish/v1/Drives/{i}": {"Id": str(i)} for i in range(8)})
+    mocker.patch.object(_redfish_utils, "open_url", side_effect=service.open_url)
+    utils = make_utils(max_concurrent_requests)
+
+    responses = utils.get_requests(f"{ROOT_URI}/redfish/v1/Drives/{i}" for i in range(8))
+
+    assert [response["data"]["Id"] for response in responses] == [str(i) for i in range(8)]
+    assert service.max_in_flight == expected_peak
+
+
+def test_aggregate_limits_nested_requests(mocker):
+    resources = {}
+    for system in range(4):
+        cpus = [{"@odata.id": f"/redfish/v1/Systems/{system}/CPUs/{i}"} for i in range(6)]
+        resources[f"/redfish/v1/Systems/{system}"] = {"Processors": {"@odata.id": f"/redfish/v1/Systems/{system}/CPUs"}}
+        resources[f"/redfish/v1/Systems/{system}/CPUs"] = {"Members": cpus}
+        for i in range(6):
+            resources[f"/redfish/v1/Systems/{system}/CPUs/{i}"] = {"Id": f"{system}-{i}"}
+    service = FakeService(resources)
+    mocker.patch.object(_redfish_utils, "open_url", side_effect=service.open_url)
+    utils = make_utils(4)
+    utils.systems_uris = [f"/redfish/v1/Systems/{system}" for system in range(4)]
+
+    result = utils.get_multi_cpu_inventory()
+
+    assert result["ret"] is True
+    assert [[cpu["Id"] for cpu in entries] for dummy, entries in result["entries"]] == [
+        [f"{system}-{i}" for i in range(6)] for system in range(4)
+    ]
+    assert service.max_in_flight == 4
+
+
+def test_get_request_revalidates_with_etag(mocker):
+    service = FakeService(
+        {"/redfish/v1/Systems": {"Members": []}, "/redfish/v1/Chassis": {"Members": []}},
+        etags={"/redfish/v1/Systems": '"1"'},
+    )
+    mocker.patch.object(_redfish_utils, "open_url", side_effect=service.open_url)
+    utils = make_utils(1)
+
+    for dummy in range(2):
+        assert utils.get_request(f"{ROOT_URI}/redfish/v1/Systems")["data"] == {"Members": []}
+        assert utils.get_request(f"{ROOT_URI}/redfish/v1/Chassis")["data"] == {"Members": []}
+    # modifications may change any resource, so the next GET is not conditional anymore
+    utils.patch_request(f"{ROOT_URI}/redfish/v1/Chassis", {})
+    service.etags["/redfish/v1/Systems"] = '"2"'
+    service.resources["/redfish/v1/Systems"] = {"Members": [{"@odata.id": "/redfish/v1/Systems/1"}]}
+    assert utils.get_request(f"{ROOT_URI}/redfish/v1/Systems")["data"]["Members"]
+
+    assert service.requests == [
+        ("GET", "/redfish/v1/Systems"),
+        ("GET", "/redfish/v1/Chassis"),
+        # answered with 304 Not Modified
+        ("GET", "/redfish/v1/Systems"),
+        ("GET", "/redfish/v1/Chassis"),
+        ("GET", "/redfish/v1/Chassis"),
+        ("PATCH", "/redfish/v1/Chassis"),
+        ("GET", "/redfish/v1/Systems"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("features", "expected_requests"),
+    [
+        (
+            {"ExpandQuery": {"NoLinks": True, "Levels": True}},
+            ["/redfish/v1/", "/redfish/v1/Systems/1/Memory?$expand=.($levels=1)"],
+        ),
+        (
+            {"SelectQuery": True},
+            [
+                "/redfish/v1/",
+                "/redfish/v1/Systems/1/Memory",
+                "/redfish/v1/Systems/1/Memory/1?$select=Id,Status",
+                "/redfish/v1/Systems/1/Memory/2?$select=Id,Status",
+            ],
+        ),
+    ],
+)
+def test_get_collection_members(mocker, features, expected_requests):
+    dimms = [{"@odata.id": f"/redfish/v1/Systems/1/Memory/{i}", "Id": str(i), "Status": {}} for i in (1, 2)]
+    service = FakeService(
+        {
+            "/redfish/v1/": {"ProtocolFeaturesSupported": features},
+            "/redfish/v1/Systems/1/Memory?$expand=.($levels=1)": {"Members": dimms},
+            "/redfish/v1/Systems/1/Memory": {"Members": [{"@odata.id": dimm["@odata.id"]} for dimm in dimms]},
+            "/redfish/v1/Systems/1/Memory/1?$select=Id,Status": dimms[0],
+            "/redfish/v1/Systems/1/Memory/2?$select=Id,Status": dimms[1],
+        }
+    )
+    mocker.patch.object(_redfish_utils, "open_url", side_effect=service.open_url)
+    utils = make_utils(1)
+
+    result = utils.get_collection_members("/redfish/v1/Systems/1/Memory", select=["Id", "Status"])
+
+    assert [member["data"] for member in result["members"]] == dimms
+    assert [path for dummy, path in service.requests] == expected_requests
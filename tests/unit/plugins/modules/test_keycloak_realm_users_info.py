@@ -0,0 +1,95 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson,
+    ModuleTestCase,
+    set_module_args,
+)
+
+from ansible_collections.community.general.plugins.modules import keycloak_realm_users_info
+
+TOKEN_URL = "http://keycloak.url/auth/realms/master/protocol/openid-connect/token"
+USERS_URL = "http://keycloak.url/auth/admin/realms/my-realm/users"
+
+
+def mock_connection(responses):
+    """Answer the token request, and the users requests from the responses dict keyed by URL"""
+
+    def _mocked_requests(url, **kwargs):
+        if url == TOKEN_URL:
+            return StringIO('{"access_token": "alongtoken"}')
+        return StringIO(json.dumps(responses[url]))
+
+    return patch(
+        "ansible_collections.community.general.plugins.module_utils._keycloak.open_url",
+        side_effect=_mocked_requests,
+    )
+
+
+def make_users(first, count):
+    return [
+        {"id": f"id-{i}", "username": f"user{i}", "email": f"user{i}@example.com"} for i in range(first, first + count)
+    ]
+
+
+class TestKeycloakRealmUsersInfo(ModuleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.module = keycloak_realm_users_info
+
+    def test_get_users_paginated(self):
+        """Get all users, page by page"""
+
+        module_args = {
+            "auth_keycloak_url": "http://keycloak.url/auth",
+            "token": "alongtoken",
+            "realm": "my-realm",
+            "page_size": 2,
+        }
+        responses = {
+            f"{USERS_URL}?first=0&max=2": make_users(0, 2),
+            f"{USERS_URL}?first=2&max=2": make_users(2, 2),
+            f"{USERS_URL}?first=4&max=2": make_users(4, 1),
+        }
+
+        with set_module_args(module_args):
+            with mock_connection(responses) as mock_open_url:
+                with self.assertRaises(AnsibleExitJson) as exec_info:
+                    self.module.main()
+
+        self.assertEqual(exec_info.exception.args[0]["users"], make_users(0, 5))
+        self.assertEqual(mock_open_url.call_count, 3)
+
+    def test_get_users_filtered(self):
+        """Get selected fields of the users matching server-side filters"""
+
+        module_args = {
+            "auth_keycloak_url": "http://keycloak.url/auth",
+            "token": "alongtoken",
+            "realm": "my-realm",
+            "search": "user",
+            "q": {"department": "sales"},
+            "brief_representation": True,
+            "fields": ["id", "username"],
+        }
+        responses = {
+            f"{USERS_URL}?search=user&q=department%3Asales&briefRepresentation=true&first=0&max=100": make_users(0, 2),
+        }
+
+        with set_module_args(module_args):
+            with mock_connection(responses):
+                with self.assertRaises(AnsibleExitJson) as exec_info:
+                    self.module.main()
+
+        self.assertEqual(
+            exec_info.exception.args[0]["users"],
+            [{"id": "id-0", "username": "user0"}, {"id": "id-1", "username": "user1"}],
+        )
@@ -0,0 +1,86 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from ansible_collections.community.general.plugins.plugin_utils._batch_sender import BatchSender
+
+
+def test_batches_and_final_flush():
+    batches = []
+    sender = BatchSender(batches.append, batch_size=3, flush_interval=60)
+    for index in range(7):
+        assert sender.put(str(index))
+    sender.close(timeout=10)
+
+    assert [event for batch in batches for event in batch] == [str(index) for index in range(7)]
+    assert all(len(batch) <= 3 for batch in batches)
+    assert sender.sent == 7
+    assert sender.dropped == 0
+
+
+def test_flush_interval():
+    batches = []
+    sender = BatchSender(batches.append, batch_size=100, flush_interval=0.05)
+    sender.put("event")
+    sender.flush(timeout=10)
+
+    assert batches == [["event"]]
+    sender.close(timeout=10)
+
+
+def test_retries():
+    send = Mock(side_effect=[OSError("boom"), OSError("boom"), None])
+    sender = BatchSender(send, batch_size=1, max_retries=2, retry_delay=0)
+    sender.put("event")
+    sender.close(timeout=10)
+
+    assert send.call_count == 3
+    assert sender.sent == 1
+    assert sender.failed == 0
+
+
+def test_give_up_after_retries():
+    display = Mock()
+    send = Mock(side_effect=OSError("boom"))
+    sender = BatchSender(send, batch_size=1, max_retries=1, retry_delay=0, display=display, name="test")
+    sender.put("event")
+    sender.close(timeout=10)
+
+    assert send.call_count == 2
+    assert sender.failed == 1
+    display.warning.assert_called_once_with("test: 1 event(s) could not be delivered: boom")
+
+
+def test_buffer_limit():
+    display = Mock()
+    sender = BatchSender(Mock(), batch_size=100, flush_interval=60, max_buffer_size=10, display=display, name="test")
+    assert sender.put("12345")
+    assert sender.put("67890")
+    assert not sender.put("x")
+    sender.close(timeout=10)
+
+    assert sender.sent == 2
+    assert sender.dropped == 1
+    display.warning.assert_called_once_with("test: 1 event(s) were dropped because the buffer was full.")
+
+
+def test_explicit_size():
+    batches = []
+    sender = BatchSender(batches.append, batch_size=100, flush_interval=60, max_buffer_size=10)
+    assert sender.put(("host1", "12345"), size=5)
+    assert not sender.put(("host2", "1234567"), size=7)
+    sender.close(timeout=10)
+
+    assert batches == [[("host1", "12345")]]
+
+
+def test_close_at_exit():
+    sender = BatchSender(Mock())
+    with patch("ansible_collections.community.general.plugins.plugin_utils._batch_sender.atexit") as mock_atexit:
+        sender.close_at_exit(timeout=10)
+    mock_atexit.register.assert_called_once_with(sender.close, 10)
+    sender.close(timeout=10)
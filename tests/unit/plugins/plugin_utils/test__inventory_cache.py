@@ -0,0 +1,65 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from ansible_collections.community.general.plugins.plugin_utils._inventory_cache import InventoryCache
+
+
+def make_plugin(enabled, cached=None):
+    plugin = Mock()
+    plugin.get_cache_key.return_value = "key"
+    plugin.get_option.side_effect = {"cache": enabled}.get
+    plugin._cache = {} if cached is None else {"key": cached}
+    return plugin
+
+
+@pytest.mark.parametrize(
+    "enabled, cached, cache, fetched, stored",
+    [
+        # cache disabled
+        (False, None, True, True, None),
+        (False, ["old"], True, True, ["old"]),
+        # cache enabled, used
+        (True, ["old"], True, False, ["old"]),
+        (True, [], True, False, []),
+        # cache enabled, empty or expired
+        (True, None, True, True, ["new"]),
+        # cache enabled, inventory being refreshed
+        (True, ["old"], False, True, ["new"]),
+    ],
+)
+def test_get(enabled, cached, cache, fetched, stored):
+    plugin = make_plugin(enabled, cached)
+    fetch = Mock(return_value=["new"])
+
+    data = InventoryCache(plugin, "path", cache).get(fetch)
+
+    assert fetch.called is fetched
+    assert data == (["new"] if fetched else cached)
+    assert plugin._cache.get("key") == stored
+
+
+def test_get_invalid():
+    plugin = make_plugin(True, {"zones": ["a"]})
+    inventory_cache = InventoryCache(plugin, "path")
+
+    data = inventory_cache.get(lambda: {"zones": ["a", "b"]}, validate=lambda cached: len(cached["zones"]) == 2)
+
+    assert data == {"zones": ["a", "b"]}
+    assert plugin._cache["key"] == data
+
+
+def test_read_write():
+    plugin = make_plugin(True)
+    inventory_cache = InventoryCache(plugin, "path")
+
+    assert inventory_cache.read() is None
+    assert inventory_cache.needs_update
+    inventory_cache.write({"hosts": []})
+    assert plugin._cache["key"] == {"hosts": []}